@@ -12,6 +12,104 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+# Submodules and their dependencies, lxml and ament_index_python in particular, are only imported
+# once one of the names below is first accessed, keeping `import nodl` cheap for command line
+# tools that may not need them, e.g. to print their help or complete arguments.
 
-from ._index import get_node_by_executable  # noqa: F401
-from ._parsing import parse  # noqa: F401
+from importlib import import_module
+from typing import Any, List, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ._check import (  # noqa: F401
+        check_snapshot,
+        CheckResult,
+        Discrepancy,
+        load_graph_snapshot,
+    )
+    from ._diff import diff_nodes, InterfaceChange, load_nodes, NodeChange  # noqa: F401
+    from ._digest import (  # noqa: F401
+        digest_nodes,
+        dump_manifest,
+        file_digest,
+        load_manifest,
+        package_manifest,
+    )
+    from ._graph import ComputationGraph, GraphEdge, GraphVertex  # noqa: F401
+    from ._index import get_node_by_executable, package_cache, WorkspaceIndex  # noqa: F401
+    from ._names import resolve_name, resolve_node, resolve_nodes, split_node_name  # noqa: F401
+    from ._parsing import iterparse, parse  # noqa: F401
+    from ._query import InterfaceIndex, InterfaceMatch  # noqa: F401
+    from ._remap import remap_all, remap_node  # noqa: F401
+    from ._serialization import dumps, loads  # noqa: F401
+    from ._table import InterfaceTable, NodeTable  # noqa: F401
+
+_LAZY_ATTRIBUTES = {
+    'check_snapshot': '._check',
+    'CheckResult': '._check',
+    'Discrepancy': '._check',
+    'load_graph_snapshot': '._check',
+    'diff_nodes': '._diff',
+    'InterfaceChange': '._diff',
+    'load_nodes': '._diff',
+    'NodeChange': '._diff',
+    'digest_nodes': '._digest',
+    'dump_manifest': '._digest',
+    'file_digest': '._digest',
+    'load_manifest': '._digest',
+    'package_manifest': '._digest',
+    'ComputationGraph': '._graph',
+    'GraphEdge': '._graph',
+    'GraphVertex': '._graph',
+    'get_node_by_executable': '._index',
+    'package_cache': '._index',
+    'WorkspaceIndex': '._index',
+    'resolve_name': '._names',
+    'resolve_node': '._names',
+    'resolve_nodes': '._names',
+    'split_node_name': '._names',
+    'iterparse': '._parsing',
+    'parse': '._parsing',
+    'InterfaceIndex': '._query',
+    'InterfaceMatch': '._query',
+    'remap_all': '._remap',
+    'remap_node': '._remap',
+    'dumps': '._serialization',
+    'loads': '._serialization',
+    'InterfaceTable': '._table',
+    'NodeTable': '._table',
+}
+
+_LAZY_SUBMODULES = {
+    '_cache',
+    '_check',
+    '_diff',
+    '_digest',
+    '_graph',
+    '_index',
+    '_names',
+    '_parsing',
+    '_query',
+    '_remap',
+    '_serialization',
+    '_snapshot',
+    '_table',
+    'errors',
+    'types',
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    elif name in _LAZY_SUBMODULES:
+        value = import_module('.' + name, __name__)
+    else:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *_LAZY_ATTRIBUTES, *_LAZY_SUBMODULES})
@@ -0,0 +1,148 @@
+# Copyright 2020 Canonical, Ltd.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from contextlib import suppress
+import hashlib
+import json
+import os
+from pathlib import Path
+import tempfile
+from typing import IO, List, NamedTuple, Optional, Union
+
+from nodl._parsing._parsing import parse
+from nodl._serialization import _decode_node, _encode_node
+from nodl.types import Node
+
+
+# Bump whenever the layout of cached entries or of the serialized nodes changes
+_CACHE_FORMAT_VERSION = 4
+
+
+class _CacheEntry(NamedTuple):
+    format_version: int
+    path: str
+    mtime_ns: int
+    size: int
+    digest: str
+    nodes: List[Node]
+
+
+def _cache_directory() -> Path:
+    """Return the directory cache entries are stored in.
+
+    This is ``$ROS_HOME/cache/nodl`` if ROS_HOME is set, ``$XDG_CACHE_HOME/nodl`` otherwise,
+    falling back to ``~/.cache/nodl``.
+    """
+    ros_home = os.environ.get('ROS_HOME')
+    if ros_home:
+        return Path(ros_home) / 'cache' / 'nodl'
+    xdg_cache_home = os.environ.get('XDG_CACHE_HOME')
+    return (Path(xdg_cache_home) if xdg_cache_home else Path.home() / '.cache') / 'nodl'
+
+
+def _entry_path(path: Path) -> Path:
+    return _cache_directory() / (hashlib.sha256(str(path).encode()).hexdigest() + '.json')
+
+
+def _load_entry(entry_path: Path) -> Optional[_CacheEntry]:
+    """Load a cache entry, treating unreadable or outdated entries as missing.
+
+    Entries are plain JSON documents, with nodes encoded as by `nodl.dumps`, so reading an entry
+    someone else wrote into the cache directory cannot run any code.
+    """
+    try:
+        data = json.loads(entry_path.read_bytes())
+        if data['format_version'] != _CACHE_FORMAT_VERSION:
+            return None
+        return _CacheEntry(
+            format_version=_CACHE_FORMAT_VERSION,
+            path=str(data['path']),
+            mtime_ns=int(data['mtime_ns']),
+            size=int(data['size']),
+            digest=str(data['digest']),
+            nodes=[_decode_node(record) for record in data['nodes']],
+        )
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _store_entry(entry_path: Path, entry: _CacheEntry) -> None:
+    """Atomically write a cache entry, silently giving up if the cache is not writable."""
+    document = json.dumps(
+        {**entry._asdict(), 'nodes': [_encode_node(node) for node in entry.nodes]},
+        ensure_ascii=False,
+        separators=(',', ':'),
+    ).encode()
+    try:
+        entry_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        entry_file = tempfile.NamedTemporaryFile(dir=entry_path.parent, delete=False)
+    except OSError:
+        return
+    try:
+        with entry_file:
+            entry_file.write(document)
+        os.replace(entry_file.name, entry_path)
+    except OSError:
+        pass
+    finally:
+        # Only still there if the entry could not be written or moved into place
+        with suppress(OSError):
+            os.unlink(entry_file.name)
+
+
+def parse_cached(path: Union[str, Path, IO]) -> List[Node]:
+    """Parse the nodes out of a given NoDL file, reusing a previous result if it is unchanged.
+
+    Results are cached on disk per absolute path along with the size, mtime and content hash of
+    the file they were parsed from. A cached result is used as is while size and mtime match, and
+    only after comparing content hashes otherwise.
+
+    :param path: location of file, opened file objects are parsed without caching
+    :type path: Union[str, Path, IO]
+    :raises InvalidNoDLDocumentError: raised if tree does not adhere to schema
+    :return: List of NoDL nodes present in the file
+    :rtype: List[Node]
+    """
+    if not isinstance(path, (str, Path)):
+        return parse(path)
+    path = Path(path).resolve()
+    try:
+        stat = path.stat()
+    except OSError:
+        return parse(path)
+
+    entry_path = _entry_path(path)
+    entry = _load_entry(entry_path)
+    if entry is not None and entry.path != str(path):
+        entry = None
+    if entry is not None and (entry.mtime_ns, entry.size) == (stat.st_mtime_ns, stat.st_size):
+        return entry.nodes
+
+    digest = hashlib.sha256(path.read_bytes()).hexdigest()
+    if entry is not None and entry.digest == digest:
+        nodes = entry.nodes
+    else:
+        nodes = parse(path)
+    _store_entry(
+        entry_path,
+        _CacheEntry(
+            format_version=_CACHE_FORMAT_VERSION,
+            path=str(path),
+            mtime_ns=stat.st_mtime_ns,
+            size=stat.st_size,
+            digest=digest,
+            nodes=nodes,
+        ),
+    )
+    return nodes
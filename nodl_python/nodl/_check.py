@@ -0,0 +1,222 @@
+# Copyright 2020 Canonical, Ltd.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Runtime graph snapshots are JSON documents listing the endpoints of every running node, as in:
+#
+#   {"nodes": [{"name": "/ns/talker",
+#               "publishers": [{"name": "/ns/chatter", "type": "std_msgs/msg/String"}],
+#               "subscriptions": [], "service_servers": [], "service_clients": [],
+#               "action_servers": [], "action_clients": []}]}
+#
+# Endpoint types may also be lists of types, all other keys are ignored.
+
+from fnmatch import fnmatchcase
+import json
+from pathlib import Path
+from typing import (
+    AbstractSet,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+from nodl._names import resolve_name, split_node_name
+from nodl.errors import InvalidGraphSnapshotError
+from nodl.types import Node
+
+# Snapshot endpoint lists, with the kind of interface and role they hold
+_ENDPOINTS = {
+    'publishers': ('topic', 'publisher'),
+    'subscriptions': ('topic', 'subscription'),
+    'service_servers': ('service', 'server'),
+    'service_clients': ('service', 'client'),
+    'action_servers': ('action', 'server'),
+    'action_clients': ('action', 'client'),
+}
+
+# Roles a declared interface with role both may play
+_BOTH_ROLES = {'topic': ('publisher', 'subscription'), 'service': ('server', 'client')}
+_BOTH_ROLES['action'] = _BOTH_ROLES['service']
+
+# Endpoints every node gets from the client libraries, without declaring them
+DEFAULT_IGNORED = (
+    '/rosout',
+    '/parameter_events',
+    '*/describe_parameters',
+    '*/get_parameter_types',
+    '*/get_parameters',
+    '*/list_parameters',
+    '*/set_parameters',
+    '*/set_parameters_atomically',
+    '*/_action/*',
+)
+
+# Nodes tools start on their own, which no NoDL declares
+DEFAULT_IGNORED_NODES = (
+    '/_ros2cli_*',
+    '/launch_ros_*',
+    '*/transform_listener_impl_*',
+)
+
+# (kind, name, type, role)
+_Endpoint = Tuple[str, str, str, str]
+
+
+class Discrepancy(NamedTuple):
+    """An endpoint of a running node differing from the NoDL declarations of the node."""
+
+    node: str
+    kind: str
+    name: str
+    type: str
+    role: str
+
+
+class CheckResult(NamedTuple):
+    """Outcome of `check_snapshot`."""
+
+    # Endpoints seen at runtime but not declared
+    undeclared: List[Discrepancy]
+    # Declared interfaces not seen at runtime
+    unused: List[Discrepancy]
+    # Running nodes no NoDL declares
+    unknown_nodes: List[str]
+    # Running nodes several differing NoDL nodes declare, which are left unchecked
+    ambiguous_nodes: List[str]
+
+    @property
+    def has_discrepancies(self) -> bool:
+        """Whether an interface is undeclared or unused, unknown and ambiguous nodes aside."""
+        return bool(self.undeclared or self.unused)
+
+
+def load_graph_snapshot(path: Union[str, Path]) -> Dict[str, Any]:
+    """Read a runtime graph snapshot from a JSON file.
+
+    :raises InvalidGraphSnapshotError: if the file is not valid JSON
+    """
+    try:
+        return json.loads(Path(path).read_text())
+    except ValueError as e:
+        raise InvalidGraphSnapshotError(str(e)) from e
+
+
+def _runtime_endpoints(node: Mapping[str, Any]) -> Set[_Endpoint]:
+    endpoints = set()
+    for key, (kind, role) in _ENDPOINTS.items():
+        for endpoint in node.get(key, []):
+            types = endpoint['type']
+            for endpoint_type in [types] if isinstance(types, str) else types:
+                endpoints.add((kind, endpoint['name'], endpoint_type, role))
+    return endpoints
+
+
+def _declared_endpoints(
+    node: Node, namespace: str, node_name: str
+) -> Tuple[Set[_Endpoint], List[Tuple[_Endpoint, Tuple[_Endpoint, ...]]]]:
+    """Return the declared endpoints, and each declaration with the endpoints satisfying it."""
+    endpoints: Set[_Endpoint] = set()
+    declarations: List[Tuple[_Endpoint, Tuple[_Endpoint, ...]]] = []
+    for kind, interfaces in (
+        ('action', node.actions),
+        ('service', node.services),
+        ('topic', node.topics),
+    ):
+        for interface in interfaces.values():
+            name = resolve_name(interface.name, namespace, node_name)
+            role = interface.role.value
+            roles = _BOTH_ROLES[kind] if role == 'both' else (role,)
+            alternatives = tuple((kind, name, interface.type, played) for played in roles)
+            endpoints.update(alternatives)
+            declarations.append(((kind, name, interface.type, role), alternatives))
+    return endpoints, declarations
+
+
+def _is_ignored(name: str, ignored: Sequence[str]) -> bool:
+    return any(fnmatchcase(name, pattern) for pattern in ignored)
+
+
+def check_snapshot(
+    nodes: Iterable[Node],
+    snapshot: Mapping[str, Any],
+    *,
+    ignored: Sequence[str] = DEFAULT_IGNORED,
+    ignored_nodes: Sequence[str] = DEFAULT_IGNORED_NODES,
+) -> CheckResult:
+    """Compare declared interfaces to the endpoints of the nodes of a runtime graph snapshot.
+
+    Running nodes are matched to declared nodes by name, and declared names are resolved in the
+    namespace of the running node. A running node whose name several differing declared nodes
+    share, e.g. talker nodes of two packages, is reported as ambiguous rather than checked against
+    all of them. An interface declared with role both is used if it is seen in
+    either role. Comparisons are set differences per node, so checking takes linear time in the
+    size of the snapshot and of the declarations.
+
+    :param nodes: declared nodes, e.g. all nodes of a workspace
+    :type nodes: Iterable[Node]
+    :param snapshot: runtime graph snapshot, see `load_graph_snapshot`
+    :type snapshot: Mapping[str, Any]
+    :param ignored: glob patterns of runtime endpoint names to leave out
+    :type ignored: Sequence[str]
+    :param ignored_nodes: glob patterns of fully qualified names of running nodes to leave out
+    :type ignored_nodes: Sequence[str]
+    :raises InvalidGraphSnapshotError: if the snapshot is malformed
+    :return: the discrepancies found
+    :rtype: CheckResult
+    """
+    declared_by_name: Dict[str, Set[Node]] = {}
+    for node in nodes:
+        declared_by_name.setdefault(node.name, set()).add(node)
+
+    result = CheckResult(undeclared=[], unused=[], unknown_nodes=[], ambiguous_nodes=[])
+    try:
+        running_nodes = snapshot['nodes']
+        for running_node in running_nodes:
+            fully_qualified_name = running_node['name']
+            if _is_ignored(fully_qualified_name, ignored_nodes):
+                continue
+            namespace, node_name = split_node_name(fully_qualified_name)
+            runtime: AbstractSet[_Endpoint] = {
+                endpoint
+                for endpoint in _runtime_endpoints(running_node)
+                if not _is_ignored(endpoint[1], ignored)
+            }
+            if node_name not in declared_by_name:
+                result.unknown_nodes.append(fully_qualified_name)
+                continue
+            if len(declared_by_name[node_name]) > 1:
+                result.ambiguous_nodes.append(fully_qualified_name)
+                continue
+
+            (declared_node,) = declared_by_name[node_name]
+            declared, declarations = _declared_endpoints(declared_node, namespace, node_name)
+            result.undeclared.extend(
+                Discrepancy(fully_qualified_name, *endpoint)
+                for endpoint in sorted(runtime - declared)
+            )
+            result.unused.extend(
+                Discrepancy(fully_qualified_name, *declaration)
+                for declaration, alternatives in sorted(declarations)
+                if runtime.isdisjoint(alternatives)
+            )
+    except (KeyError, TypeError, AttributeError) as e:
+        raise InvalidGraphSnapshotError(f'unexpected layout, {e!r}') from e
+    return result
@@ -0,0 +1,26 @@
+# Copyright 2020 Canonical, Ltd.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Constants shared by the nodl modules and the ros2nodl verbs, kept apart so that they can be
+# imported without pulling in lxml or the ament index.
+
+_FILE_EXTENSION = '.nodl.xml'
+
+# Kinds of interfaces, as named in queries, along with the Node attribute listing them
+_KINDS = {
+    'action': 'actions',
+    'parameter': 'parameters',
+    'service': 'services',
+    'topic': 'topics',
+}
@@ -0,0 +1,159 @@
+# Copyright 2020 Canonical, Ltd.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+from nodl._cache import parse_cached
+from nodl._constants import _KINDS
+from nodl._index import _get_nodes_from_package, _get_nodl_files_from_directory
+from nodl._parsing._parsing import _parse_multiple
+from nodl.errors import NoNoDLFilesError
+from nodl.types import Node, NoDLInterface
+
+ADDED = 'added'
+REMOVED = 'removed'
+CHANGED = 'changed'
+
+
+class InterfaceChange(NamedTuple):
+    """Change of a single interface of a node."""
+
+    kind: str
+    name: str
+    change: str
+    old: Optional[NoDLInterface]
+    new: Optional[NoDLInterface]
+    # Names of the fields that differ between old and new, for changed interfaces
+    fields: Tuple[str, ...] = ()
+
+
+class NodeChange(NamedTuple):
+    """Change of the node associated with an executable."""
+
+    executable: str
+    change: str
+    old: Optional[Node]
+    new: Optional[Node]
+    fields: Tuple[str, ...] = ()
+    interfaces: Tuple[InterfaceChange, ...] = ()
+
+
+def load_nodes(source: Union[str, Path], *, jobs: int = 1) -> List[Node]:
+    """Load the nodes of a NoDL file, of all NoDL files in a directory or of an installed package.
+
+    :param source: path to a file or a directory, or name of a package
+    :type source: Union[str, Path]
+    :param jobs: maximum number of files of a directory or package to parse concurrently
+    :type jobs: int
+    :raises NoNoDLFilesError: if a directory or package has no NoDL files
+    :raises PackageNotFoundError: if source is neither a path nor the name of a package
+    :return: the nodes declared by the source
+    :rtype: List[Node]
+    """
+    path = Path(source)
+    if path.is_file():
+        return parse_cached(path)
+    if path.is_dir():
+        paths = _get_nodl_files_from_directory(path)
+        if not paths:
+            raise NoNoDLFilesError(str(path))
+        return _parse_multiple(paths=paths, parse_file=parse_cached, jobs=jobs)
+    return _get_nodes_from_package(package_name=str(source), jobs=jobs)
+
+
+def _changed_fields(old: NoDLInterface, new: NoDLInterface) -> Tuple[str, ...]:
+    return tuple(
+        field
+        for field in ('type', 'role')
+        if getattr(old, field, None) != getattr(new, field, None)
+    )
+
+
+def _diff_interfaces(
+    old: Optional[Node], new: Optional[Node]
+) -> Tuple[InterfaceChange, ...]:
+    changes = []
+    for kind, attribute in _KINDS.items():
+        old_interfaces = getattr(old, attribute) if old is not None else {}
+        new_interfaces = getattr(new, attribute) if new is not None else {}
+        for name, old_interface in old_interfaces.items():
+            new_interface = new_interfaces.get(name)
+            if new_interface is None:
+                changes.append(InterfaceChange(kind, name, REMOVED, old_interface, None))
+            elif new_interface != old_interface:
+                changes.append(
+                    InterfaceChange(
+                        kind,
+                        name,
+                        CHANGED,
+                        old_interface,
+                        new_interface,
+                        _changed_fields(old_interface, new_interface),
+                    )
+                )
+        for name, new_interface in new_interfaces.items():
+            if name not in old_interfaces:
+                changes.append(InterfaceChange(kind, name, ADDED, None, new_interface))
+    return tuple(changes)
+
+
+def diff_nodes(old: Iterable[Node], new: Iterable[Node]) -> List[NodeChange]:
+    """Compare two sets of nodes, matching nodes by executable and interfaces by kind and name.
+
+    Takes time linear in the number of nodes and interfaces. Nodes and interfaces are reported in
+    the order of old, followed by the ones only found in new.
+
+    :param old: nodes before the change
+    :type old: Iterable[Node]
+    :param new: nodes after the change
+    :type new: Iterable[Node]
+    :return: one change per added, removed or modified node, empty if both sets are equal
+    :rtype: List[NodeChange]
+    """
+    old_nodes: Dict[str, Node] = {node.executable: node for node in old}
+    new_nodes: Dict[str, Node] = {node.executable: node for node in new}
+
+    changes = []
+    for executable, old_node in old_nodes.items():
+        new_node = new_nodes.get(executable)
+        if new_node is None:
+            changes.append(
+                NodeChange(
+                    executable,
+                    REMOVED,
+                    old_node,
+                    None,
+                    interfaces=_diff_interfaces(old_node, None),
+                )
+            )
+        elif new_node != old_node:
+            changes.append(
+                NodeChange(
+                    executable,
+                    CHANGED,
+                    old_node,
+                    new_node,
+                    fields=('name',) if old_node.name != new_node.name else (),
+                    interfaces=_diff_interfaces(old_node, new_node),
+                )
+            )
+    for executable, new_node in new_nodes.items():
+        if executable not in old_nodes:
+            changes.append(
+                NodeChange(
+                    executable, ADDED, None, new_node, interfaces=_diff_interfaces(None, new_node)
+                )
+            )
+    return changes
@@ -0,0 +1,117 @@
+# Copyright 2020 Canonical, Ltd.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+# Digest manifests are JSON documents mapping the NoDL files of a package, relative to its share
+# directory, to the digest of the nodes they declare, as in:
+#
+#   {"version": 1, "files": {"talker.nodl.xml": "9f86d0..."}}
+
+from functools import lru_cache
+import hashlib
+import json
+import os
+from pathlib import Path
+import tempfile
+from typing import Dict, Iterable, Union
+
+from ament_index_python.packages import get_package_share_directory
+
+from nodl._cache import parse_cached
+from nodl._index import _get_nodl_files_from_package_share
+from nodl.errors import InvalidDigestManifestError
+from nodl.types import Node
+
+_MANIFEST_FORMAT_VERSION = 1
+
+
+def digest_nodes(nodes: Iterable[Node]) -> str:
+    """Return the SHA-256 hex digest of a set of nodes, e.g. all nodes of a NoDL file.
+
+    The digest combines the digests of the nodes, see `Node.digest`, regardless of their order.
+    """
+    return hashlib.sha256('\n'.join(sorted(node.digest for node in nodes)).encode()).hexdigest()
+
+
+@lru_cache(maxsize=1024)
+def _file_digest(path: str, mtime_ns: int, size: int) -> str:
+    return digest_nodes(parse_cached(path))
+
+
+def file_digest(path: Union[str, Path]) -> str:
+    """Return the digest of the nodes declared in a NoDL file.
+
+    Digests are computed once per file version within a process, and files are read through the
+    on-disk cache, so unchanged files are not parsed again.
+
+    :param path: location of the NoDL file
+    :type path: Union[str, Path]
+    :raises InvalidNoDLError: if the file is not valid NoDL
+    :return: SHA-256 hex digest, see `digest_nodes`
+    :rtype: str
+    """
+    path = Path(path).resolve()
+    stat = path.stat()
+    return _file_digest(str(path), stat.st_mtime_ns, stat.st_size)
+
+
+def package_manifest(package_name: str) -> Dict[str, str]:
+    """Return the digests of the NoDL files of a package, by path relative to its share directory.
+
+    Two manifests of a package are equal if and only if its NoDL files declare the same nodes.
+
+    :param package_name: name of the package
+    :type package_name: str
+    :raises PackageNotFoundError: if package is not found
+    :raises NoNoDLFilesError: if no .nodl.xml files are in package share directory
+    :return: digest by NoDL file, sorted by file
+    :rtype: Dict[str, str]
+    """
+    share_directory = Path(get_package_share_directory(package_name)).resolve()
+    manifest = {}
+    for path in _get_nodl_files_from_package_share(package_name=package_name):
+        path = path.resolve()
+        try:
+            name = path.relative_to(share_directory).as_posix()
+        except ValueError:
+            name = path.name
+        manifest[name] = file_digest(path)
+    return dict(sorted(manifest.items()))
+
+
+def dump_manifest(manifest: Dict[str, str], path: Union[str, Path]) -> None:
+    """Atomically write a digest manifest to path, see `package_manifest`."""
+    path = Path(path)
+    with tempfile.NamedTemporaryFile('w', dir=path.parent, delete=False) as manifest_file:
+        json.dump(
+            {'version': _MANIFEST_FORMAT_VERSION, 'files': manifest},
+            manifest_file,
+            indent=2,
+            sort_keys=True,
+        )
+    os.replace(manifest_file.name, path)
+
+
+def load_manifest(path: Union[str, Path]) -> Dict[str, str]:
+    """Read a digest manifest back.
+
+    :raises InvalidDigestManifestError: if the file is not a manifest this version can read
+    """
+    try:
+        document = json.loads(Path(path).read_text())
+        if document['version'] != _MANIFEST_FORMAT_VERSION:
+            raise InvalidDigestManifestError(f'unsupported version {document["version"]}')
+        return {str(name): str(digest) for name, digest in document['files'].items()}
+    except (ValueError, KeyError, TypeError, AttributeError) as e:
+        raise InvalidDigestManifestError(f'{path}: {e!r}') from e
@@ -0,0 +1,213 @@
+# Copyright 2020 Canonical, Ltd.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+from typing import AbstractSet, Any, Dict, Iterable, List, Mapping, NamedTuple, Tuple, Union
+
+from lxml import etree
+from nodl._names import resolve_name
+from nodl.types import Node, PubSubRole, ServerClientRole
+
+_Role = Union[PubSubRole, ServerClientRole]
+
+_SERVERS = frozenset((ServerClientRole.SERVER, ServerClientRole.BOTH))
+_CLIENTS = frozenset((ServerClientRole.CLIENT, ServerClientRole.BOTH))
+
+# Kinds of interfaces connecting nodes, with the Node attribute listing them and the roles on the
+# producing and consuming ends of a connection
+_CONNECTIONS: Dict[str, Tuple[str, AbstractSet[_Role], AbstractSet[_Role]]] = {
+    'action': ('actions', _SERVERS, _CLIENTS),
+    'service': ('services', _SERVERS, _CLIENTS),
+    'topic': (
+        'topics',
+        frozenset((PubSubRole.PUBLISHER, PubSubRole.BOTH)),
+        frozenset((PubSubRole.SUBSCRIPTION, PubSubRole.BOTH)),
+    ),
+}
+
+_GRAPHML_NAMESPACE = 'http://graphml.graphdrawing.org/xmlns'
+
+
+class GraphVertex(NamedTuple):
+    """A node of the computation graph, along with the package declaring it."""
+
+    package_name: str
+    node: Node
+
+    @property
+    def id(self) -> str:
+        """Identifier of the vertex, unique as executables are unique within a package."""
+        return f'{self.package_name}/{self.node.executable}'
+
+
+class GraphEdge(NamedTuple):
+    """A connection from a publisher, or server, to a subscription, or client."""
+
+    kind: str
+    # Fully qualified name of the interface
+    name: str
+    type: str
+    source: GraphVertex
+    target: GraphVertex
+
+
+def _quote(value: str) -> str:
+    return '"' + value.replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+
+class ComputationGraph:
+    """Graph of the connections between nodes implied by the interfaces they declare.
+
+    Publishers are connected to subscriptions, service servers to clients and action servers to
+    action clients using the same name and type. Names are resolved as for nodes run in the root
+    namespace, so relative and absolute names of the same interface connect. Interfaces declared
+    with role both are on both ends of connections, without being connected to the node declaring
+    them.
+
+    The graph is built with a hash join on interface kind, name and type, so construction time is
+    linear in the number of interfaces plus the number of resulting edges.
+    """
+
+    def __init__(self, packages: Mapping[str, Iterable[Node]]) -> None:
+        """Build the graph of the nodes of some packages.
+
+        :param packages: nodes of each package, e.g. `WorkspaceIndex.packages`
+        :type packages: Mapping[str, Iterable[Node]]
+        """
+        self.vertices: List[GraphVertex] = [
+            GraphVertex(package_name, node)
+            for package_name, nodes in packages.items()
+            for node in nodes
+        ]
+        self.edges: List[GraphEdge] = []
+
+        for kind, (attribute, producer_roles, consumer_roles) in _CONNECTIONS.items():
+            producers: Dict[Tuple[str, str], List[GraphVertex]] = {}
+            consumers: Dict[Tuple[str, str], List[GraphVertex]] = {}
+            for vertex in self.vertices:
+                for interface in getattr(vertex.node, attribute).values():
+                    key = (resolve_name(interface.name, '/', vertex.node.name), interface.type)
+                    if interface.role in producer_roles:
+                        producers.setdefault(key, []).append(vertex)
+                    if interface.role in consumer_roles:
+                        consumers.setdefault(key, []).append(vertex)
+
+            for key, sources in producers.items():
+                targets = consumers.get(key)
+                if not targets:
+                    continue
+                name, interface_type = key
+                self.edges.extend(
+                    GraphEdge(kind, name, interface_type, source, target)
+                    for source in sources
+                    for target in targets
+                    if source is not target
+                )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the graph as plain data, with vertices referred to by id in edges."""
+        return {
+            'nodes': [
+                {
+                    'id': vertex.id,
+                    'package': vertex.package_name,
+                    'name': vertex.node.name,
+                    'executable': vertex.node.executable,
+                }
+                for vertex in self.vertices
+            ],
+            'edges': [
+                {
+                    'source': edge.source.id,
+                    'target': edge.target.id,
+                    'kind': edge.kind,
+                    'name': edge.name,
+                    'type': edge.type,
+                }
+                for edge in self.edges
+            ],
+        }
+
+    def to_json(self) -> str:
+        """Serialize the graph to JSON, see `to_dict`."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def to_dot(self) -> str:
+        """Serialize the graph to the Graphviz DOT language."""
+        lines = ['digraph nodl {']
+        for vertex in self.vertices:
+            lines.append(f'  {_quote(vertex.id)} [label={_quote(vertex.node.name)}];')
+        for edge in self.edges:
+            lines.append(
+                f'  {_quote(edge.source.id)} -> {_quote(edge.target.id)} '
+                f'[label={_quote(edge.name)}, kind={_quote(edge.kind)}, type={_quote(edge.type)}];'
+            )
+        lines.append('}')
+        return '\n'.join(lines) + '\n'
+
+    def to_graphml(self) -> str:
+        """Serialize the graph to GraphML."""
+        graphml = etree.Element(
+            f'{{{_GRAPHML_NAMESPACE}}}graphml', nsmap={None: _GRAPHML_NAMESPACE}
+        )
+        for domain, names in (
+            ('node', ('package', 'name', 'executable')),
+            ('edge', ('kind', 'name', 'type')),
+        ):
+            for name in names:
+                etree.SubElement(
+                    graphml,
+                    f'{{{_GRAPHML_NAMESPACE}}}key',
+                    {
+                        'id': f'{domain}_{name}',
+                        'for': domain,
+                        'attr.name': name,
+                        'attr.type': 'string',
+                    },
+                )
+
+        graph = etree.SubElement(
+            graphml, f'{{{_GRAPHML_NAMESPACE}}}graph', id='nodl', edgedefault='directed'
+        )
+
+        def add_data(element: etree._Element, domain: str, values: Dict[str, str]) -> None:
+            for name, value in values.items():
+                data = etree.SubElement(
+                    element, f'{{{_GRAPHML_NAMESPACE}}}data', key=f'{domain}_{name}'
+                )
+                data.text = value
+
+        for vertex in self.vertices:
+            element = etree.SubElement(graph, f'{{{_GRAPHML_NAMESPACE}}}node', id=vertex.id)
+            add_data(
+                element,
+                'node',
+                {
+                    'package': vertex.package_name,
+                    'name': vertex.node.name,
+                    'executable': vertex.node.executable,
+                },
+            )
+        for edge in self.edges:
+            element = etree.SubElement(
+                graph,
+                f'{{{_GRAPHML_NAMESPACE}}}edge',
+                source=edge.source.id,
+                target=edge.target.id,
+            )
+            add_data(element, 'edge', {'kind': edge.kind, 'name': edge.name, 'type': edge.type})
+
+        return etree.tostring(
+            graphml, pretty_print=True, xml_declaration=True, encoding='UTF-8'
+        ).decode()
@@ -13,50 +13,232 @@
 # limitations under the License.
 
 
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import os
 from pathlib import Path
-from typing import Iterable, List, Tuple
+import threading
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping, NamedTuple, Optional, Tuple, Union
 
-from ament_index_python.packages import get_package_share_directory
+from ament_index_python.packages import get_package_share_directory, get_packages_with_prefixes
+from ament_index_python.resources import get_resource, get_resources
 
+from nodl._cache import parse_cached
+from nodl._constants import _FILE_EXTENSION
 from nodl._parsing._parsing import _parse_multiple
-from nodl.errors import ExecutableNotFoundError, NoNoDLFilesError
+from nodl.errors import ExecutableNotFoundError, NoDLError, NoNoDLFilesError
 
 from .types import Node
 
 
-_FILE_EXTENSION = '.nodl.xml'
+_RESOURCE_TYPE = 'nodl'
 
 
-def _get_nodl_files_from_package_share(*, package_name: str) -> List[Path]:
-    """Return all .nodl.xml files from the share directory of a package.
+def _get_nodl_files_from_directory(directory: Path) -> List[Path]:
+    """Return all .nodl.xml files directly inside a directory."""
+    return [path for path in directory.glob('*' + _FILE_EXTENSION) if path.is_file()]
+
+
+def _get_nodl_files_from_resource(*, package_name: str, prefix: str, content: str) -> List[Path]:
+    """Return the .nodl.xml files listed in a package's nodl resource.
+
+    The resource lists one path relative to the package share directory per line, an empty
+    resource stands for all .nodl.xml files directly inside the share directory.
+    """
+    package_share_directory = Path(prefix) / 'share' / package_name
+    names = [line.strip() for line in content.splitlines() if line.strip()]
+    if not names:
+        return _get_nodl_files_from_directory(package_share_directory)
+    nodl_paths = [package_share_directory / name for name in names]
+    return [path for path in nodl_paths if path.is_file()]
+
+
+def _get_resource_path(*, package_name: str, prefix: str) -> Path:
+    """Return the location of the nodl resource of a package in the ament resource index."""
+    resource_index = Path(prefix) / 'share' / 'ament_index' / 'resource_index'
+    return resource_index / _RESOURCE_TYPE / package_name
+
+
+def _discover_package(*, package_name: str) -> Tuple[List[Path], Optional[Path]]:
+    """Return the .nodl.xml files of a package, and the resource listing them if registered.
 
     :raises PackageNotFoundError: if package is not found
     :raises NoNoDLFilesError: if no .nodl.xml files are in package share directory
     """
-    package_share_directory = Path(get_package_share_directory(package_name))
-    nodl_paths = [
-        path for path in package_share_directory.glob('*' + _FILE_EXTENSION) if path.is_file()
-    ]
+    try:
+        content, prefix = get_resource(_RESOURCE_TYPE, package_name)
+    except LookupError:
+        package_share_directory = Path(get_package_share_directory(package_name))
+        nodl_paths = _get_nodl_files_from_directory(package_share_directory)
+        resource_path = None
+    else:
+        nodl_paths = _get_nodl_files_from_resource(
+            package_name=package_name, prefix=prefix, content=content
+        )
+        resource_path = _get_resource_path(package_name=package_name, prefix=prefix)
     if not nodl_paths:
         raise NoNoDLFilesError(package_name)
+    return nodl_paths, resource_path
+
+
+def _get_nodl_files_from_package_share(*, package_name: str) -> List[Path]:
+    """Return all .nodl.xml files from the share directory of a package.
+
+    Files registered in the ament resource index are used if the package registered any,
+    otherwise the package share directory is searched.
+
+    :raises PackageNotFoundError: if package is not found
+    :raises NoNoDLFilesError: if no .nodl.xml files are in package share directory
+    """
+    nodl_paths, _ = _discover_package(package_name=package_name)
     return nodl_paths
 
 
-def _get_nodes_from_package(*, package_name: str) -> List[Node]:
+_Stamp = Optional[Tuple[Tuple[int, int], ...]]
+
+
+class _LoadedPackage(NamedTuple):
+    # The nodl.xml files of the package, and the resource listing them if registered
+    stamped_files: List[Path]
+    # Taken before parsing, so files changing while being parsed are reloaded on next lookup
+    stamp: _Stamp
+    nodes: List[Node]
+
+
+def _load_package(*, package_name: str, jobs: int = 1) -> _LoadedPackage:
+    """Return the files a package is loaded from, their stamp and the nodes parsed from them."""
+    nodl_files, resource_path = _discover_package(package_name=package_name)
+    stamped_files = nodl_files if resource_path is None else [*nodl_files, resource_path]
+    stamp = _get_stamp(stamped_files)
+    return _LoadedPackage(
+        stamped_files=stamped_files,
+        stamp=stamp,
+        nodes=_parse_multiple(paths=nodl_files, parse_file=parse_cached, jobs=jobs),
+    )
+
+
+def _get_nodes_from_package(*, package_name: str, jobs: int = 1) -> List[Node]:
     """Return results of parsing all nodl.xml files of a package.
 
+    Files are read through the on-disk cache, so unchanged files are not parsed again.
+
     :param package_name: name of the package
     :type package_name: str
+    :param jobs: maximum number of files to parse concurrently
+    :type jobs: int
     :return: combined list of all `nodl.Node`'s a package contains
     :rtype: List[Node]
     """
-    nodl_files = _get_nodl_files_from_package_share(package_name=package_name)
-    return _parse_multiple(paths=nodl_files)
+    return _load_package(package_name=package_name, jobs=jobs).nodes
+
+
+def _get_stamp(paths: Iterable[Path]) -> _Stamp:
+    """Return the mtimes and sizes of files and their directories, None if any are missing."""
+    paths = list(paths)
+    try:
+        return tuple(
+            (stat.st_mtime_ns, stat.st_size)
+            for stat in (path.stat() for path in sorted({path.parent for path in paths}) + paths)
+        )
+    except OSError:
+        return None
+
+
+class _PackageCacheEntry(NamedTuple):
+    stamped_files: List[Path]
+    stamp: _Stamp
+    nodes: Mapping[str, Node]
+
+
+class PackageCacheStats(NamedTuple):
+    hits: int
+    misses: int
+    size: int
+    max_size: int
+
+
+class PackageCache:
+    """Bounded, thread-safe, in-process cache of the nodes each package exports.
+
+    Entries map executable names to nodes and are revalidated on every lookup by comparing the
+    mtimes of the package's NoDL files, of their directories and of the resource registering them,
+    if any, with the ones they were loaded from.
+    The least recently used package is evicted once more than max_size packages are cached.
+    """
+
+    def __init__(self, max_size: int = 128) -> None:
+        self._max_size = max_size
+        self._entries: 'OrderedDict[Tuple[str, str], _PackageCacheEntry]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, package_name: str) -> Mapping[str, Node]:
+        """Return the nodes of a package by executable name, loading the package if needed.
+
+        :param package_name: name of the package
+        :type package_name: str
+        :raises PackageNotFoundError: if package is not found
+        :raises NoNoDLFilesError: if no .nodl.xml files are in package share directory
+        :return: read-only mapping of executable names to the nodes associated with them
+        :rtype: Mapping[str, Node]
+        """
+        # Packages resolve to different share directories under different prefix paths
+        key = (package_name, os.environ.get('AMENT_PREFIX_PATH', ''))
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and entry.stamp is not None:
+            if _get_stamp(entry.stamped_files) == entry.stamp:
+                with self._lock:
+                    self._hits += 1
+                    if key in self._entries:
+                        self._entries.move_to_end(key)
+                return entry.nodes
+
+        # Parse outside of the lock so lookups in other packages are not held up
+        package = _load_package(package_name=package_name)
+        entry = _PackageCacheEntry(
+            stamped_files=package.stamped_files,
+            stamp=package.stamp,
+            nodes=MappingProxyType({node.executable: node for node in package.nodes}),
+        )
+        with self._lock:
+            self._misses += 1
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+        return entry.nodes
+
+    def invalidate(self, package_name: Optional[str] = None) -> None:
+        """Drop the cached nodes of a package, or of all packages if none is given."""
+        with self._lock:
+            if package_name is None:
+                self._entries.clear()
+            else:
+                for key in [key for key in self._entries if key[0] == package_name]:
+                    del self._entries[key]
+
+    def stats(self) -> PackageCacheStats:
+        """Return hit and miss counts along with the current and maximum number of packages."""
+        with self._lock:
+            return PackageCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                size=len(self._entries),
+                max_size=self._max_size,
+            )
+
+
+package_cache = PackageCache()
 
 
 def get_node_by_executable(*, package_name: str, executable_name: str) -> Node:
     """Return node associated with given executable from a package's exported nodl.
 
+    Packages are looked up through `package_cache`, so repeated calls do not reparse them.
+
     :param package_name: name of the package to search in
     :type package_name: str
     :param executable_name: the name of the executable the node is associated with
@@ -65,10 +247,10 @@ def get_node_by_executable(*, package_name: str, executable_name: str) -> Node:
     :return: Node with matching executable field
     :rtype: Node
     """
-    nodes = _get_nodes_from_package(package_name=package_name)
+    nodes = package_cache.get(package_name)
     try:
-        return next(node for node in nodes if node.executable == executable_name)
-    except StopIteration:
+        return nodes[executable_name]
+    except KeyError:
         raise ExecutableNotFoundError(package_name=package_name, executable_name=executable_name)
 
 
@@ -88,3 +270,129 @@ def _get_nodes_by_executables(
     result = {node.executable: node for node in nodes if node.executable in executable_names}
     missing = list(set(executable_names) - result.keys())
     return list(result.values()), missing
+
+
+class WorkspaceIndex:
+    """Index of the nodes exported by every package on the AMENT_PREFIX_PATH.
+
+    All packages are discovered and parsed once, on construction or `refresh`, after which nodes
+    can be looked up by package and executable, by node name or by package in constant time.
+    Packages whose NoDL fails to parse are left out of the index and reported in `errors`.
+
+    Packages registering a nodl resource in the ament resource index are found from a single
+    listing of that index. Unless registered_only is set, the share directories of all other
+    packages are searched as well.
+    """
+
+    def __init__(self, *, jobs: int = 1, registered_only: bool = False) -> None:
+        """Scan the workspace.
+
+        :param jobs: maximum number of packages to parse concurrently, or of files when there is a
+            single package
+        :type jobs: int
+        :param registered_only: only index packages registered in the ament resource index
+        :type registered_only: bool
+        """
+        self._jobs = jobs
+        self._registered_only = registered_only
+        self.refresh()
+
+    def _discover(self) -> Dict[str, List[Path]]:
+        """Return the .nodl.xml files of all packages that have any."""
+        prefixes = dict(get_resources(_RESOURCE_TYPE))
+        registered = set(prefixes)
+        if not self._registered_only:
+            for package_name, prefix in get_packages_with_prefixes().items():
+                prefixes.setdefault(package_name, prefix)
+
+        nodl_files_by_package = {}
+        for package_name, prefix in sorted(prefixes.items()):
+            if package_name in registered:
+                content, _ = get_resource(_RESOURCE_TYPE, package_name)
+                nodl_files = _get_nodl_files_from_resource(
+                    package_name=package_name, prefix=prefix, content=content
+                )
+            else:
+                nodl_files = _get_nodl_files_from_directory(Path(prefix) / 'share' / package_name)
+            if nodl_files:
+                nodl_files_by_package[package_name] = nodl_files
+        return nodl_files_by_package
+
+    def refresh(self) -> None:
+        """Rescan the workspace, picking up added, removed or modified packages."""
+        nodl_files_by_package = self._discover()
+
+        if self._jobs > 1 and len(nodl_files_by_package) > 1:
+            with ThreadPoolExecutor(max_workers=self._jobs) as executor:
+                results = list(executor.map(self._parse_package, nodl_files_by_package.values()))
+        else:
+            # Packages are parsed one after the other, so jobs go to the files of each package
+            results = [
+                self._parse_package(paths, jobs=self._jobs)
+                for paths in nodl_files_by_package.values()
+            ]
+
+        self._packages: Dict[str, List[Node]] = {}
+        self._errors: Dict[str, NoDLError] = {}
+        self._nodes_by_executable: Dict[Tuple[str, str], Node] = {}
+        self._nodes_by_name: Dict[str, List[Node]] = {}
+        for package_name, result in zip(nodl_files_by_package, results):
+            if isinstance(result, NoDLError):
+                self._errors[package_name] = result
+                continue
+            self._packages[package_name] = result
+            for node in result:
+                self._nodes_by_executable[(package_name, node.executable)] = node
+                self._nodes_by_name.setdefault(node.name, []).append(node)
+
+    @staticmethod
+    def _parse_package(nodl_files: List[Path], jobs: int = 1) -> Union[List[Node], NoDLError]:
+        try:
+            return _parse_multiple(paths=nodl_files, parse_file=parse_cached, jobs=jobs)
+        except NoDLError as e:
+            return e
+
+    @property
+    def packages(self) -> Mapping[str, List[Node]]:
+        """Read-only mapping of the names of all packages exporting NoDL to their nodes."""
+        return MappingProxyType(self._packages)
+
+    @property
+    def errors(self) -> Mapping[str, NoDLError]:
+        """Read-only mapping of the names of packages whose NoDL failed to parse to the error."""
+        return MappingProxyType(self._errors)
+
+    def get_node_by_executable(self, *, package_name: str, executable_name: str) -> Node:
+        """Return node associated with given executable from a package.
+
+        :param package_name: name of the package to search in
+        :type package_name: str
+        :param executable_name: the name of the executable the node is associated with
+        :type executable_name: str
+        :raises ExecutableNotFoundError: if no node in the package is associated with executable
+        :return: Node with matching executable field
+        :rtype: Node
+        """
+        try:
+            return self._nodes_by_executable[(package_name, executable_name)]
+        except KeyError:
+            raise ExecutableNotFoundError(
+                package_name=package_name, executable_name=executable_name
+            )
+
+    def get_nodes_by_name(self, node_name: str) -> List[Node]:
+        """Return all nodes with a given name, from any package."""
+        return list(self._nodes_by_name.get(node_name, []))
+
+    def get_nodes_by_package(self, package_name: str) -> List[Node]:
+        """Return all nodes of a package.
+
+        :raises NoNoDLFilesError: if the package exports no NoDL
+        :raises NoDLError: the error the package's NoDL failed to parse with
+        """
+        if package_name in self._errors:
+            raise self._errors[package_name]
+        try:
+            return list(self._packages[package_name])
+        except KeyError:
+            raise NoNoDLFilesError(package_name)
@@ -0,0 +1,132 @@
+# Copyright 2020 Canonical, Ltd.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+# Names are resolved as in ROS 2: absolute names are kept as they are, relative names are
+# prefixed with the namespace of the node, and private names, starting with ~, with its fully
+# qualified name.
+
+from functools import lru_cache
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+from nodl.types import Node
+
+# Few distinct names and namespaces make up a workspace, resolutions are memoized per triple
+_CACHE_SIZE = 1 << 16
+
+
+@lru_cache(maxsize=1024)
+def _normalize_namespace(namespace: str) -> str:
+    return '/' + namespace.strip('/')
+
+
+def split_node_name(fully_qualified_name: str) -> Tuple[str, str]:
+    """Split the fully qualified name of a node, e.g. /robot/talker, into namespace and name."""
+    namespace, _, name = fully_qualified_name.rpartition('/')
+    return namespace or '/', name
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def resolve_name(name: str, namespace: str = '/', node_name: Optional[str] = None) -> str:
+    """Expand a possibly relative or private interface name within the namespace of a node.
+
+    :param name: name to resolve, e.g. chatter, /chatter or ~/chatter
+    :type name: str
+    :param namespace: namespace of the node, e.g. /robot
+    :type namespace: str
+    :param node_name: name of the node, needed to resolve private names
+    :type node_name: Optional[str]
+    :raises ValueError: if name is empty, or private and no node name is given
+    :return: the fully qualified name
+    :rtype: str
+    """
+    if not name:
+        raise ValueError('cannot resolve an empty name')
+    if name.startswith('/'):
+        return name
+    prefix = _normalize_namespace(namespace).rstrip('/')
+    if name.startswith('~'):
+        if not node_name:
+            raise ValueError(f'cannot resolve private name {name} without a node name')
+        private = name[1:].lstrip('/')
+        return f'{prefix}/{node_name}/{private}' if private else f'{prefix}/{node_name}'
+    return f'{prefix}/{name}'
+
+
+def resolve_node(node: Node, *, namespace: str = '/', node_name: Optional[str] = None) -> Node:
+    """Return a node with the names of its actions, services and topics fully qualified.
+
+    Parameters are local to a node and keep their names. The node itself is returned if all of its
+    names are already absolute.
+
+    :param node: node to resolve
+    :type node: Node
+    :param namespace: namespace the node runs in
+    :type namespace: str
+    :param node_name: name the node runs under, defaults to the name of the node
+    :type node_name: Optional[str]
+    :raises ValueError: if a private name cannot be resolved
+    :return: the resolved node
+    :rtype: Node
+    """
+    node_name = node_name or node.name
+    actions = [
+        action.renamed(resolve_name(action.name, namespace, node_name))
+        for action in node.actions.values()
+    ]
+    services = [
+        service.renamed(resolve_name(service.name, namespace, node_name))
+        for service in node.services.values()
+    ]
+    topics = [
+        topic.renamed(resolve_name(topic.name, namespace, node_name))
+        for topic in node.topics.values()
+    ]
+    if all(
+        resolved is original
+        for resolved, original in zip(
+            [*actions, *services, *topics],
+            [*node.actions.values(), *node.services.values(), *node.topics.values()],
+        )
+    ):
+        return node
+    return Node(
+        name=node.name,
+        executable=node.executable,
+        actions=actions,
+        parameters=list(node.parameters.values()),
+        services=services,
+        topics=topics,
+    )
+
+
+def resolve_nodes(
+    packages: Mapping[str, Iterable[Node]], *, namespace: str = '/'
+) -> Dict[str, List[Node]]:
+    """Resolve the nodes of many packages, e.g. `WorkspaceIndex.packages`, in a single pass.
+
+    Every node is resolved under its own name within namespace, see `resolve_node`.
+
+    :param packages: nodes by package name
+    :type packages: Mapping[str, Iterable[Node]]
+    :param namespace: namespace the nodes run in
+    :type namespace: str
+    :raises ValueError: if a private name cannot be resolved
+    :return: resolved nodes by package name
+    :rtype: Dict[str, List[Node]]
+    """
+    return {
+        package_name: [resolve_node(node, namespace=namespace) for node in nodes]
+        for package_name, nodes in packages.items()
+    }
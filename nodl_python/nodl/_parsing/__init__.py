@@ -13,4 +13,4 @@
 # limitations under the License.
 
 
-from ._parsing import parse  # noqa: F401
+from ._parsing import iterparse, parse  # noqa: F401
@@ -12,10 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, IO, Iterable, List, Union
+from typing import Callable, Dict, IO, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 
 from lxml import etree
+from nodl import _snapshot
 from nodl._parsing import _v1 as parse_v1
 from nodl._parsing._schemas import interface_schema
 from nodl.errors import (
@@ -30,62 +32,192 @@ from nodl.types import Node
 NODL_MAX_SUPPORTED_VERSION = 1
 
 
-def _parse_interface(interface: etree._Element) -> List[Node]:
+def _parse_interface(interface: etree._Element, *, validate: bool = True) -> List[Node]:
     """Parse out all nodes from an interface element."""
     if interface.get('version') == '1':
-        return parse_v1.parse(interface)
+        return parse_v1.parse(interface, validate=validate)
     else:
         raise UnsupportedInterfaceError(interface.get('version'), NODL_MAX_SUPPORTED_VERSION)
 
 
-def _parse_element_tree(element_tree: etree._ElementTree) -> List[Node]:
+def _parse_element_tree(element_tree: etree._ElementTree, *, validate: bool = True) -> List[Node]:
     """Extract an interface element from an ElementTree if present.
 
+    Supported documents are dispatched on their version and validated once, against the schema of
+    that version only. The generic interface schema is only consulted to explain why a document
+    could not be dispatched.
+
     :param element_tree: parsed xml tree to operate on
     :type element_tree: etree._ElementTree
+    :param validate: whether to validate the tree against the schema of its version
+    :type validate: bool
     :raises InvalidNoDLDocumentError: if tree does not adhere to schema
     :return: List of NoDL nodes present in the xml tree.
     :rtype: List[Node]
     """
-    try:
-        interface_schema().assertValid(element_tree)
-    except etree.DocumentInvalid as e:
-        raise InvalidNoDLDocumentError(e)
-    return _parse_interface(element_tree.getroot())
+    interface = element_tree.getroot()
+    if interface.tag != 'interface' or interface.get('version') != '1':
+        try:
+            interface_schema().assertValid(element_tree)
+        except etree.DocumentInvalid as e:
+            raise InvalidNoDLDocumentError(e)
+    return _parse_interface(interface, validate=validate)
+
+
+def _resolve_source(path: Union[str, Path, IO]) -> Union[str, IO]:
+    """Resolve paths to absolute path strings for lxml, passing file objects through."""
+    if isinstance(path, str):
+        path = Path(path)
+    if isinstance(path, Path):
+        return str(path.resolve())
+    return path
 
 
-def parse(path: Union[str, Path, IO]) -> List[Node]:
+def parse(
+    path: Union[str, Path, IO], *, validate: bool = True, use_snapshot: bool = True
+) -> List[Node]:
     """Parse the nodes out of a given NoDL file.
 
+    If a compiled snapshot of the file exists and is at least as recent as the file, the nodes
+    are loaded from the snapshot instead, without parsing or validating any XML.
+
     :param path: location of file, or opened file object
     :type path: Union[str, Path, IO]
+    :param validate: whether to validate the document against its schema, only disable this for
+        trusted files that were already validated, e.g. in CI
+    :type validate: bool
+    :param use_snapshot: whether to load the compiled snapshot of the file if it is up to date
+    :type use_snapshot: bool
     :raises InvalidNoDLDocumentError: raised if tree does not adhere to schema
     :return: List of NoDL nodes present in the file
     :rtype: List[Node]
     """
-    if isinstance(path, str):
-        path = Path(path)
-    if isinstance(path, Path):
-        path = str(path.resolve())
+    if use_snapshot and isinstance(path, (str, Path)):
+        nodes = _snapshot.load_if_fresh(Path(path))
+        if nodes is not None:
+            return nodes
     try:
-        element_tree = etree.parse(path)
+        element_tree = etree.parse(_resolve_source(path))
     except etree.XMLSyntaxError as e:
         raise InvalidXMLError(e)
 
-    return _parse_element_tree(element_tree)
+    return _parse_element_tree(element_tree, validate=validate)
+
+
+def _validate_interface_element(
+    interface: etree._Element, children: Sequence[Tuple[str, Optional[int]]]
+) -> None:
+    """Validate the attributes of an interface element without its (possibly unread) children.
+
+    A shallow copy holding empty stand-ins for the given children, as (tag, line) pairs, is checked
+    against the interface schema. The copy keeps the file name and line numbers of the original
+    elements, so the same errors are raised as when validating the full document.
+    """
+    shallow = etree.Element(interface.tag, interface.attrib)
+    shallow.sourceline = interface.sourceline
+    for tag, line in children:
+        child = etree.SubElement(shallow, tag)
+        if line is not None:
+            child.sourceline = line
+    document = etree.ElementTree(shallow)
+    if interface.base is not None:
+        document.docinfo.URL = interface.base
+    try:
+        interface_schema().assertValid(document)
+    except etree.DocumentInvalid as e:
+        raise InvalidNoDLDocumentError(e)
+
+
+def iterparse(path: Union[str, Path, IO], *, validate: bool = True) -> Iterator[Node]:
+    """Incrementally parse the nodes out of a given NoDL file.
+
+    Each node element is validated and yielded as soon as it has been read, then dropped from the
+    partially built tree, so memory use does not grow with the number of nodes in the file.
+
+    :param path: location of file, or opened file object
+    :type path: Union[str, Path, IO]
+    :param validate: whether to validate each node against the schema, see :func:`parse`
+    :type validate: bool
+    :raises InvalidXMLError: raised if the file is not well-formed xml
+    :raises InvalidNoDLDocumentError: raised if the file does not adhere to schema
+    :raises UnsupportedInterfaceError: raised if the interface version is not supported
+    :return: Iterator over the NoDL nodes present in the file, in document order
+    :rtype: Iterator[Node]
+    """
+    try:
+        events = etree.iterparse(_resolve_source(path), events=('start', 'end'))
+        _, interface = next(events)
+        _validate_interface_element(interface, [('node', None)])
+        if interface.get('version') != '1':
+            raise UnsupportedInterfaceError(interface.get('version'), NODL_MAX_SUPPORTED_VERSION)
+
+        depth = 1
+        node_count = 0
+        for event, element in events:
+            if event == 'start':
+                depth += 1
+                continue
+
+            depth -= 1
+            if depth == 1:
+                if element.tag != 'node':
+                    preceding = [('node', None)] if node_count else []
+                    _validate_interface_element(
+                        interface, [*preceding, (element.tag, element.sourceline)]
+                    )
+                yield parse_v1.parse_node(element, validate=validate)
+                node_count += 1
+
+                # Free the finished node and everything read before it
+                element.clear()
+                while element.getprevious() is not None:
+                    del interface[0]
+            elif depth == 0 and not node_count:
+                _validate_interface_element(interface, [])
+    except etree.XMLSyntaxError as e:
+        raise InvalidXMLError(e)
 
 
-def _parse_multiple(paths: Iterable[Union[str, Path, IO]]) -> List[Node]:
+def _parse_multiple(
+    paths: Iterable[Union[str, Path, IO]],
+    *,
+    parse_file: Optional[Callable[[Union[str, Path, IO]], List[Node]]] = None,
+    jobs: int = 1,
+    use_processes: bool = False,
+) -> List[Node]:
     """Merge nodl files into one large node list.
 
+    With more than one job, files are parsed concurrently but results and errors are still
+    handled in input order, so the outcome is the same as when parsing serially.
+
     :param paths: List of nodl files to parse
     :type paths: Iterable[Union[str, Path, IO]]
+    :param parse_file: function used to parse each file, defaults to `parse`
+    :type parse_file: Optional[Callable[[Union[str, Path, IO]], List[Node]]]
+    :param jobs: maximum number of files to parse concurrently
+    :type jobs: int
+    :param use_processes: parse in a process pool instead of a thread pool, ignored if any of the
+        paths is an opened file object
+    :type use_processes: bool
     :raises DuplicateNodeError: if node is defined multiple times
     :raises InvalidNoDLDocumentError: if doc does not adhere to schema
     :return: flat list of nodes provided by the documents
     :rtype: List[Node]
     """
-    node_lists = [parse(path) for path in paths]
+    if parse_file is None:
+        parse_file = parse
+    paths = list(paths)
+    if jobs > 1 and len(paths) > 1:
+        executor: Executor
+        if use_processes and all(isinstance(path, (str, Path)) for path in paths):
+            executor = ProcessPoolExecutor(max_workers=jobs)
+        else:
+            executor = ThreadPoolExecutor(max_workers=jobs)
+        with executor:
+            # map yields in input order and raises the first error in that order
+            node_lists = list(executor.map(parse_file, paths))
+    else:
+        node_lists = [parse_file(path) for path in paths]
     combined_dict: Dict[str, Node] = {}
     for node_list in node_lists:
         for node in node_list:
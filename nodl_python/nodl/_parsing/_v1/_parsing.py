@@ -100,10 +100,23 @@ def _parse_node(node: etree._Element) -> Node:
     )
 
 
-def parse(interface: etree._Element) -> List[Node]:
-    """"""
+def _validate(element: etree._Element) -> None:
+    """Validate an interface or node element against the v1 schema."""
     try:
-        v1_schema().assertValid(interface)
+        v1_schema().assertValid(element)
     except etree.DocumentInvalid as e:
         raise errors.InvalidNoDLDocumentError(e) from e
+
+
+def parse_node(node: etree._Element, *, validate: bool = True) -> Node:
+    """Validate a single node element against the v1 schema and parse it."""
+    if validate:
+        _validate(node)
+    return _parse_node(node)
+
+
+def parse(interface: etree._Element, *, validate: bool = True) -> List[Node]:
+    """Validate an interface element against the v1 schema and parse its nodes."""
+    if validate:
+        _validate(interface)
     return _parse_nodes(interface)
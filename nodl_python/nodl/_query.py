@@ -0,0 +1,176 @@
+# Copyright 2020 Canonical, Ltd.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from fnmatch import fnmatchcase
+from typing import Dict, Iterable, List, Mapping, NamedTuple, Optional, Union
+
+from nodl._constants import _KINDS
+from nodl._names import resolve_name
+from nodl.types import Node, NoDLInterface, PubSubRole, ServerClientRole
+
+
+_GLOB_CHARACTERS = frozenset('*?[')
+
+
+class InterfaceMatch(NamedTuple):
+    """An interface declared by a node, as returned by `InterfaceIndex.find`."""
+
+    package_name: str
+    node: Node
+    kind: str
+    interface: NoDLInterface
+
+
+def _is_pattern(value: str) -> bool:
+    return not _GLOB_CHARACTERS.isdisjoint(value)
+
+
+def _index_name(kind: str, name: str, node_name: Optional[str] = None) -> str:
+    """Resolve a name as for a node run in the root namespace, parameter names being local.
+
+    Private names are left as they are when no node name is given, as for a query.
+    """
+    if kind == 'parameter' or (node_name is None and name.startswith('~')):
+        return name
+    return resolve_name(name, '/', node_name)
+
+
+def _role_matches(interface: NoDLInterface, role: str) -> bool:
+    """Check if an interface plays a role, an interface with role BOTH playing every role."""
+    interface_role: Optional[Union[PubSubRole, ServerClientRole]] = getattr(
+        interface, 'role', None
+    )
+    if interface_role is None:
+        return False
+    if interface_role.value == role:
+        return True
+    return interface_role.name == 'BOTH' and role in {
+        member.value for member in type(interface_role)
+    }
+
+
+class InterfaceIndex:
+    """Inverted index of the interfaces declared by a set of nodes.
+
+    Interfaces are indexed by kind and name and by kind and type, so that looking up the nodes
+    using an interface, or all interfaces of a type, takes constant time.
+
+    Names of actions, services and topics are indexed fully qualified, as for nodes run in the root
+    namespace, so chatter and /chatter are the same interface. Matches keep the interfaces as
+    declared.
+    """
+
+    def __init__(self, packages: Mapping[str, Iterable[Node]]) -> None:
+        """Index the nodes of some packages.
+
+        :param packages: nodes of each package, e.g. `WorkspaceIndex.packages`
+        :type packages: Mapping[str, Iterable[Node]]
+        """
+        self._by_name: Dict[str, Dict[str, List[InterfaceMatch]]] = {kind: {} for kind in _KINDS}
+        self._by_type: Dict[str, Dict[str, List[InterfaceMatch]]] = {kind: {} for kind in _KINDS}
+        for package_name, nodes in packages.items():
+            for node in nodes:
+                for kind, attribute in _KINDS.items():
+                    by_name = self._by_name[kind]
+                    by_type = self._by_type[kind]
+                    for interface in getattr(node, attribute).values():
+                        match = InterfaceMatch(package_name, node, kind, interface)
+                        by_name.setdefault(
+                            _index_name(kind, interface.name, node.name), []
+                        ).append(match)
+                        by_type.setdefault(interface.type, []).append(match)
+
+    def names(self, kind: str) -> List[str]:
+        """Return the names of all interfaces of a kind, fully qualified but for parameters."""
+        return sorted(self._by_name[kind])
+
+    def types(self, kind: str) -> List[str]:
+        """Return the types of all interfaces of a kind."""
+        return sorted(self._by_type[kind])
+
+    def _lookup(
+        self,
+        index: Dict[str, Dict[str, List[InterfaceMatch]]],
+        kinds: List[str],
+        key: str,
+        resolve: bool = False,
+    ) -> List[InterfaceMatch]:
+        matches: List[InterfaceMatch] = []
+        for kind in kinds:
+            kind_key = _index_name(kind, key) if resolve else key
+            if _is_pattern(kind_key):
+                for indexed_key, indexed_matches in index[kind].items():
+                    if fnmatchcase(indexed_key, kind_key):
+                        matches.extend(indexed_matches)
+            else:
+                matches.extend(index[kind].get(kind_key, []))
+        return matches
+
+    def find(
+        self,
+        *,
+        kind: Optional[str] = None,
+        name: Optional[str] = None,
+        interface_type: Optional[str] = None,
+        role: Optional[str] = None,
+        package_name: Optional[str] = None,
+    ) -> List[InterfaceMatch]:
+        """Find the interfaces matching all given criteria.
+
+        Names, types and package names may be glob patterns as understood by `fnmatch`. Exact
+        names and types are looked up directly in the index. Relative names of actions, services
+        and topics are resolved in the root namespace, so both chatter and /chatter find an
+        interface declared as chatter, and private ones are found by their resolved name, e.g.
+        /talker/debug.
+
+        :param kind: one of 'action', 'parameter', 'service' or 'topic', any kind if None
+        :type kind: Optional[str]
+        :param name: name of the interfaces
+        :type name: Optional[str]
+        :param interface_type: type of the interfaces
+        :type interface_type: Optional[str]
+        :param role: role played by the interfaces, e.g. 'publisher' or 'server', interfaces
+            declared with role 'both' play every role of their kind
+        :type role: Optional[str]
+        :param package_name: package declaring the interfaces
+        :type package_name: Optional[str]
+        :raises ValueError: if kind is not a known kind of interface
+        :return: matching interfaces, in the order they were indexed
+        :rtype: List[InterfaceMatch]
+        """
+        if kind is not None and kind not in _KINDS:
+            raise ValueError(f'unknown kind of interface {kind!r}, expected one of {list(_KINDS)}')
+        kinds = [kind] if kind is not None else list(_KINDS)
+
+        if name is not None:
+            matches = self._lookup(self._by_name, kinds, name, resolve=True)
+            if interface_type is not None:
+                matches = [
+                    match for match in matches if fnmatchcase(match.interface.type, interface_type)
+                ]
+        elif interface_type is not None:
+            matches = self._lookup(self._by_type, kinds, interface_type)
+        else:
+            matches = [
+                match
+                for kind in kinds
+                for indexed_matches in self._by_name[kind].values()
+                for match in indexed_matches
+            ]
+
+        if role is not None:
+            matches = [match for match in matches if _role_matches(match.interface, role)]
+        if package_name is not None:
+            matches = [match for match in matches if fnmatchcase(match.package_name, package_name)]
+        return matches
@@ -0,0 +1,101 @@
+# Copyright 2020 Canonical, Ltd.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from typing import Dict, Iterable, List, Mapping, Optional, TypeVar
+
+from nodl.errors import RemapCollisionError
+from nodl.types import NoDLInterface, Node
+
+_InterfaceT = TypeVar('_InterfaceT', bound=NoDLInterface)
+
+
+def _remap_interfaces(
+    node: Node, kind: str, interfaces: Mapping[str, _InterfaceT], remaps: Mapping[str, str]
+) -> Mapping[str, _InterfaceT]:
+    """Return interfaces with their names remapped, or interfaces itself if none is remapped.
+
+    :raises RemapCollisionError: if two interfaces end up with the same name
+    """
+    if remaps.keys().isdisjoint(interfaces):
+        return interfaces
+    remapped: Dict[str, _InterfaceT] = {}
+    original_names: Dict[str, str] = {}
+    for name, interface in interfaces.items():
+        new_name = remaps.get(name, name)
+        if new_name in remapped:
+            raise RemapCollisionError(node, kind, (original_names[new_name], name), new_name)
+        remapped[new_name] = interface.renamed(new_name)
+        original_names[new_name] = name
+    return remapped
+
+
+def remap_node(node: Node, remaps: Mapping[str, str]) -> Node:
+    """Apply remaps to the names of the actions, services and topics of a node.
+
+    The remapped node shares the interface maps left unchanged with the original node, and the
+    unchanged interfaces of the others, as nodes and interfaces are immutable. Names are matched
+    exactly, so relative names should be resolved first, see `resolve_node`, when remapping
+    fully qualified names. Parameters are not remapped.
+
+    Remapping an interface onto the name of another interface of the same kind, one that is not
+    remapped itself, or two interfaces onto the same name, is an error rather than silently
+    dropping one of them.
+
+    :param node: node to remap
+    :type node: Node
+    :param remaps: new names by original name
+    :type remaps: Mapping[str, str]
+    :raises RemapCollisionError: if two interfaces of the same kind end up with the same name
+    :return: the remapped node, the node itself if no name is remapped
+    :rtype: Node
+    """
+    changes = {}
+    for kind, interfaces in (
+        ('actions', node.actions),
+        ('services', node.services),
+        ('topics', node.topics),
+    ):
+        remapped = _remap_interfaces(node, kind, interfaces, remaps)
+        if remapped is not interfaces:
+            changes[kind] = remapped
+    return node._replace(**changes) if changes else node
+
+
+def remap_all(
+    nodes: Iterable[Node],
+    remaps: Mapping[str, str],
+    *,
+    node_remaps: Optional[Mapping[str, Mapping[str, str]]] = None,
+) -> List[Node]:
+    """Apply the remaps of a whole launch description to nodes in a single pass.
+
+    :param nodes: nodes to remap
+    :type nodes: Iterable[Node]
+    :param remaps: remaps applying to all nodes
+    :type remaps: Mapping[str, str]
+    :param node_remaps: remaps applying to the nodes of a given name only, taking precedence
+        over the ones applying to all nodes
+    :type node_remaps: Optional[Mapping[str, Mapping[str, str]]]
+    :raises RemapCollisionError: if two interfaces of the same kind of a node end up with the
+        same name
+    :return: remapped nodes, in order
+    :rtype: List[Node]
+    """
+    node_remaps = node_remaps or {}
+    remapped = []
+    for node in nodes:
+        specific = node_remaps.get(node.name)
+        remapped.append(remap_node(node, {**remaps, **specific} if specific else remaps))
+    return remapped
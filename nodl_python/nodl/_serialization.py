@@ -0,0 +1,132 @@
+# Copyright 2020 Canonical, Ltd.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+# Nodes are serialized to compact JSON documents, listing each node as an array rather than an
+# object, and roles as single letter codes:
+#
+#   {"version": 1,
+#    "nodes": [["name", "executable",
+#               [["action name", "action type", "s"]],
+#               [["parameter name", "parameter type"]],
+#               [["service name", "service type", "c"]],
+#               [["topic name", "message type", "p"]]]]}
+
+import json
+from typing import Any, Dict, Iterable, List, Sequence, Union
+
+from nodl.errors import InvalidSerializationError
+from nodl.types import (
+    Action,
+    Node,
+    Parameter,
+    PubSubRole,
+    ServerClientRole,
+    Service,
+    Topic,
+)
+
+_FORMAT_VERSION = 1
+
+_PUB_SUB_ROLES = {'p': PubSubRole.PUBLISHER, 's': PubSubRole.SUBSCRIPTION, 'b': PubSubRole.BOTH}
+_SERVER_CLIENT_ROLES = {
+    's': ServerClientRole.SERVER,
+    'c': ServerClientRole.CLIENT,
+    'b': ServerClientRole.BOTH,
+}
+_PUB_SUB_CODES: Dict[Union[PubSubRole, ServerClientRole], str] = {
+    role: code for code, role in _PUB_SUB_ROLES.items()
+}
+_SERVER_CLIENT_CODES: Dict[Union[PubSubRole, ServerClientRole], str] = {
+    role: code for code, role in _SERVER_CLIENT_ROLES.items()
+}
+
+
+def _encode_node(node: Node) -> List[Any]:
+    return [
+        node.name,
+        node.executable,
+        [
+            [action.name, action.type, _SERVER_CLIENT_CODES[action.role]]
+            for action in node.actions.values()
+        ],
+        [[parameter.name, parameter.type] for parameter in node.parameters.values()],
+        [
+            [service.name, service.type, _SERVER_CLIENT_CODES[service.role]]
+            for service in node.services.values()
+        ],
+        [[topic.name, topic.type, _PUB_SUB_CODES[topic.role]] for topic in node.topics.values()],
+    ]
+
+
+def _decode_node(record: Sequence[Any]) -> Node:
+    node_name, executable, actions, parameters, services, topics = record
+    return Node(
+        name=node_name,
+        executable=executable,
+        actions=[
+            Action(name=name, action_type=action_type, role=_SERVER_CLIENT_ROLES[role])
+            for name, action_type, role in actions
+        ],
+        parameters=[
+            Parameter(name=name, parameter_type=parameter_type)
+            for name, parameter_type in parameters
+        ],
+        services=[
+            Service(name=name, service_type=service_type, role=_SERVER_CLIENT_ROLES[role])
+            for name, service_type, role in services
+        ],
+        topics=[
+            Topic(name=name, message_type=message_type, role=_PUB_SUB_ROLES[role])
+            for name, message_type, role in topics
+        ],
+    )
+
+
+def dumps(nodes: Iterable[Node]) -> str:
+    """Serialize nodes to a compact JSON document, to be read back with `loads`.
+
+    Unlike `Node.to_dict`, interfaces are encoded as arrays and roles as single letter codes,
+    making documents about half the size and faster to encode and decode.
+
+    :param nodes: nodes to serialize
+    :type nodes: Iterable[Node]
+    :return: the JSON document
+    :rtype: str
+    """
+    return json.dumps(
+        {'version': _FORMAT_VERSION, 'nodes': [_encode_node(node) for node in nodes]},
+        ensure_ascii=False,
+        separators=(',', ':'),
+    )
+
+
+def loads(document: Union[str, bytes]) -> List[Node]:
+    """Read nodes back from a document written by `dumps`.
+
+    :param document: the JSON document
+    :type document: Union[str, bytes]
+    :raises InvalidSerializationError: if the document is not one this version can read
+    :return: the nodes, in order
+    :rtype: List[Node]
+    """
+    try:
+        data: Dict[str, Any] = json.loads(document)
+        if data['version'] != _FORMAT_VERSION:
+            raise InvalidSerializationError(
+                f'unsupported version {data["version"]}, expected {_FORMAT_VERSION}'
+            )
+        return [_decode_node(record) for record in data['nodes']]
+    except (ValueError, KeyError, TypeError) as e:
+        raise InvalidSerializationError(f'invalid serialized nodes: {e!r}') from e
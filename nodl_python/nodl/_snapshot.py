@@ -0,0 +1,263 @@
+# Copyright 2020 Canonical, Ltd.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Compiled NoDL snapshots are a flat, little-endian binary encoding of the nodes parsed from a
+# NoDL file, meant to be memory mapped and decoded without any XML parsing or schema validation:
+#
+#   header      magic, format version, string count, node count, offset of the string data
+#   strings     (offset, length) of each string in the string data, all names and types of the
+#               snapshot are stored once and referred to by index
+#   nodes       per node: name, executable, then the number of actions, parameters, services
+#               and topics, followed by one record per interface of these kinds in that order:
+#               name, type and, for everything but parameters, a role code
+#   string data utf-8 encoded strings
+
+import mmap
+import os
+from pathlib import Path
+import struct
+import tempfile
+from typing import Dict, List, Optional, Sequence, Union
+
+from nodl._constants import _FILE_EXTENSION
+from nodl.errors import InvalidSnapshotError
+from nodl.types import (
+    Action,
+    Node,
+    Parameter,
+    PubSubRole,
+    ServerClientRole,
+    Service,
+    Topic,
+)
+
+
+_SNAPSHOT_EXTENSION = '.nodl.bin'
+_SNAPSHOT_MAGIC = b'NODLBIN\0'
+_SNAPSHOT_FORMAT_VERSION = 1
+
+_HEADER = struct.Struct('<8sIIII')
+_STRING = struct.Struct('<II')
+_NODE = struct.Struct('<IIIIII')
+_INTERFACE = struct.Struct('<II')
+_INTERFACE_WITH_ROLE = struct.Struct('<IIB')
+
+_PUB_SUB_ROLES = list(PubSubRole)
+_SERVER_CLIENT_ROLES = list(ServerClientRole)
+_ROLE_CODES: Dict[Union[PubSubRole, ServerClientRole], int] = {
+    **{role: code for code, role in enumerate(_PUB_SUB_ROLES)},
+    **{role: code for code, role in enumerate(_SERVER_CLIENT_ROLES)},
+}
+
+
+def snapshot_path(path: Union[str, Path]) -> Path:
+    """Return where the snapshot of a NoDL file is stored, next to the file itself."""
+    path = Path(path)
+    if path.name.endswith(_FILE_EXTENSION):
+        return path.with_name(path.name[:-len(_FILE_EXTENSION)] + _SNAPSHOT_EXTENSION)
+    return path.with_name(path.name + '.bin')
+
+
+def _encode(nodes: Sequence[Node]) -> bytes:
+    string_indices: Dict[str, int] = {}
+
+    def index(string: str) -> int:
+        return string_indices.setdefault(string, len(string_indices))
+
+    records = []
+    for node in nodes:
+        records.append(
+            _NODE.pack(
+                index(node.name),
+                index(node.executable),
+                len(node.actions),
+                len(node.parameters),
+                len(node.services),
+                len(node.topics),
+            )
+        )
+        for action in node.actions.values():
+            records.append(
+                _INTERFACE_WITH_ROLE.pack(
+                    index(action.name),
+                    index(action.type),
+                    _ROLE_CODES[action.role],
+                )
+            )
+        for parameter in node.parameters.values():
+            records.append(_INTERFACE.pack(index(parameter.name), index(parameter.type)))
+        for service in node.services.values():
+            records.append(
+                _INTERFACE_WITH_ROLE.pack(
+                    index(service.name),
+                    index(service.type),
+                    _ROLE_CODES[service.role],
+                )
+            )
+        for topic in node.topics.values():
+            records.append(
+                _INTERFACE_WITH_ROLE.pack(
+                    index(topic.name), index(topic.type), _ROLE_CODES[topic.role]
+                )
+            )
+
+    encoded_strings = [string.encode() for string in string_indices]
+    string_table = []
+    offset = 0
+    for encoded in encoded_strings:
+        string_table.append(_STRING.pack(offset, len(encoded)))
+        offset += len(encoded)
+
+    data_offset = _HEADER.size + len(string_table) * _STRING.size + sum(map(len, records))
+    return b''.join(
+        [
+            _HEADER.pack(
+                _SNAPSHOT_MAGIC,
+                _SNAPSHOT_FORMAT_VERSION,
+                len(encoded_strings),
+                len(nodes),
+                data_offset,
+            ),
+            *string_table,
+            *records,
+            *encoded_strings,
+        ]
+    )
+
+
+def _decode(buffer: Union[bytes, mmap.mmap]) -> List[Node]:
+    magic, version, string_count, node_count, data_offset = _HEADER.unpack_from(buffer, 0)
+    if magic != _SNAPSHOT_MAGIC:
+        raise InvalidSnapshotError('not a NoDL snapshot')
+    if version != _SNAPSHOT_FORMAT_VERSION:
+        raise InvalidSnapshotError(
+            f'unsupported snapshot version {version}, expected {_SNAPSHOT_FORMAT_VERSION}'
+        )
+
+    strings = []
+    for i in range(string_count):
+        start, length = _STRING.unpack_from(buffer, _HEADER.size + i * _STRING.size)
+        start += data_offset
+        if start + length > len(buffer):
+            raise InvalidSnapshotError('truncated string data')
+        strings.append(bytes(buffer[start:start + length]).decode())
+
+    # Node records start right after the string table
+    offset = _HEADER.size + string_count * _STRING.size
+    nodes = []
+    for _ in range(node_count):
+        name, executable, *counts = _NODE.unpack_from(buffer, offset)
+        offset += _NODE.size
+        action_count, parameter_count, service_count, topic_count = counts
+
+        actions = []
+        for _ in range(action_count):
+            name_index, type_index, role = _INTERFACE_WITH_ROLE.unpack_from(buffer, offset)
+            offset += _INTERFACE_WITH_ROLE.size
+            actions.append(
+                Action(
+                    name=strings[name_index],
+                    action_type=strings[type_index],
+                    role=_SERVER_CLIENT_ROLES[role],
+                )
+            )
+        parameters = []
+        for _ in range(parameter_count):
+            name_index, type_index = _INTERFACE.unpack_from(buffer, offset)
+            offset += _INTERFACE.size
+            parameters.append(
+                Parameter(name=strings[name_index], parameter_type=strings[type_index])
+            )
+        services = []
+        for _ in range(service_count):
+            name_index, type_index, role = _INTERFACE_WITH_ROLE.unpack_from(buffer, offset)
+            offset += _INTERFACE_WITH_ROLE.size
+            services.append(
+                Service(
+                    name=strings[name_index],
+                    service_type=strings[type_index],
+                    role=_SERVER_CLIENT_ROLES[role],
+                )
+            )
+        topics = []
+        for _ in range(topic_count):
+            name_index, type_index, role = _INTERFACE_WITH_ROLE.unpack_from(buffer, offset)
+            offset += _INTERFACE_WITH_ROLE.size
+            topics.append(
+                Topic(
+                    name=strings[name_index],
+                    message_type=strings[type_index],
+                    role=_PUB_SUB_ROLES[role],
+                )
+            )
+
+        nodes.append(
+            Node(
+                name=strings[name],
+                executable=strings[executable],
+                actions=actions,
+                parameters=parameters,
+                services=services,
+                topics=topics,
+            )
+        )
+    return nodes
+
+
+def dump(nodes: Sequence[Node], path: Union[str, Path]) -> None:
+    """Atomically write a snapshot of nodes to path.
+
+    :param nodes: nodes to write, typically all nodes parsed from a single NoDL file
+    :type nodes: Sequence[Node]
+    :param path: location of the snapshot, see `snapshot_path`
+    :type path: Union[str, Path]
+    """
+    path = Path(path)
+    with tempfile.NamedTemporaryFile(dir=path.parent, delete=False) as snapshot_file:
+        snapshot_file.write(_encode(nodes))
+    os.replace(snapshot_file.name, path)
+
+
+def load(path: Union[str, Path]) -> List[Node]:
+    """Read the nodes back from a snapshot.
+
+    :param path: location of the snapshot
+    :type path: Union[str, Path]
+    :raises InvalidSnapshotError: if the file is not a snapshot this version can read
+    :return: List of NoDL nodes present in the snapshot
+    :rtype: List[Node]
+    """
+    with open(path, 'rb') as snapshot_file:
+        try:
+            with mmap.mmap(snapshot_file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                return _decode(buffer)
+        except (ValueError, struct.error, IndexError, UnicodeDecodeError) as e:
+            raise InvalidSnapshotError(f'corrupt snapshot {path}: {e}') from e
+
+
+def load_if_fresh(path: Path) -> Optional[List[Node]]:
+    """Load the snapshot of a NoDL file if there is one at least as recent as the file itself.
+
+    :param path: location of the NoDL file
+    :type path: Path
+    :return: List of NoDL nodes present in the snapshot, None if there is no usable snapshot
+    :rtype: Optional[List[Node]]
+    """
+    snapshot = snapshot_path(path)
+    try:
+        if snapshot.stat().st_mtime_ns < path.stat().st_mtime_ns:
+            return None
+        return load(snapshot)
+    except (OSError, InvalidSnapshotError):
+        return None
@@ -0,0 +1,189 @@
+# Copyright 2020 Canonical, Ltd.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from array import array
+from collections import Counter
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+from nodl._constants import _KINDS
+from nodl.types import Node
+
+# Typecode of the code columns, unsigned integers of at least 32 bits on all common platforms
+_CODE_TYPECODE = 'I'
+
+
+class StringDictionary:
+    """Bidirectional mapping of strings to consecutive integer codes."""
+
+    def __init__(self) -> None:
+        self.values: List[str] = []
+        self._codes: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def encode(self, value: str) -> int:
+        """Return the code of a string, assigning the next free code to strings not seen yet."""
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def code(self, value: str) -> Optional[int]:
+        """Return the code of a string, None if it was never encoded."""
+        return self._codes.get(value)
+
+
+class InterfaceTable:
+    """Columnar table of interfaces of one kind, one row per interface.
+
+    Every column holds the dictionary code of a string, see `strings`. Interfaces without a role,
+    i.e. parameters, have the empty string as role. Columns are `array` objects and expose the
+    buffer protocol, so they can be wrapped by NumPy without copying, see `to_numpy`.
+    """
+
+    COLUMNS = ('node', 'executable', 'package', 'name', 'type', 'role')
+
+    def __init__(self, kind: str, strings: StringDictionary) -> None:
+        self.kind = kind
+        self.strings = strings
+        self.columns: Dict[str, array] = {
+            column: array(_CODE_TYPECODE) for column in self.COLUMNS
+        }
+
+    def __len__(self) -> int:
+        return len(self.columns['name'])
+
+    def append(
+        self, *, node: str, executable: str, package: str, name: str, type: str, role: str
+    ) -> None:
+        """Add a row."""
+        encode = self.strings.encode
+        values = (node, executable, package, name, type, role)
+        for column, value in zip(self.COLUMNS, values):
+            self.columns[column].append(encode(value))
+
+    def decode(self, column: str) -> List[str]:
+        """Return the strings of a column."""
+        values = self.strings.values
+        return [values[code] for code in self.columns[column]]
+
+    def rows(self) -> Iterator[Tuple[str, ...]]:
+        """Iterate over the decoded rows, in column order."""
+        return zip(*(self.decode(column) for column in self.COLUMNS))
+
+    def select(self, **criteria: str) -> List[int]:
+        """Return the indices of the rows whose columns equal the given strings.
+
+        Criteria are compared on codes, without decoding the columns.
+        """
+        selected: Optional[List[int]] = None
+        for column, value in criteria.items():
+            code = self.strings.code(value)
+            if code is None:
+                return []
+            codes = self.columns[column]
+            candidates = range(len(codes)) if selected is None else selected
+            selected = [row for row in candidates if codes[row] == code]
+        return list(range(len(self))) if selected is None else selected
+
+    def count_by(self, column: str) -> Dict[str, int]:
+        """Return the number of rows per distinct string of a column."""
+        values = self.strings.values
+        return {values[code]: count for code, count in Counter(self.columns[column]).items()}
+
+    def to_numpy(self) -> Dict[str, Any]:
+        """Return the columns as NumPy arrays sharing the memory of the table.
+
+        :raises ImportError: if NumPy is not installed
+        """
+        import numpy
+
+        dtype = numpy.dtype(f'u{array(_CODE_TYPECODE).itemsize}')
+        return {
+            column: numpy.frombuffer(codes, dtype=dtype) if len(codes) else numpy.empty(0, dtype)
+            for column, codes in self.columns.items()
+        }
+
+
+class NodeTable:
+    """Columnar tables of all interfaces of a set of nodes, one `InterfaceTable` per kind.
+
+    All tables share a single string dictionary, so that codes can be compared across tables,
+    e.g. to join the topics of publishers and subscriptions on name codes.
+    """
+
+    def __init__(self) -> None:
+        self.strings = StringDictionary()
+        self.tables: Dict[str, InterfaceTable] = {
+            kind: InterfaceTable(kind, self.strings) for kind in _KINDS
+        }
+
+    @property
+    def actions(self) -> InterfaceTable:
+        return self.tables['action']
+
+    @property
+    def parameters(self) -> InterfaceTable:
+        return self.tables['parameter']
+
+    @property
+    def services(self) -> InterfaceTable:
+        return self.tables['service']
+
+    @property
+    def topics(self) -> InterfaceTable:
+        return self.tables['topic']
+
+    def add_node(self, node: Node, package_name: str = '') -> None:
+        """Add a row to the table of its kind for each interface of a node."""
+        for kind, attribute in _KINDS.items():
+            table = self.tables[kind]
+            for interface in getattr(node, attribute).values():
+                role = getattr(interface, 'role', None)
+                table.append(
+                    node=node.name,
+                    executable=node.executable,
+                    package=package_name,
+                    name=interface.name,
+                    type=interface.type,
+                    role=role.value if role is not None else '',
+                )
+
+    @classmethod
+    def from_nodes(cls, nodes: Iterable[Node], package_name: str = '') -> 'NodeTable':
+        """Build tables from nodes.
+
+        Nodes are consumed one at a time, so tables can be built straight from `nodl.iterparse`
+        without holding all nodes in memory.
+
+        :param nodes: nodes to add, e.g. `nodl.iterparse(path)`
+        :type nodes: Iterable[Node]
+        :param package_name: package the nodes belong to
+        :type package_name: str
+        """
+        table = cls()
+        for node in nodes:
+            table.add_node(node, package_name)
+        return table
+
+    @classmethod
+    def from_packages(cls, packages: Mapping[str, Iterable[Node]]) -> 'NodeTable':
+        """Build tables from the nodes of several packages, e.g. `WorkspaceIndex.packages`."""
+        table = cls()
+        for package_name, nodes in packages.items():
+            for node in nodes:
+                table.add_node(node, package_name)
+        return table
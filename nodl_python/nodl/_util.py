@@ -12,12 +12,24 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import distutils.util
-
 from lxml import etree
 
 
+# Same spellings as the strtobool of the deprecated distutils
+_TRUE_STRINGS = frozenset(('y', 'yes', 't', 'true', 'on', '1'))
+_FALSE_STRINGS = frozenset(('n', 'no', 'f', 'false', 'off', '0'))
+
+
+def _strtobool(value: str) -> bool:
+    value = value.lower()
+    if value in _TRUE_STRINGS:
+        return True
+    if value in _FALSE_STRINGS:
+        return False
+    raise ValueError(f'invalid truth value {value!r}')
+
+
 def get_bool_attribute(element: etree._Element, attribute: str) -> bool:
     """Access attribute and bool conversion."""
     boolean_string = element.get(attribute, 'False')
-    return bool(distutils.util.strtobool(boolean_string))
+    return _strtobool(boolean_string)
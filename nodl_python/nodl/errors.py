@@ -12,13 +12,46 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import pickle
+from typing import Any, Dict, Optional, Tuple, Type
+
 from lxml import etree
 
 from .types import Node
 
 
+def _restore_error(
+    error_type: Type['NoDLError'], message: str, state: Dict[str, Any]
+) -> 'NoDLError':
+    error = error_type.__new__(error_type)
+    Exception.__init__(error, message)
+    error.__dict__.update(state)
+    return error
+
+
+def _is_picklable(value: Any) -> bool:
+    try:
+        pickle.dumps(value)
+    except Exception:
+        return False
+    return True
+
+
 class NoDLError(Exception):
-    """Base class for all NoDL exceptions."""
+    """Base class for all NoDL exceptions.
+
+    Errors can be pickled, e.g. to cross process boundaries, along with their attributes. lxml
+    objects cannot be pickled, so attributes holding them, like `InvalidElementError.element`,
+    are None once unpickled, the plain data attributes of the error carrying the same details.
+    """
+
+    def __reduce__(self):
+        # Subclasses build their message from arguments that are not necessarily picklable, e.g.
+        # lxml elements, so errors are restored from their message and attributes instead
+        state = {
+            name: value if _is_picklable(value) else None for name, value in self.__dict__.items()
+        }
+        return _restore_error, (type(self), str(self), state)
 
 
 class NoNoDLFilesError(NoDLError):
@@ -35,6 +68,16 @@ class DuplicateNodeError(NoDLError):
         super().__init__(f'Error: Multiple definitions of {node.name} found in {node.executable}!')
 
 
+class RemapCollisionError(NoDLError):
+    """Exception raised when remapping gives two interfaces of a node the same name."""
+
+    def __init__(self, node: 'Node', kind: str, names: Tuple[str, str], new_name: str):
+        super().__init__(
+            f'Remapping {kind} {names[0]} and {names[1]} of {node.executable} '
+            f'would name both {new_name}'
+        )
+
+
 class ExecutableNotFoundError(NoDLError):
     """Exception raised when a package is queried for an executable with no NoDL entry attached."""
 
@@ -61,11 +104,22 @@ class InvalidNoDLDocumentError(InvalidNoDLError):
     def __init__(self, invalid: etree.DocumentInvalid):
         self.invalid = invalid
         e = invalid.error_log[0]
+        self.filename: str = e.filename
+        self.line: int = e.line
+        self.column: int = e.column
         super().__init__(
             f'Error parsing NoDL from {e.filename}, line {e.line}, col {e.column}: {e.message}'
         )
 
 
+class InvalidSnapshotError(InvalidNoDLError):
+    """Error raised when a compiled NoDL snapshot cannot be read."""
+
+
+class InvalidSerializationError(InvalidNoDLError):
+    """Error raised when nodes serialized with `nodl.dumps` cannot be read."""
+
+
 class InvalidElementError(InvalidNoDLError):
     """Base class for all bad NoDL elements."""
 
@@ -75,6 +129,8 @@ class InvalidElementError(InvalidNoDLError):
             + message
         )
         self.element = element
+        self.filename: Optional[str] = element.base
+        self.line: Optional[int] = element.sourceline
 
 
 class InvalidActionError(InvalidElementError):
@@ -111,3 +167,17 @@ class UnsupportedInterfaceError(InvalidNoDLError):
 
     def __init__(self, version: int, max_version: int) -> None:
         super().__init__(f'Unsupported interface version: {version} must be <= {max_version}')
+
+
+class InvalidGraphSnapshotError(NoDLError):
+    """Error raised when a runtime graph snapshot is malformed."""
+
+    def __init__(self, message: str) -> None:
+        super().__init__(f'Invalid graph snapshot: {message}')
+
+
+class InvalidDigestManifestError(NoDLError):
+    """Error raised when a digest manifest cannot be read."""
+
+    def __init__(self, message: str) -> None:
+        super().__init__(f'Invalid digest manifest: {message}')
@@ -13,7 +13,11 @@
 # limitations under the License.
 
 from enum import Enum, unique
-from typing import Any, List, Optional, Union
+import hashlib
+import json
+import sys
+from types import MappingProxyType
+from typing import Any, ClassVar, Dict, Hashable, List, Mapping, Optional, Type, TypeVar, Union
 
 
 @unique
@@ -30,45 +34,179 @@ class ServerClientRole(Enum):
     BOTH = 'both'
 
 
+def _intern(value: str) -> str:
+    # Few distinct types are shared by many interfaces, so keep a single copy of each
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+_DataT = TypeVar('_DataT', bound='NoDLData')
+
+
 class NoDLData:
-    """Data structure base class for NoDL objects."""
+    """Data structure base class for NoDL objects.
+
+    Subclasses declare their fields in __slots__, which keeps instances free of a per-instance
+    __dict__. Public slots, in order of declaration from the base class down, make up the fields
+    shown in the representation.
+
+    Instances are immutable once constructed and hash by value, the hash being computed once.
+    """
+
+    __slots__ = ('_hash',)
+    _hash: int
+
+    def _fields(self) -> Dict[str, Any]:
+        return {
+            name: getattr(self, name)
+            for cls in reversed(type(self).__mro__)
+            for name in cls.__dict__.get('__slots__', ())
+            if not name.startswith('_')
+        }
+
+    def _plain_fields(self) -> Dict[str, Any]:
+        return {
+            name: dict(value) if isinstance(value, MappingProxyType) else value
+            for name, value in self._fields().items()
+        }
+
+    def _set(self, name: str, value: Any) -> None:
+        if isinstance(value, dict):
+            value = MappingProxyType(value)
+        object.__setattr__(self, name, value)
+
+    def _key(self) -> Hashable:
+        raise NotImplementedError
+
+    def _replace(self: _DataT, **fields: Any) -> _DataT:
+        """Return a copy with some fields replaced, sharing the values of all others."""
+        data = object.__new__(type(self))
+        data.__setstate__({**self._fields(), **fields})
+        return data
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f'{type(self).__name__} is immutable')
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f'{type(self).__name__} is immutable')
+
+    def __hash__(self) -> int:
+        try:
+            return self._hash
+        except AttributeError:
+            object.__setattr__(self, '_hash', hash((type(self), self._key())))
+            return self._hash
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Hashes are only valid within a process, so they are left out
+        return self._plain_fields()
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        for name, value in state.items():
+            self._set(name, value)
 
     def __repr__(self) -> str:
-        return str(self.__dict__)
+        return str(self._plain_fields())
 
     def __str__(self) -> str:
-        return str(self.__dict__)
+        return str(self._plain_fields())
+
+
+_InterfaceT = TypeVar('_InterfaceT', bound='NoDLInterface')
+_InterfaceWithRoleT = TypeVar('_InterfaceWithRoleT', bound='_NoDLInterfaceWithRole')
 
 
 class NoDLInterface(NoDLData):
     """Abstract base class for NoDL communication interfaces."""
 
+    __slots__ = ('name', 'type')
+    name: str
+    type: str
+
     def __init__(self, *, name: str, value_type: str) -> None:
-        self.name = name
-        self.type = value_type
+        self._set('name', name)
+        self._set('type', _intern(value_type))
+
+    def _key(self) -> Hashable:
+        return (self.name, self.type)
+
+    def renamed(self: _InterfaceT, name: str) -> _InterfaceT:
+        """Return a copy of the interface under another name, or itself if the name is unchanged.
+
+        :param name: new name of the interface
+        :type name: str
+        :return: interface of the same kind, type and role named name
+        :rtype: NoDLInterface
+        """
+        return self if name == self.name else self._replace(name=name)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the interface to plain data, the role of an interface being its value."""
+        return {'name': self.name, 'type': self.type}
+
+    @classmethod
+    def from_dict(cls: Type[_InterfaceT], data: Mapping[str, Any]) -> _InterfaceT:
+        """Build an interface back from the plain data returned by `to_dict`.
+
+        :raises KeyError: if a field is missing
+        :raises ValueError: if the role is unknown
+        """
+        interface = object.__new__(cls)
+        interface._set('name', data['name'])
+        interface._set('type', _intern(data['type']))
+        return interface
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        super().__setstate__({**state, 'type': _intern(state['type'])})
 
     def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
         return (
             (isinstance(other, type(self)) and isinstance(self, type(other)))
             and self.name == other.name
             and self.type == other.type
         )
 
+    def __hash__(self) -> int:
+        return super().__hash__()
+
 
 class _NoDLInterfaceWithRole(NoDLInterface):
     """ABC providing role to interfaces."""
 
+    __slots__ = ('role',)
+    role: Union[PubSubRole, ServerClientRole]
+    _role_type: ClassVar[Union[Type[PubSubRole], Type[ServerClientRole]]]
+
     def __init__(self, *, name: str, value_type: str, role: Union[PubSubRole, ServerClientRole]):
         super().__init__(name=name, value_type=value_type)
-        self.role = role
+        self._set('role', role)
+
+    def _key(self) -> Hashable:
+        return (self.name, self.type, self.role)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'name': self.name, 'type': self.type, 'role': self.role.value}
+
+    @classmethod
+    def from_dict(cls: Type[_InterfaceWithRoleT], data: Mapping[str, Any]) -> _InterfaceWithRoleT:
+        interface = super().from_dict(data)
+        interface._set('role', cls._role_type(data['role']))
+        return interface
 
     def __eq__(self, other: Any):
         return super().__eq__(other) and self.role == other.role
 
+    def __hash__(self) -> int:
+        return super().__hash__()
+
 
 class Action(_NoDLInterfaceWithRole):
     """Data structure for action entries in NoDL."""
 
+    __slots__ = ()
+    _role_type = ServerClientRole
+
     def __init__(self, *, name: str, action_type: str, role: ServerClientRole) -> None:
         super().__init__(name=name, value_type=action_type, role=role)
 
@@ -76,6 +214,8 @@ class Action(_NoDLInterfaceWithRole):
 class Parameter(NoDLInterface):
     """Data structure for parameter entries in NoDL."""
 
+    __slots__ = ()
+
     def __init__(self, *, name: str, parameter_type: str):
         super().__init__(name=name, value_type=parameter_type)
 
@@ -83,6 +223,9 @@ class Parameter(NoDLInterface):
 class Service(_NoDLInterfaceWithRole):
     """Data structure for service entries in NoDL."""
 
+    __slots__ = ()
+    _role_type = ServerClientRole
+
     def __init__(self, *, name: str, service_type: str, role: ServerClientRole,) -> None:
         super().__init__(name=name, value_type=service_type, role=role)
 
@@ -90,13 +233,34 @@ class Service(_NoDLInterfaceWithRole):
 class Topic(_NoDLInterfaceWithRole):
     """Data structure for topic entries in NoDL."""
 
+    __slots__ = ()
+    _role_type = PubSubRole
+
     def __init__(self, *, name: str, message_type: str, role: PubSubRole,) -> None:
         super().__init__(name=name, value_type=message_type, role=role)
 
 
+def _canonical_interfaces(interfaces: Mapping[str, NoDLInterface]) -> List[List[str]]:
+    return sorted(
+        [interface.name, interface.type]
+        + ([interface.role.value] if isinstance(interface, _NoDLInterfaceWithRole) else [])
+        for interface in interfaces.values()
+    )
+
+
 class Node(NoDLData):
     """Data structure containing all interfaces a node exposes."""
 
+    __slots__ = ('name', 'executable', 'actions', 'parameters', 'services', 'topics', '_digest')
+    name: str
+    executable: str
+    # The interface maps are read-only views
+    actions: Mapping[str, Action]
+    parameters: Mapping[str, Parameter]
+    services: Mapping[str, Service]
+    topics: Mapping[str, Topic]
+    _digest: str
+
     def __init__(
         self,
         *,
@@ -107,12 +271,93 @@ class Node(NoDLData):
         services: Optional[List[Service]] = None,
         topics: Optional[List[Topic]] = None,
     ) -> None:
-        self.name = name
-        self.executable = executable
+        self._set('name', name)
+        self._set('executable', executable)
 
-        self.actions = {action.name: action for action in actions} if actions else {}
-        self.parameters = (
-            {parameter.name: parameter for parameter in parameters} if parameters else {}
+        self._set('actions', {action.name: action for action in actions} if actions else {})
+        self._set(
+            'parameters',
+            {parameter.name: parameter for parameter in parameters} if parameters else {},
+        )
+        self._set('services', {service.name: service for service in services} if services else {})
+        self._set('topics', {topic.name: topic for topic in topics} if topics else {})
+
+    def _key(self) -> Hashable:
+        return (
+            self.name,
+            self.executable,
+            frozenset(self.actions.values()),
+            frozenset(self.parameters.values()),
+            frozenset(self.services.values()),
+            frozenset(self.topics.values()),
         )
-        self.services = {service.name: service for service in services} if services else {}
-        self.topics = {topic.name: topic for topic in topics} if topics else {}
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the node to plain data, with a list of interfaces per kind of interface."""
+        return {
+            'name': self.name,
+            'executable': self.executable,
+            'actions': [action.to_dict() for action in self.actions.values()],
+            'parameters': [parameter.to_dict() for parameter in self.parameters.values()],
+            'services': [service.to_dict() for service in self.services.values()],
+            'topics': [topic.to_dict() for topic in self.topics.values()],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> 'Node':
+        """Build a node back from the plain data returned by `to_dict`, missing kinds being empty.
+
+        :raises KeyError: if a field is missing
+        :raises ValueError: if a role is unknown
+        """
+        return cls(
+            name=data['name'],
+            executable=data['executable'],
+            actions=[Action.from_dict(action) for action in data.get('actions', ())],
+            parameters=[
+                Parameter.from_dict(parameter) for parameter in data.get('parameters', ())
+            ],
+            services=[Service.from_dict(service) for service in data.get('services', ())],
+            topics=[Topic.from_dict(topic) for topic in data.get('topics', ())],
+        )
+
+    def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
+        return (
+            (isinstance(other, type(self)) and isinstance(self, type(other)))
+            and self.name == other.name
+            and self.executable == other.executable
+            and self.actions == other.actions
+            and self.parameters == other.parameters
+            and self.services == other.services
+            and self.topics == other.topics
+        )
+
+    def __hash__(self) -> int:
+        return super().__hash__()
+
+    @property
+    def digest(self) -> str:
+        """SHA-256 hex digest of the canonical form of the node, computed once.
+
+        The canonical form lists the interfaces of each kind sorted by name, so the digest does
+        not depend on the order interfaces were declared in, and is stable across processes.
+        """
+        try:
+            return self._digest
+        except AttributeError:
+            canonical = json.dumps(
+                [
+                    self.name,
+                    self.executable,
+                    _canonical_interfaces(self.actions),
+                    _canonical_interfaces(self.parameters),
+                    _canonical_interfaces(self.services),
+                    _canonical_interfaces(self.topics),
+                ],
+                ensure_ascii=False,
+                separators=(',', ':'),
+            )
+            object.__setattr__(self, '_digest', hashlib.sha256(canonical.encode()).hexdigest())
+            return self._digest
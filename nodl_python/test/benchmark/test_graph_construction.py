@@ -0,0 +1,57 @@
+# Copyright 2020 Canonical, Ltd.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+
+from nodl._graph import ComputationGraph
+from nodl.types import Node, PubSubRole, Topic
+import pytest
+
+
+def _pipeline(node_count: int):
+    """Nodes each subscribing to the output of the previous one."""
+    return {
+        'pipeline': [
+            Node(
+                name=f'stage_{i}',
+                executable=f'stage_{i}',
+                topics=[
+                    Topic(name=f'out_{i - 1}', message_type='m', role=PubSubRole.SUBSCRIPTION),
+                    Topic(name=f'out_{i}', message_type='m', role=PubSubRole.PUBLISHER),
+                ],
+            )
+            for i in range(node_count)
+        ]
+    }
+
+
+def _build_time(node_count: int) -> float:
+    packages = _pipeline(node_count)
+    start = time.perf_counter()
+    graph = ComputationGraph(packages)
+    duration = time.perf_counter() - start
+    assert len(graph.edges) == node_count - 1
+    return duration
+
+
+@pytest.mark.benchmark
+def test_graph_construction_scales_linearly():
+    small = min(_build_time(1000) for _ in range(3))
+    large = min(_build_time(10000) for _ in range(3))
+    print(
+        f'\ngraph construction: {small * 1e3:.1f}ms (1000 nodes) -> '
+        f'{large * 1e3:.1f}ms (10000 nodes)'
+    )
+    # Pairwise comparison would take 100 times longer, leave room for noise over linear
+    assert large < small * 30
@@ -0,0 +1,60 @@
+# Copyright 2020 Canonical, Ltd.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import tracemalloc
+from typing import Callable
+
+import nodl.types
+import pytest
+
+
+class _DictTopic:
+    """Topic laid out as before slots were introduced, for comparison."""
+
+    def __init__(self, *, name: str, message_type: str, role: nodl.types.PubSubRole) -> None:
+        self.name = name
+        self.type = message_type
+        self.role = role
+
+
+def _allocated_bytes(factory: Callable[[int], object], count: int) -> int:
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        objects = [factory(i) for i in range(count)]
+        allocated = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    assert len(objects) == count
+    return allocated
+
+
+@pytest.mark.benchmark
+def test_interface_memory():
+    count = 100_000
+    message_type = 'std_msgs/msg/String'
+    role = nodl.types.PubSubRole.PUBLISHER
+    names = [f'topic_{i}' for i in range(count)]
+
+    dict_bytes = _allocated_bytes(
+        lambda i: _DictTopic(name=names[i], message_type=message_type, role=role), count
+    )
+    slotted_bytes = _allocated_bytes(
+        lambda i: nodl.types.Topic(name=names[i], message_type=message_type, role=role), count
+    )
+    print(
+        f'\n{count} topics: {dict_bytes / count:.0f} bytes each with __dict__ -> '
+        f'{slotted_bytes / count:.0f} bytes each with __slots__'
+    )
+    assert slotted_bytes < dict_bytes
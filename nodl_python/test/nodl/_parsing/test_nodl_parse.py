@@ -13,9 +13,13 @@
 # limitations under the License.
 
 
+import io
+import pickle
+
 from lxml.builder import E
 import lxml.etree as etree
 import nodl._parsing
+import nodl._parsing._v1._parsing
 import nodl.errors
 import nodl.types
 import pytest
@@ -29,7 +33,7 @@ def test__parse_element_tree(mocker):
 
     # Test that fails when no version is specified
     with pytest.raises(nodl.errors.InvalidNoDLDocumentError):
-        nodl._parsing._parsing._parse_element_tree(E.interface(E.node()))
+        nodl._parsing._parsing._parse_element_tree(etree.ElementTree(E.interface(E.node())))
 
     # Test that succeeds when interface is top level
     interface = E.interface(E.node(), version='1')
@@ -127,3 +131,150 @@ def test_parse_interface(mocker):
         assert (
             nodl._parsing._parsing._parse_interface(interface) is not None
         ), f'Missing version {version}'
+
+
+def test_iterparse_matches_parse(test_nodl_path):
+    parsed = nodl._parsing._parsing.parse(test_nodl_path)
+    streamed = list(nodl._parsing._parsing.iterparse(test_nodl_path))
+
+    assert [node.executable for node in streamed] == [node.executable for node in parsed]
+    for expected, node in zip(parsed, streamed):
+        assert node.topics == expected.topics and node.actions == expected.actions
+
+
+def test_iterparse_is_lazy(test_nodl_path):
+    # Test that a node is available before the rest of the file has been read
+    nodes = nodl._parsing._parsing.iterparse(test_nodl_path)
+    assert next(nodes).executable == 'first'
+
+
+@pytest.mark.parametrize(
+    'document, error',
+    [
+        (
+            b'<notinterface version="1"><node/></notinterface>',
+            nodl.errors.InvalidNoDLDocumentError,
+        ),
+        (b'<interface><node/></interface>', nodl.errors.InvalidNoDLDocumentError),
+        (b'<interface version="1"></interface>', nodl.errors.InvalidNoDLDocumentError),
+        (b'<interface version="1"><foo/></interface>', nodl.errors.InvalidNoDLDocumentError),
+        (
+            b'<interface version="1"><node name="a" executable="b"/></interface>',
+            nodl.errors.InvalidNoDLDocumentError,
+        ),
+        (b'<interface version="2"><node/></interface>', nodl.errors.UnsupportedInterfaceError),
+        (b'<interface version="1"><node>', nodl.errors.InvalidXMLError),
+    ],
+)
+def test_iterparse_errors(document, error):
+    with pytest.raises(error):
+        list(nodl._parsing._parsing.iterparse(io.BytesIO(document)))
+
+
+@pytest.mark.parametrize(
+    'document',
+    [
+        '<?xml version="1.0"?>\n\n<interface versio="1">\n'
+        '<node name="a" executable="b"><parameter name="p" type="int"/></node></interface>',
+        '<interface version="1">\n'
+        '<node name="a" executable="b"><parameter name="p" type="int"/></node>\n\n'
+        '<foo/></interface>',
+        '<interface version="1">\n<foo/></interface>',
+        '\n<interface version="1">\n</interface>',
+    ],
+)
+def test_iterparse_interface_errors_match_parse(tmp_path, document):
+    path = tmp_path / 'invalid.nodl.xml'
+    path.write_text(document)
+    with pytest.raises(nodl.errors.InvalidNoDLDocumentError) as parse_error:
+        nodl._parsing._parsing.parse(path)
+    with pytest.raises(nodl.errors.InvalidNoDLDocumentError) as iterparse_error:
+        list(nodl._parsing._parsing.iterparse(path))
+
+    # Test that errors point at the same file and line
+    assert str(iterparse_error.value) == str(parse_error.value)
+    assert iterparse_error.value.line == parse_error.value.line > 0
+
+
+def test_parse_validates_once(mocker, test_nodl_path):
+    interface_schema_mock = mocker.patch('nodl._parsing._parsing.interface_schema')
+    v1_schema_spy = mocker.spy(nodl._parsing._v1._parsing, 'v1_schema')
+
+    # Test that a supported document is only validated against its own version's schema
+    assert nodl._parsing._parsing.parse(test_nodl_path)
+    interface_schema_mock.assert_not_called()
+    assert v1_schema_spy.call_count == 1
+
+
+def test_parse_trusted_skips_validation(mocker, test_nodl_path):
+    v1_schema_spy = mocker.spy(nodl._parsing._v1._parsing, 'v1_schema')
+
+    nodes = nodl._parsing._parsing.parse(test_nodl_path, validate=False)
+    assert [node.executable for node in nodes] == ['first', 'second']
+    v1_schema_spy.assert_not_called()
+
+    assert len(list(nodl._parsing._parsing.iterparse(test_nodl_path, validate=False))) == 2
+    v1_schema_spy.assert_not_called()
+
+
+@pytest.fixture
+def nodl_files(tmp_path):
+    paths = []
+    for i in range(4):
+        path = tmp_path / f'{i}.nodl.xml'
+        path.write_text(
+            f'<interface version="1"><node name="node" executable="exec_{i}">'
+            '<parameter name="rate" type="int" /></node></interface>'
+        )
+        paths.append(path)
+    return paths
+
+
+@pytest.mark.parametrize('use_processes', [False, True])
+def test_parse_multiple_concurrent(nodl_files, use_processes):
+    serial = nodl._parsing._parsing._parse_multiple(paths=nodl_files)
+    concurrent = nodl._parsing._parsing._parse_multiple(
+        paths=nodl_files, jobs=4, use_processes=use_processes
+    )
+    assert [node.executable for node in concurrent] == [node.executable for node in serial]
+
+
+@pytest.mark.parametrize('use_processes', [False, True])
+def test_parse_multiple_concurrent_errors_in_order(nodl_files, use_processes):
+    nodl_files[1].write_text('<interface version="1"><foo/></interface>')
+    nodl_files[3].write_text('<interface version="1">')
+
+    with pytest.raises(nodl.errors.InvalidNoDLDocumentError) as serial_error:
+        nodl._parsing._parsing._parse_multiple(paths=nodl_files)
+    with pytest.raises(nodl.errors.InvalidNoDLDocumentError) as concurrent_error:
+        nodl._parsing._parsing._parse_multiple(
+            paths=nodl_files, jobs=4, use_processes=use_processes
+        )
+    assert str(concurrent_error.value) == str(serial_error.value)
+    assert type(concurrent_error.value) is type(serial_error.value)
+    for attribute in ('filename', 'line', 'column'):
+        assert getattr(concurrent_error.value, attribute) == getattr(serial_error.value, attribute)
+    assert concurrent_error.value.filename.endswith('1.nodl.xml')
+    # lxml objects do not survive crossing process boundaries
+    if use_processes:
+        assert concurrent_error.value.invalid is None
+    else:
+        assert isinstance(concurrent_error.value.invalid, etree.DocumentInvalid)
+
+    # Test that duplicates are reported for the same node as when parsing serially
+    nodl_files[1].write_text(nodl_files[0].read_text())
+    nodl_files[3].write_text(nodl_files[2].read_text())
+    with pytest.raises(nodl.errors.DuplicateNodeError, match='exec_0'):
+        nodl._parsing._parsing._parse_multiple(
+            paths=nodl_files, jobs=4, use_processes=use_processes
+        )
+
+
+def test_errors_pickle_with_attributes():
+    element = etree.fromstring('<interface version="1">\n<topic name="foo" /></interface>')[0]
+    error = nodl.errors.InvalidTopicError('bad topic', element)
+    restored = pickle.loads(pickle.dumps(error))
+    assert type(restored) is nodl.errors.InvalidTopicError
+    assert str(restored) == str(error)
+    assert (restored.filename, restored.line) == (error.filename, error.line) == (None, 2)
+    assert restored.element is None
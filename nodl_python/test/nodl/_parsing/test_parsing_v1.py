@@ -98,3 +98,11 @@ def test__parse_node_invalid_child():
 def test__parse_nodes(valid_nodl: etree._ElementTree):
     nodes = nodl._parsing._v1._parsing._parse_nodes(valid_nodl.getroot())
     assert len(nodes) == 2
+
+
+def test_parse_trusted_skips_validation():
+    # Test that an invalid but parseable tree is accepted when validation is disabled
+    element = E.interface(E.node(name='foo', executable='bar'), version='1')
+    with pytest.raises(errors.InvalidNoDLDocumentError):
+        nodl._parsing._v1.parse(element)
+    assert nodl._parsing._v1.parse(element, validate=False)[0].executable == 'bar'
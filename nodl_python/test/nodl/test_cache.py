@@ -0,0 +1,108 @@
+# Copyright 2020 Canonical, Ltd.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+from pathlib import Path
+import shutil
+
+import nodl._cache
+import pytest
+
+
+@pytest.fixture
+def cache_home(monkeypatch, tmp_path) -> Path:
+    monkeypatch.delenv('ROS_HOME', raising=False)
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path / 'cache'))
+    return tmp_path / 'cache'
+
+
+@pytest.fixture
+def nodl_file(tmp_path) -> Path:
+    path = tmp_path / 'test.nodl.xml'
+    shutil.copy(Path(__file__).parent / '_parsing' / 'test.nodl.xml', path)
+    return path
+
+
+def test__cache_directory(monkeypatch, cache_home):
+    assert nodl._cache._cache_directory() == cache_home / 'nodl'
+
+    # Test that ROS_HOME takes precedence
+    monkeypatch.setenv('ROS_HOME', '/ros_home')
+    assert nodl._cache._cache_directory() == Path('/ros_home/cache/nodl')
+
+
+def test_parse_cached_reuses_entry(mocker, cache_home, nodl_file):
+    parse_spy = mocker.spy(nodl._cache, 'parse')
+
+    nodes = nodl._cache.parse_cached(nodl_file)
+    assert [node.executable for node in nodes] == ['first', 'second']
+    assert parse_spy.call_count == 1
+    assert len(list((cache_home / 'nodl').iterdir())) == 1
+
+    # Test that a warm lookup does not parse
+    cached = nodl._cache.parse_cached(str(nodl_file))
+    assert [node.executable for node in cached] == ['first', 'second']
+    assert parse_spy.call_count == 1
+
+    # Test that a touched but unchanged file is revalidated by content
+    os.utime(nodl_file, ns=(0, 0))
+    nodl._cache.parse_cached(nodl_file)
+    assert parse_spy.call_count == 1
+
+
+def test_parse_cached_invalidates_on_change(mocker, cache_home, nodl_file):
+    parse_spy = mocker.spy(nodl._cache, 'parse')
+    nodl._cache.parse_cached(nodl_file)
+
+    nodl_file.write_text(nodl_file.read_text().replace('"first"', '"third"'))
+    nodes = nodl._cache.parse_cached(nodl_file)
+    assert nodes[0].executable == 'third'
+    assert parse_spy.call_count == 2
+
+
+def test_parse_cached_ignores_broken_entries(mocker, cache_home, nodl_file):
+    nodl._cache.parse_cached(nodl_file)
+    for entry in (cache_home / 'nodl').iterdir():
+        entry.write_bytes(b'garbage')
+
+    parse_spy = mocker.spy(nodl._cache, 'parse')
+    assert nodl._cache.parse_cached(nodl_file)
+    assert parse_spy.call_count == 1
+
+
+def test_parse_cached_without_writable_cache(mocker, monkeypatch, tmp_path, nodl_file):
+    (tmp_path / 'not_a_directory').touch()
+    monkeypatch.setenv('ROS_HOME', str(tmp_path / 'not_a_directory'))
+
+    assert nodl._cache.parse_cached(nodl_file)
+
+
+def test_entries_are_plain_data(cache_home, nodl_file):
+    nodes = nodl._cache.parse_cached(nodl_file)
+    (entry_path,) = (cache_home / 'nodl').iterdir()
+    entry = json.loads(entry_path.read_text())
+    assert entry['path'] == str(nodl_file.resolve())
+    assert nodl._cache._load_entry(entry_path).nodes == nodes
+
+    # Test that entries of another format version are ignored
+    entry['format_version'] = 0
+    entry_path.write_text(json.dumps(entry))
+    assert nodl._cache._load_entry(entry_path) is None
+
+
+def test_store_entry_leaves_no_temporary_files(mocker, cache_home, nodl_file):
+    mocker.patch('nodl._cache.os.replace', side_effect=OSError)
+    assert nodl._cache.parse_cached(nodl_file)
+    assert list((cache_home / 'nodl').iterdir()) == []
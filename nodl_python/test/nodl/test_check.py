@@ -0,0 +1,183 @@
+# Copyright 2020 Canonical, Ltd.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import nodl
+from nodl._check import check_snapshot, Discrepancy, load_graph_snapshot
+import nodl.errors
+from nodl.types import Action, Node, Parameter, PubSubRole, ServerClientRole, Service, Topic
+import pytest
+
+
+STRING = 'std_msgs/msg/String'
+
+
+@pytest.fixture
+def nodes():
+    return [
+        Node(
+            name='talker',
+            executable='talker',
+            topics=[
+                Topic(name='chatter', message_type=STRING, role=PubSubRole.PUBLISHER),
+                Topic(name='/status', message_type=STRING, role=PubSubRole.BOTH),
+                Topic(name='~/debug', message_type=STRING, role=PubSubRole.PUBLISHER),
+            ],
+            services=[
+                Service(
+                    name='reset', service_type='std_srvs/srv/Empty', role=ServerClientRole.SERVER
+                )
+            ],
+            actions=[
+                Action(
+                    name='fibonacci',
+                    action_type='example_interfaces/action/Fibonacci',
+                    role=ServerClientRole.CLIENT,
+                )
+            ],
+            parameters=[Parameter(name='rate', parameter_type='double')],
+        )
+    ]
+
+
+def running_talker(**endpoints):
+    return {
+        'name': '/robot/talker',
+        'publishers': [
+            {'name': '/robot/chatter', 'type': 'std_msgs/msg/String'},
+            {'name': '/status', 'type': ['std_msgs/msg/String']},
+            {'name': '/robot/talker/debug', 'type': 'std_msgs/msg/String'},
+            {'name': '/rosout', 'type': 'rcl_interfaces/msg/Log'},
+        ],
+        'service_servers': [
+            {'name': '/robot/reset', 'type': 'std_srvs/srv/Empty'},
+            {'name': '/robot/talker/get_parameters', 'type': 'rcl_interfaces/srv/GetParameters'},
+        ],
+        'action_clients': [
+            {'name': '/robot/fibonacci', 'type': 'example_interfaces/action/Fibonacci'}
+        ],
+        **endpoints,
+    }
+
+
+def test_conforming(nodes):
+    result = check_snapshot(nodes, {'nodes': [running_talker()]})
+    assert not result.has_discrepancies
+    assert result.undeclared == result.unused == result.unknown_nodes == []
+    assert result.ambiguous_nodes == []
+
+
+def test_undeclared_and_unused(nodes):
+    snapshot = {
+        'nodes': [
+            running_talker(
+                publishers=[{'name': '/robot/extra', 'type': 'std_msgs/msg/Int32'}],
+                subscriptions=[{'name': '/status', 'type': 'std_msgs/msg/String'}],
+            ),
+            {'name': '/stranger', 'publishers': []},
+        ]
+    }
+
+    result = check_snapshot(nodes, snapshot)
+    assert result.has_discrepancies
+    assert result.undeclared == [
+        Discrepancy('/robot/talker', 'topic', '/robot/extra', 'std_msgs/msg/Int32', 'publisher')
+    ]
+    assert result.unused == [
+        Discrepancy('/robot/talker', 'topic', '/robot/chatter', STRING, 'publisher'),
+        Discrepancy('/robot/talker', 'topic', '/robot/talker/debug', STRING, 'publisher'),
+    ]
+    assert result.unknown_nodes == ['/stranger']
+
+
+def test_same_named_nodes(nodes):
+    other_talker = Node(
+        name='talker',
+        executable='talker.py',
+        topics=[Topic(name='chatter', message_type=STRING, role=PubSubRole.PUBLISHER)],
+    )
+    snapshot = {'nodes': [running_talker()]}
+
+    result = check_snapshot([*nodes, other_talker], snapshot)
+    assert not result.has_discrepancies
+    assert result.undeclared == result.unused == []
+    assert result.ambiguous_nodes == ['/robot/talker']
+
+    # The same declaration found twice, e.g. in the source and install spaces, is not ambiguous
+    result = check_snapshot([*nodes, Node.from_dict(nodes[0].to_dict())], snapshot)
+    assert not result.has_discrepancies
+
+
+def test_type_mismatch(nodes):
+    snapshot = {
+        'nodes': [
+            running_talker(
+                action_clients=[
+                    {'name': '/robot/fibonacci', 'type': 'other_interfaces/action/Fibonacci'}
+                ]
+            )
+        ]
+    }
+
+    result = check_snapshot(nodes, snapshot)
+    assert [(item.name, item.type) for item in result.undeclared] == [
+        ('/robot/fibonacci', 'other_interfaces/action/Fibonacci')
+    ]
+    assert [(item.name, item.type) for item in result.unused] == [
+        ('/robot/fibonacci', 'example_interfaces/action/Fibonacci')
+    ]
+
+
+def test_unused_both(nodes):
+    snapshot = {'nodes': [running_talker(publishers=[])]}
+
+    unused = check_snapshot(nodes, snapshot).unused
+    assert Discrepancy('/robot/talker', 'topic', '/status', STRING, 'both') in unused
+
+
+def test_ignored(nodes):
+    snapshot = {'nodes': [running_talker()]}
+
+    undeclared = check_snapshot(nodes, snapshot, ignored=()).undeclared
+    assert {item.name for item in undeclared} == {'/rosout', '/robot/talker/get_parameters'}
+
+
+def test_ignored_nodes(nodes):
+    snapshot = {
+        'nodes': [
+            running_talker(),
+            {'name': '/stranger'},
+            {'name': '/_ros2cli_daemon_0_1234'},
+            {'name': '/launch_ros_4321'},
+            {'name': '/robot/transform_listener_impl_5566'},
+        ]
+    }
+
+    result = check_snapshot(nodes, snapshot)
+    assert not result.has_discrepancies
+    assert result.unknown_nodes == ['/stranger']
+
+    result = check_snapshot(nodes, snapshot, ignored_nodes=('/stranger', '/robot/*'))
+    assert result.unknown_nodes == ['/_ros2cli_daemon_0_1234', '/launch_ros_4321']
+
+
+def test_invalid_snapshot(nodes, tmp_path):
+    with pytest.raises(nodl.errors.InvalidGraphSnapshotError):
+        check_snapshot(nodes, {'nodes': [{'publishers': []}]})
+
+    path = tmp_path / 'graph.json'
+    path.write_text('{')
+    with pytest.raises(nodl.errors.InvalidGraphSnapshotError):
+        load_graph_snapshot(path)
+    path.write_text('{"nodes": []}')
+    assert load_graph_snapshot(path) == {'nodes': []}
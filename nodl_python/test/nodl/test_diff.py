@@ -0,0 +1,106 @@
+# Copyright 2020 Canonical, Ltd.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from pathlib import Path
+
+import nodl
+from nodl._diff import ADDED, CHANGED, diff_nodes, load_nodes, REMOVED
+import nodl.errors
+from nodl.types import Node, Parameter, PubSubRole, Topic
+import pytest
+
+
+def make_node(executable='talker_exe', name='talker', topics=None, parameters=None):
+    if topics is None:
+        topics = [
+            Topic(name='chatter', message_type='std_msgs/msg/String', role=PubSubRole.PUBLISHER)
+        ]
+    if parameters is None:
+        parameters = [Parameter(name='rate', parameter_type='double')]
+    return Node(name=name, executable=executable, topics=topics, parameters=parameters)
+
+
+def test_diff_equal():
+    assert diff_nodes([make_node()], [make_node()]) == []
+
+
+def test_diff_added_removed_nodes():
+    changes = diff_nodes([make_node('old_exe')], [make_node('new_exe')])
+
+    assert [(change.executable, change.change) for change in changes] == [
+        ('old_exe', REMOVED),
+        ('new_exe', ADDED),
+    ]
+    assert {interface.change for interface in changes[0].interfaces} == {REMOVED}
+    assert {interface.change for interface in changes[1].interfaces} == {ADDED}
+
+
+def test_diff_interfaces():
+    old = make_node()
+    new = make_node(
+        name='renamed',
+        topics=[
+            Topic(name='chatter', message_type='std_msgs/msg/Int32', role=PubSubRole.BOTH),
+            Topic(name='extra', message_type='std_msgs/msg/Empty', role=PubSubRole.SUBSCRIPTION),
+        ],
+        parameters=[],
+    )
+
+    (change,) = diff_nodes([old], [new])
+    assert change.change == CHANGED
+    assert change.fields == ('name',)
+    assert [
+        (interface.kind, interface.name, interface.change, interface.fields)
+        for interface in change.interfaces
+    ] == [
+        ('parameter', 'rate', REMOVED, ()),
+        ('topic', 'chatter', CHANGED, ('type', 'role')),
+        ('topic', 'extra', ADDED, ()),
+    ]
+    assert change.interfaces[1].old == old.topics['chatter']
+    assert change.interfaces[1].new == new.topics['chatter']
+
+
+def test_diff_role_only():
+    old = make_node()
+    new = make_node(
+        topics=[Topic(name='chatter', message_type='std_msgs/msg/String', role=PubSubRole.BOTH)]
+    )
+
+    (change,) = diff_nodes([old], [new])
+    assert change.fields == ()
+    assert [interface.fields for interface in change.interfaces] == [('role',)]
+
+
+def test_load_nodes(mocker, monkeypatch, tmp_path):
+    monkeypatch.setenv('ROS_HOME', str(tmp_path / 'ros_home'))
+    test_nodl_path = Path(__file__).parent / '_parsing' / 'test.nodl.xml'
+
+    # Test files are parsed
+    assert load_nodes(test_nodl_path) == nodl.parse(test_nodl_path)
+
+    # Test directories are searched for NoDL files
+    directory = tmp_path / 'directory'
+    directory.mkdir()
+    with pytest.raises(nodl.errors.NoNoDLFilesError):
+        load_nodes(directory)
+    (directory / 'test.nodl.xml').write_bytes(test_nodl_path.read_bytes())
+    assert load_nodes(directory) == nodl.parse(test_nodl_path)
+
+    # Test anything else is a package name
+    package_mock = mocker.patch('nodl._diff._get_nodes_from_package', return_value=[])
+    assert load_nodes('foo') == []
+    package_mock.assert_called_once_with(package_name='foo', jobs=1)
+    load_nodes('foo', jobs=4)
+    package_mock.assert_called_with(package_name='foo', jobs=4)
@@ -0,0 +1,106 @@
+# Copyright 2020 Canonical, Ltd.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from pathlib import Path
+import pickle
+
+import nodl
+from nodl._digest import (
+    digest_nodes,
+    dump_manifest,
+    file_digest,
+    load_manifest,
+    package_manifest,
+)
+import nodl.errors
+from nodl.types import Node, Parameter, PubSubRole, Topic
+import pytest
+
+
+TEST_NODL = Path(__file__).parent / '_parsing' / 'test.nodl.xml'
+
+
+@pytest.fixture(autouse=True)
+def ros_home(monkeypatch, tmp_path):
+    monkeypatch.setenv('ROS_HOME', str(tmp_path / 'ros_home'))
+
+
+def make_node(topics, name='talker'):
+    return Node(
+        name=name,
+        executable='talker',
+        topics=[
+            Topic(name=topic, message_type='std_msgs/msg/String', role=PubSubRole.PUBLISHER)
+            for topic in topics
+        ],
+        parameters=[Parameter(name='rate', parameter_type='double')],
+    )
+
+
+def test_node_digest():
+    node = make_node(['foo', 'bar'])
+    assert len(node.digest) == 64
+    assert node.digest is node.digest
+
+    # Test the digest only depends on content
+    assert make_node(['bar', 'foo']).digest == node.digest
+    assert pickle.loads(pickle.dumps(node)).digest == node.digest
+    assert make_node(['foo']).digest != node.digest
+    assert make_node(['foo', 'bar'], name='listener').digest != node.digest
+    assert node._replace(name='listener').digest != node.digest
+
+
+def test_digest_nodes():
+    nodes = [make_node(['foo']), make_node(['bar'], name='listener')]
+    assert digest_nodes(nodes) == digest_nodes(reversed(nodes))
+    assert digest_nodes(nodes) != digest_nodes(nodes[:1])
+
+
+def test_file_digest(tmp_path):
+    path = tmp_path / 'test.nodl.xml'
+    path.write_bytes(TEST_NODL.read_bytes())
+    assert file_digest(path) == digest_nodes(nodl.parse(TEST_NODL))
+
+    # Test whitespace changes do not change the digest, but content changes do
+    path.write_bytes(TEST_NODL.read_bytes() + b'\n\n')
+    assert file_digest(path) == digest_nodes(nodl.parse(TEST_NODL))
+    path.write_bytes(TEST_NODL.read_bytes().replace(b'"verbose"', b'"quiet"'))
+    assert file_digest(path) != digest_nodes(nodl.parse(TEST_NODL))
+
+
+def test_package_manifest(mocker, tmp_path):
+    share = tmp_path / 'share' / 'foo'
+    (share / 'nodl').mkdir(parents=True)
+    (share / 'nodl' / 'test.nodl.xml').write_bytes(TEST_NODL.read_bytes())
+    mocker.patch('nodl._digest.get_package_share_directory', return_value=str(share))
+    mocker.patch(
+        'nodl._digest._get_nodl_files_from_package_share',
+        return_value=[share / 'nodl' / 'test.nodl.xml'],
+    )
+
+    manifest = package_manifest('foo')
+    assert manifest == {'nodl/test.nodl.xml': digest_nodes(nodl.parse(TEST_NODL))}
+
+    manifest_path = tmp_path / 'manifest.json'
+    dump_manifest(manifest, manifest_path)
+    assert load_manifest(manifest_path) == manifest
+
+
+def test_load_manifest_invalid(tmp_path):
+    path = tmp_path / 'manifest.json'
+    for content in ('not json', '{}', '{"version": 0, "files": {}}', '[]'):
+        path.write_text(content)
+        with pytest.raises(nodl.errors.InvalidDigestManifestError):
+            load_manifest(path)
@@ -0,0 +1,151 @@
+# Copyright 2020 Canonical, Ltd.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+
+from lxml import etree
+import nodl
+from nodl._graph import ComputationGraph
+from nodl.types import Action, Node, PubSubRole, ServerClientRole, Service, Topic
+import pytest
+
+
+def topic(name, role, message_type='std_msgs/msg/String'):
+    return Topic(name=name, message_type=message_type, role=role)
+
+
+@pytest.fixture
+def graph() -> ComputationGraph:
+    talker = Node(
+        name='talker',
+        executable='talker',
+        topics=[topic('chatter', PubSubRole.PUBLISHER), topic('loop', PubSubRole.BOTH)],
+        services=[
+            Service(name='reset', service_type='std_srvs/srv/Empty', role=ServerClientRole.SERVER)
+        ],
+    )
+    listener = Node(
+        name='listener',
+        executable='listener',
+        topics=[
+            topic('chatter', PubSubRole.SUBSCRIPTION),
+            topic('loop', PubSubRole.BOTH),
+            # Same name but another type, not connected
+            topic('chatter_typed', PubSubRole.SUBSCRIPTION, 'std_msgs/msg/Int32'),
+        ],
+        services=[
+            Service(name='reset', service_type='std_srvs/srv/Empty', role=ServerClientRole.CLIENT)
+        ],
+        actions=[
+            Action(
+                name='fibonacci',
+                action_type='example_interfaces/action/Fibonacci',
+                role=ServerClientRole.CLIENT,
+            )
+        ],
+    )
+    other = Node(
+        name='other',
+        executable='other',
+        topics=[topic('chatter_typed', PubSubRole.PUBLISHER)],
+        actions=[
+            Action(
+                name='fibonacci',
+                action_type='example_interfaces/action/Fibonacci',
+                role=ServerClientRole.BOTH,
+            )
+        ],
+    )
+    return ComputationGraph({'a': [talker], 'b': [listener, other]})
+
+
+def edges(graph):
+    return sorted(
+        (edge.kind, edge.name, edge.source.id, edge.target.id) for edge in graph.edges
+    )
+
+
+def test_edges(graph):
+    assert [vertex.id for vertex in graph.vertices] == ['a/talker', 'b/listener', 'b/other']
+    assert edges(graph) == [
+        ('action', '/fibonacci', 'b/other', 'b/listener'),
+        ('service', '/reset', 'a/talker', 'b/listener'),
+        ('topic', '/chatter', 'a/talker', 'b/listener'),
+        ('topic', '/loop', 'a/talker', 'b/listener'),
+        ('topic', '/loop', 'b/listener', 'a/talker'),
+    ]
+
+
+def test_resolved_names():
+    talker = Node(
+        name='talker',
+        executable='talker',
+        topics=[topic('chatter', PubSubRole.PUBLISHER), topic('~/debug', PubSubRole.PUBLISHER)],
+    )
+    listener = Node(
+        name='listener',
+        executable='listener',
+        topics=[
+            topic('/chatter', PubSubRole.SUBSCRIPTION),
+            topic('/talker/debug', PubSubRole.SUBSCRIPTION),
+            # Private to the listener, not connected
+            topic('~/chatter', PubSubRole.SUBSCRIPTION),
+        ],
+    )
+    assert edges(ComputationGraph({'a': [talker, listener]})) == [
+        ('topic', '/chatter', 'a/talker', 'a/listener'),
+        ('topic', '/talker/debug', 'a/talker', 'a/listener'),
+    ]
+
+
+def test_no_self_loops():
+    node = Node(name='echo', executable='echo', topics=[topic('echo', PubSubRole.BOTH)])
+    assert ComputationGraph({'a': [node]}).edges == []
+
+
+def test_to_json(graph):
+    content = json.loads(graph.to_json())
+    assert [vertex['id'] for vertex in content['nodes']] == ['a/talker', 'b/listener', 'b/other']
+    assert {
+        'source': 'a/talker',
+        'target': 'b/listener',
+        'kind': 'service',
+        'name': '/reset',
+        'type': 'std_srvs/srv/Empty',
+    } in content['edges']
+
+
+def test_to_dot(graph):
+    dot = graph.to_dot()
+    assert dot.startswith('digraph nodl {\n')
+    assert '  "a/talker" [label="talker"];' in dot
+    assert (
+        '  "a/talker" -> "b/listener" '
+        '[label="/chatter", kind="topic", type="std_msgs/msg/String"];'
+    ) in dot
+
+
+def test_to_graphml(graph):
+    root = etree.fromstring(graph.to_graphml().encode())
+    namespaces = {'g': 'http://graphml.graphdrawing.org/xmlns'}
+    assert [node.get('id') for node in root.iterfind('g:graph/g:node', namespaces)] == [
+        'a/talker',
+        'b/listener',
+        'b/other',
+    ]
+    assert len(root.findall('g:graph/g:edge', namespaces)) == len(graph.edges)
+
+
+def test_exported():
+    assert nodl.ComputationGraph is ComputationGraph
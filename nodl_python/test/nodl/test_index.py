@@ -12,6 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from concurrent.futures import ThreadPoolExecutor
+import os
+from pathlib import Path
+import shutil
 from typing import List
 
 import nodl._index
@@ -19,6 +23,11 @@ import nodl.errors
 import pytest
 
 
+@pytest.fixture(autouse=True)
+def clear_package_cache():
+    nodl._index.package_cache.invalidate()
+
+
 @pytest.fixture
 def tmp_share(tmp_path):
     for fname in ['a.nodl.xml', 'anodl.xml', 'b.nodl', 'bar.xml']:
@@ -32,6 +41,8 @@ def tmp_share(tmp_path):
 
 
 def test__get_nodl_files_from_package_share(mocker, tmp_share):
+    mocker.patch('nodl._index.get_resource', side_effect=LookupError)
+
     # Test gets all files recursively
     mock = mocker.patch('nodl._index.get_package_share_directory', return_value=tmp_share)
     assert (tmp_share / 'a.nodl.xml') in nodl._index._get_nodl_files_from_package_share(
@@ -43,14 +54,41 @@ def test__get_nodl_files_from_package_share(mocker, tmp_share):
         nodl._index._get_nodl_files_from_package_share(package_name='foo')
 
 
+def test__get_nodl_files_from_package_share_registered(mocker, tmp_share):
+    share_mock = mocker.patch('nodl._index.get_package_share_directory')
+    (tmp_share / 'share' / 'foo').mkdir(parents=True)
+    (tmp_share / 'share' / 'foo' / 'b.nodl.xml').touch()
+    (tmp_share / 'share' / 'foo' / 'c.nodl.xml').touch()
+
+    # Test that registered files are used without looking up the share directory
+    resource_mock = mocker.patch(
+        'nodl._index.get_resource', return_value=('b.nodl.xml\nmissing.nodl.xml\n', str(tmp_share))
+    )
+    assert nodl._index._get_nodl_files_from_package_share(package_name='foo') == [
+        tmp_share / 'share' / 'foo' / 'b.nodl.xml'
+    ]
+    share_mock.assert_not_called()
+
+    # Test that an empty resource stands for the whole share directory
+    resource_mock.return_value = ('', str(tmp_share))
+    assert len(nodl._index._get_nodl_files_from_package_share(package_name='foo')) == 2
+
+    resource_mock.return_value = ('missing.nodl.xml', str(tmp_share))
+    with pytest.raises(nodl.errors.NoNoDLFilesError):
+        nodl._index._get_nodl_files_from_package_share(package_name='foo')
+
+
 def test__get_nodes_from_package(mocker):
-    mock_package = mocker.patch('nodl._index._get_nodl_files_from_package_share')
+    mock_package = mocker.patch('nodl._index._discover_package', return_value=([], None))
     mock_parse = mocker.patch('nodl._index._parse_multiple')
 
     res = nodl._index._get_nodes_from_package(package_name='foo')
     mock_package.assert_called_with(package_name='foo')
     assert res == mock_parse.return_value
 
+    nodl._index._get_nodes_from_package(package_name='foo', jobs=4)
+    assert mock_parse.call_args.kwargs['jobs'] == 4
+
 
 @pytest.fixture
 def test_nodes(mocker) -> List[nodl.types.Node]:
@@ -61,7 +99,10 @@ def test_nodes(mocker) -> List[nodl.types.Node]:
 
 
 def test_get_node_by_executable(mocker, test_nodes):
-    mocker.patch('nodl._index._get_nodes_from_package', return_value=test_nodes)
+    mocker.patch(
+        'nodl._index._load_package',
+        return_value=nodl._index._LoadedPackage(stamped_files=[], stamp=(), nodes=test_nodes),
+    )
 
     assert (
         nodl._index.get_node_by_executable(package_name='', executable_name='bar').executable
@@ -82,3 +123,217 @@ def test_get_nodes_by_executables(mocker, test_nodes):
 
     assert 'foo' in nodes and 'bar' in nodes and len(nodes.keys()) == 2
     assert missing[0] == 'fizz'
+
+
+@pytest.fixture
+def nodl_share(mocker, monkeypatch, tmp_path) -> Path:
+    monkeypatch.setenv('ROS_HOME', str(tmp_path / 'ros_home'))
+    mocker.patch('nodl._index.get_resource', side_effect=LookupError)
+    share = tmp_path / 'share'
+    share.mkdir()
+    shutil.copy(Path(__file__).parent / '_parsing' / 'test.nodl.xml', share / 'foo.nodl.xml')
+    return share
+
+
+def test_package_cache_revalidates(mocker, nodl_share):
+    mocker.patch('nodl._index.get_package_share_directory', return_value=nodl_share)
+    load_spy = mocker.spy(nodl._index, '_load_package')
+    cache = nodl._index.PackageCache()
+
+    assert cache.get('foo').keys() == {'first', 'second'}
+    assert cache.get('foo')['first'].name == 'node_1'
+    assert load_spy.call_count == 1
+    assert cache.stats() == nodl._index.PackageCacheStats(hits=1, misses=1, size=1, max_size=128)
+
+    # Test that a changed file is picked up
+    nodl_file = nodl_share / 'foo.nodl.xml'
+    nodl_file.write_text(nodl_file.read_text().replace('"first"', '"third"'))
+    os.utime(nodl_file, ns=(0, 0))
+    assert cache.get('foo').keys() == {'third', 'second'}
+    assert load_spy.call_count == 2
+
+    # Test that an added file is picked up
+    (nodl_share / 'bar.nodl.xml').write_text(
+        '<interface version="1"><node name="n" executable="fourth">'
+        '<parameter name="p" type="int" /></node></interface>'
+    )
+    assert 'fourth' in cache.get('foo')
+    assert load_spy.call_count == 3
+
+    cache.invalidate('foo')
+    assert cache.stats().size == 0
+    cache.get('foo')
+    assert load_spy.call_count == 4
+
+    # Test that the cached nodes cannot be changed by callers
+    with pytest.raises(TypeError):
+        cache.get('foo')['first'] = cache.get('foo')['second']
+
+
+def test_package_cache_revalidates_resource(mocker, monkeypatch, tmp_path):
+    monkeypatch.setenv('ROS_HOME', str(tmp_path / 'ros_home'))
+    share = tmp_path / 'share' / 'foo'
+    share.mkdir(parents=True)
+    test_nodl = Path(__file__).parent / '_parsing' / 'test.nodl.xml'
+    shutil.copy(test_nodl, share / 'a.nodl.xml')
+    (share / 'b.nodl.xml').write_text(
+        '<interface version="1"><node name="n" executable="third">'
+        '<parameter name="p" type="int" /></node></interface>'
+    )
+    resource = nodl._index._get_resource_path(package_name='foo', prefix=str(tmp_path))
+    resource.parent.mkdir(parents=True)
+    resource.write_text('a.nodl.xml')
+    mocker.patch(
+        'nodl._index.get_resource',
+        side_effect=lambda resource_type, package_name: (resource.read_text(), str(tmp_path)),
+    )
+    cache = nodl._index.PackageCache()
+    assert cache.get('foo').keys() == {'first', 'second'}
+
+    # Test that changing the registered files is picked up
+    resource.write_text('a.nodl.xml\nb.nodl.xml')
+    os.utime(resource, ns=(0, 0))
+    assert cache.get('foo').keys() == {'first', 'second', 'third'}
+    assert cache.stats().misses == 2
+
+
+def test_package_cache_stamps_before_parsing(mocker, nodl_share):
+    mocker.patch('nodl._index.get_package_share_directory', return_value=nodl_share)
+    nodl_file = nodl_share / 'foo.nodl.xml'
+    parse_multiple = nodl._index._parse_multiple
+
+    def parse_while_editing(**kwargs):
+        nodes = parse_multiple(**kwargs)
+        nodl_file.write_text(nodl_file.read_text().replace('"first"', '"third"'))
+        os.utime(nodl_file, ns=(0, 0))
+        return nodes
+
+    mocker.patch('nodl._index._parse_multiple', side_effect=parse_while_editing)
+    cache = nodl._index.PackageCache()
+    assert cache.get('foo').keys() == {'first', 'second'}
+
+    # Test that the file edited during the parse is not considered fresh
+    mocker.patch('nodl._index._parse_multiple', side_effect=parse_multiple)
+    assert cache.get('foo').keys() == {'third', 'second'}
+
+
+def test_package_cache_is_bounded(mocker):
+    mocker.patch(
+        'nodl._index._load_package',
+        return_value=nodl._index._LoadedPackage(stamped_files=[], stamp=(), nodes=[]),
+    )
+    cache = nodl._index.PackageCache(max_size=2)
+
+    for package_name in ['foo', 'bar', 'foo', 'baz']:
+        cache.get(package_name)
+    assert cache.stats().size == 2
+    assert cache.stats().misses == 3
+
+    # Test that the least recently used package was evicted
+    cache.get('foo')
+    assert cache.stats().misses == 3
+    cache.get('bar')
+    assert cache.stats().misses == 4
+
+    cache.invalidate()
+    assert cache.stats().size == 0
+
+
+def test_package_cache_is_thread_safe(mocker, test_nodes):
+    mocker.patch(
+        'nodl._index._load_package',
+        return_value=nodl._index._LoadedPackage(stamped_files=[], stamp=(), nodes=test_nodes),
+    )
+    cache = nodl._index.PackageCache(max_size=4)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(cache.get, [f'package_{i % 8}' for i in range(200)]))
+    assert all(result.keys() == {'foo', 'bar', 'baz'} for result in results)
+    assert cache.stats().size == 4
+    assert sum(cache.stats()[:2]) == 200
+
+
+@pytest.fixture
+def workspace(mocker, monkeypatch, tmp_path) -> Path:
+    monkeypatch.setenv('ROS_HOME', str(tmp_path / 'ros_home'))
+    prefix = tmp_path / 'install'
+    for package_name in ['empty', 'foo', 'bar', 'broken']:
+        (prefix / 'share' / package_name).mkdir(parents=True)
+    shutil.copy(
+        Path(__file__).parent / '_parsing' / 'test.nodl.xml',
+        prefix / 'share' / 'foo' / 'foo.nodl.xml',
+    )
+    (prefix / 'share' / 'bar' / 'bar.nodl.xml').write_text(
+        '<interface version="1"><node name="node_1" executable="third">'
+        '<parameter name="rate" type="int" /></node></interface>'
+    )
+    (prefix / 'share' / 'broken' / 'broken.nodl.xml').write_text('<interface version="1">')
+    mocker.patch(
+        'nodl._index.get_packages_with_prefixes',
+        return_value={
+            package_name: str(prefix) for package_name in ['empty', 'foo', 'bar', 'broken']
+        },
+    )
+    mocker.patch('nodl._index.get_resources', return_value={})
+    return prefix
+
+
+@pytest.mark.parametrize('jobs', [1, 4])
+def test_workspace_index(workspace, jobs):
+    index = nodl._index.WorkspaceIndex(jobs=jobs)
+
+    assert list(index.packages) == ['bar', 'foo']
+    assert isinstance(index.errors['broken'], nodl.errors.InvalidXMLError)
+
+    node = index.get_node_by_executable(package_name='foo', executable_name='second')
+    assert node.name == 'node_2'
+    with pytest.raises(nodl.errors.ExecutableNotFoundError):
+        index.get_node_by_executable(package_name='bar', executable_name='second')
+
+    assert {node.executable for node in index.get_nodes_by_name('node_1')} == {'first', 'third'}
+    assert index.get_nodes_by_name('fizz') == []
+
+    assert len(index.get_nodes_by_package('foo')) == 2
+    with pytest.raises(nodl.errors.NoNoDLFilesError):
+        index.get_nodes_by_package('empty')
+    with pytest.raises(nodl.errors.InvalidXMLError):
+        index.get_nodes_by_package('broken')
+
+
+def test_workspace_index_jobs(mocker, workspace):
+    parse_spy = mocker.spy(nodl._index, '_parse_multiple')
+
+    # Test that jobs go to packages when there are several of them
+    nodl._index.WorkspaceIndex(jobs=4)
+    assert {call.kwargs['jobs'] for call in parse_spy.call_args_list} == {1}
+
+    # Test that jobs go to the files of a single package
+    parse_spy.reset_mock()
+    mocker.patch('nodl._index.get_packages_with_prefixes', return_value={'foo': str(workspace)})
+    assert list(nodl._index.WorkspaceIndex(jobs=4).packages) == ['foo']
+    assert [call.kwargs['jobs'] for call in parse_spy.call_args_list] == [4]
+
+
+def test_workspace_index_refresh(workspace):
+    index = nodl._index.WorkspaceIndex()
+    (workspace / 'share' / 'empty' / 'empty.nodl.xml').write_text(
+        '<interface version="1"><node name="node_3" executable="fourth">'
+        '<parameter name="rate" type="int" /></node></interface>'
+    )
+    assert 'empty' not in index.packages
+
+    index.refresh()
+    assert index.get_nodes_by_name('node_3')[0].executable == 'fourth'
+
+
+def test_workspace_index_registered(mocker, workspace):
+    mocker.patch('nodl._index.get_resources', return_value={'bar': str(workspace)})
+    mocker.patch('nodl._index.get_resource', return_value=('bar.nodl.xml', str(workspace)))
+
+    # Test that only registered packages are found without scanning share directories
+    index = nodl._index.WorkspaceIndex(registered_only=True)
+    assert list(index.packages) == ['bar']
+    nodl._index.get_packages_with_prefixes.assert_not_called()
+
+    index = nodl._index.WorkspaceIndex()
+    assert list(index.packages) == ['bar', 'foo']
@@ -0,0 +1,103 @@
+# Copyright 2020 Canonical, Ltd.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import nodl
+from nodl._names import resolve_name, resolve_node, resolve_nodes, split_node_name
+from nodl.types import Parameter, PubSubRole, ServerClientRole, Service, Topic
+import pytest
+
+
+STRING = 'std_msgs/msg/String'
+
+
+@pytest.fixture
+def node():
+    return nodl.types.Node(
+        name='talker',
+        executable='talker_exe',
+        topics=[
+            Topic(name='chatter', message_type=STRING, role=PubSubRole.PUBLISHER),
+            Topic(name='/status', message_type=STRING, role=PubSubRole.SUBSCRIPTION),
+            Topic(name='~/debug', message_type=STRING, role=PubSubRole.PUBLISHER),
+        ],
+        services=[
+            Service(name='reset', service_type='std_srvs/srv/Empty', role=ServerClientRole.SERVER)
+        ],
+        parameters=[Parameter(name='rate', parameter_type='double')],
+    )
+
+
+@pytest.mark.parametrize(
+    'name, namespace, expected',
+    [
+        ('/chatter', '/robot', '/chatter'),
+        ('chatter', '/', '/chatter'),
+        ('chatter', '/robot', '/robot/chatter'),
+        ('chatter', 'robot/', '/robot/chatter'),
+        ('foo/chatter', '/robot', '/robot/foo/chatter'),
+        ('~', '/robot', '/robot/talker'),
+        ('~/debug', '/robot', '/robot/talker/debug'),
+        ('~debug', '/', '/talker/debug'),
+    ],
+)
+def test_resolve_name(name, namespace, expected):
+    assert resolve_name(name, namespace, 'talker') == expected
+
+
+def test_resolve_name_errors():
+    with pytest.raises(ValueError):
+        resolve_name('')
+    with pytest.raises(ValueError):
+        resolve_name('~/debug', '/robot')
+
+
+def test_split_node_name():
+    assert split_node_name('/robot/talker') == ('/robot', 'talker')
+    assert split_node_name('/talker') == ('/', 'talker')
+
+
+def test_renamed(node):
+    topic = node.topics['chatter']
+    renamed = topic.renamed('/chatter')
+    assert isinstance(renamed, Topic)
+    assert (renamed.name, renamed.type, renamed.role) == ('/chatter', STRING, topic.role)
+    assert topic.name == 'chatter'
+    assert topic.renamed('chatter') is topic
+    assert hash(renamed) == hash(
+        Topic(name='/chatter', message_type=STRING, role=PubSubRole.PUBLISHER)
+    )
+
+
+def test_resolve_node(node):
+    resolved = resolve_node(node, namespace='/robot')
+    assert set(resolved.topics) == {'/robot/chatter', '/status', '/robot/talker/debug'}
+    assert set(resolved.services) == {'/robot/reset'}
+    assert resolved.parameters == node.parameters
+    assert resolved.topics['/status'] is node.topics['/status']
+    assert (resolved.name, resolved.executable) == (node.name, node.executable)
+
+    assert set(resolve_node(node, node_name='renamed').topics) == {
+        '/chatter',
+        '/status',
+        '/renamed/debug',
+    }
+    assert resolve_node(resolved) is resolved
+
+
+def test_resolve_nodes(node):
+    resolved = resolve_nodes({'foo': [node], 'bar': []}, namespace='/robot')
+    assert list(resolved) == ['foo', 'bar']
+    assert resolved['foo'] == [resolve_node(node, namespace='/robot')]
+    assert resolved['bar'] == []
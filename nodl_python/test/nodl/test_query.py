@@ -0,0 +1,164 @@
+# Copyright 2020 Canonical, Ltd.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import nodl
+from nodl._query import InterfaceIndex
+from nodl.types import Action, Node, Parameter, PubSubRole, ServerClientRole, Service, Topic
+import pytest
+
+
+@pytest.fixture
+def index() -> InterfaceIndex:
+    talker = Node(
+        name='talker',
+        executable='talker_exe',
+        topics=[
+            Topic(name='chatter', message_type='std_msgs/msg/String', role=PubSubRole.PUBLISHER),
+            Topic(name='ping', message_type='std_msgs/msg/Empty', role=PubSubRole.BOTH),
+        ],
+        parameters=[Parameter(name='rate', parameter_type='double')],
+        services=[
+            Service(
+                name='reset', service_type='std_srvs/srv/Empty', role=ServerClientRole.SERVER
+            )
+        ],
+    )
+    listener = Node(
+        name='listener',
+        executable='listener_exe',
+        topics=[
+            Topic(
+                name='chatter', message_type='std_msgs/msg/String', role=PubSubRole.SUBSCRIPTION
+            )
+        ],
+        parameters=[Parameter(name='rate', parameter_type='int')],
+        services=[
+            Service(name='reset', service_type='std_srvs/srv/Empty', role=ServerClientRole.CLIENT),
+            Service(name='clear', service_type='std_srvs/srv/Empty', role=ServerClientRole.BOTH),
+        ],
+        actions=[
+            Action(
+                name='fibonacci',
+                action_type='example_interfaces/action/Fibonacci',
+                role=ServerClientRole.SERVER,
+            )
+        ],
+    )
+    return InterfaceIndex({'talker_pkg': [talker], 'listener_pkg': [listener]})
+
+
+def names(matches):
+    return [
+        (match.package_name, match.node.name, match.kind, match.interface.name)
+        for match in matches
+    ]
+
+
+def test_find_by_name(index):
+    assert names(index.find(kind='topic', name='chatter')) == [
+        ('talker_pkg', 'talker', 'topic', 'chatter'),
+        ('listener_pkg', 'listener', 'topic', 'chatter'),
+    ]
+    assert names(index.find(name='rate')) == [
+        ('talker_pkg', 'talker', 'parameter', 'rate'),
+        ('listener_pkg', 'listener', 'parameter', 'rate'),
+    ]
+    assert index.find(kind='service', name='chatter') == []
+    assert index.find(name='missing') == []
+
+
+def test_find_by_type(index):
+    assert {match.interface.name for match in index.find(interface_type='std_srvs/srv/Empty')} == {
+        'reset',
+        'clear',
+    }
+    assert len(index.find(name='rate', interface_type='double')) == 1
+
+
+def test_find_by_role(index):
+    assert names(index.find(kind='topic', role='publisher')) == [
+        ('talker_pkg', 'talker', 'topic', 'chatter'),
+        ('talker_pkg', 'talker', 'topic', 'ping'),
+    ]
+    assert names(index.find(kind='topic', role='both')) == [
+        ('talker_pkg', 'talker', 'topic', 'ping')
+    ]
+    servers = names(index.find(role='server'))
+    assert ('listener_pkg', 'listener', 'service', 'clear') in servers
+    assert ('listener_pkg', 'listener', 'action', 'fibonacci') in servers
+    assert ('talker_pkg', 'talker', 'topic', 'ping') not in servers
+    assert index.find(kind='parameter', role='publisher') == []
+
+
+def test_find_with_patterns(index):
+    assert {match.interface.name for match in index.find(name='*e*')} == {
+        'chatter',
+        'rate',
+        'reset',
+        'clear',
+    }
+    assert {match.interface.name for match in index.find(interface_type='std_msgs/*')} == {
+        'chatter',
+        'ping',
+    }
+    assert names(index.find(name='chatter', package_name='listener_*')) == [
+        ('listener_pkg', 'listener', 'topic', 'chatter')
+    ]
+
+
+def test_find_resolved_names():
+    talker = Node(
+        name='talker',
+        executable='talker_exe',
+        topics=[
+            Topic(name='chatter', message_type='std_msgs/msg/String', role=PubSubRole.PUBLISHER),
+            Topic(name='~/debug', message_type='std_msgs/msg/String', role=PubSubRole.PUBLISHER),
+        ],
+    )
+    listener = Node(
+        name='listener',
+        executable='listener_exe',
+        topics=[
+            Topic(
+                name='/chatter', message_type='std_msgs/msg/String', role=PubSubRole.SUBSCRIPTION
+            )
+        ],
+    )
+    index = InterfaceIndex({'pkg': [talker, listener]})
+
+    expected = [
+        ('pkg', 'talker', 'topic', 'chatter'),
+        ('pkg', 'listener', 'topic', '/chatter'),
+    ]
+    assert names(index.find(name='/chatter')) == expected
+    assert names(index.find(name='chatter')) == expected
+    assert names(index.find(name='/chat*')) == expected
+    assert names(index.find(name='/talker/debug')) == [('pkg', 'talker', 'topic', '~/debug')]
+    assert index.names('topic') == ['/chatter', '/talker/debug']
+
+
+def test_find_everything(index):
+    assert len(index.find()) == 9
+    assert len(index.find(package_name='talker_pkg')) == 4
+    assert index.names('service') == ['/clear', '/reset']
+    assert index.types('parameter') == ['double', 'int']
+
+
+def test_find_unknown_kind(index):
+    with pytest.raises(ValueError):
+        index.find(kind='bogus')
+
+
+def test_exported():
+    assert nodl.InterfaceIndex is InterfaceIndex
@@ -0,0 +1,106 @@
+# Copyright 2020 Canonical, Ltd.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import pickle
+
+import nodl
+from nodl._remap import remap_all, remap_node
+import nodl.errors
+from nodl.types import Action, Node, Parameter, PubSubRole, ServerClientRole, Service, Topic
+import pytest
+
+
+STRING = 'std_msgs/msg/String'
+
+
+@pytest.fixture
+def node():
+    return Node(
+        name='talker',
+        executable='talker',
+        topics=[
+            Topic(name='chatter', message_type=STRING, role=PubSubRole.PUBLISHER),
+            Topic(name='status', message_type=STRING, role=PubSubRole.SUBSCRIPTION),
+        ],
+        services=[
+            Service(name='reset', service_type='std_srvs/srv/Empty', role=ServerClientRole.SERVER)
+        ],
+        actions=[
+            Action(
+                name='fibonacci',
+                action_type='example_interfaces/action/Fibonacci',
+                role=ServerClientRole.CLIENT,
+            )
+        ],
+        parameters=[Parameter(name='chatter', parameter_type='string')],
+    )
+
+
+def test_remap_node(node):
+    remapped = remap_node(node, {'chatter': '/robot/chatter', 'unknown': 'other'})
+    assert set(remapped.topics) == {'/robot/chatter', 'status'}
+    assert remapped.topics['/robot/chatter'] == Topic(
+        name='/robot/chatter', message_type=STRING, role=PubSubRole.PUBLISHER
+    )
+    assert remapped.topics['status'] is node.topics['status']
+    assert remapped.services is node.services
+    assert remapped.actions is node.actions
+    assert remapped.parameters is node.parameters
+    assert set(node.topics) == {'chatter', 'status'}
+    assert remapped == pickle.loads(pickle.dumps(remapped))
+    assert hash(remapped) != hash(node)
+
+
+def test_remap_node_unchanged(node):
+    assert remap_node(node, {}) is node
+    assert remap_node(node, {'unknown': 'other'}) is node
+
+
+def test_remap_all(node):
+    listener = Node(
+        name='listener',
+        executable='listener',
+        topics=[Topic(name='chatter', message_type=STRING, role=PubSubRole.SUBSCRIPTION)],
+    )
+    talker, remapped_listener, other = remap_all(
+        [node, listener, Node(name='other', executable='other')],
+        {'chatter': 'speech'},
+        node_remaps={'listener': {'chatter': 'whispers'}, 'talker': {'reset': 'clear'}},
+    )
+    assert set(talker.topics) == {'speech', 'status'}
+    assert set(talker.services) == {'clear'}
+    assert set(remapped_listener.topics) == {'whispers'}
+    assert set(other.topics) == set()
+
+
+def test_exported():
+    assert nodl.remap_node is remap_node
+    assert nodl.remap_all is remap_all
+
+
+def test_remap_collisions(node):
+    # Test swapping names is fine
+    swapped = remap_node(node, {'chatter': 'status', 'status': 'chatter'})
+    assert swapped.topics['status'].role == PubSubRole.PUBLISHER
+    assert swapped.topics['chatter'].role == PubSubRole.SUBSCRIPTION
+
+    # Test remapping onto an existing name, or two names onto one, is an error
+    for remaps in ({'chatter': 'status'}, {'chatter': 'both', 'status': 'both'}):
+        with pytest.raises(nodl.errors.RemapCollisionError) as excinfo:
+            remap_node(node, remaps)
+        assert 'chatter' in str(excinfo.value) and 'status' in str(excinfo.value)
+
+    # Test interfaces of different kinds may share a name
+    assert set(remap_node(node, {'reset': 'chatter'}).services) == {'chatter'}
@@ -0,0 +1,59 @@
+# Copyright 2020 Canonical, Ltd.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import json
+from pathlib import Path
+
+import nodl
+from nodl._serialization import dumps, loads
+import nodl.errors
+import pytest
+
+
+@pytest.fixture
+def nodes():
+    return nodl.parse(Path(__file__).parent / '_parsing' / 'test.nodl.xml')
+
+
+def test_round_trip(nodes):
+    document = dumps(nodes)
+    restored = loads(document)
+    assert restored == nodes
+    assert loads(document.encode()) == nodes
+    assert loads(dumps([])) == []
+
+    # Test roles are single letter codes, smaller than the plain data of the nodes
+    data = json.loads(document)
+    assert data['nodes'][1][2] == [
+        ['/example_action', 'example_interfaces/action/Fibonacci', 'b']
+    ]
+    assert len(document) < len(json.dumps([node.to_dict() for node in nodes]))
+
+
+def test_loads_invalid(nodes):
+    for document in (
+        'not json',
+        '[]',
+        '{"version": 0, "nodes": []}',
+        '{"version": 1, "nodes": [["node", "executable"]]}',
+        '{"version": 1, "nodes": [["node", "exe", [["a", "t", "x"]], [], [], []]]}',
+    ):
+        with pytest.raises(nodl.errors.InvalidSerializationError):
+            loads(document)
+
+
+def test_exported():
+    assert nodl.dumps is dumps
+    assert nodl.loads is loads
@@ -0,0 +1,87 @@
+# Copyright 2020 Canonical, Ltd.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+from pathlib import Path
+import shutil
+import struct
+
+import nodl
+import nodl._snapshot
+import nodl.errors
+import pytest
+
+
+@pytest.fixture
+def nodl_file(tmp_path) -> Path:
+    path = tmp_path / 'test.nodl.xml'
+    shutil.copy(Path(__file__).parent / '_parsing' / 'test.nodl.xml', path)
+    return path
+
+
+def test_snapshot_path():
+    assert nodl._snapshot.snapshot_path('/foo/bar.nodl.xml') == Path('/foo/bar.nodl.bin')
+    assert nodl._snapshot.snapshot_path(Path('bar.xml')) == Path('bar.xml.bin')
+
+
+def test_round_trip(nodl_file, tmp_path):
+    nodes = nodl.parse(nodl_file)
+    nodl._snapshot.dump(nodes, tmp_path / 'test.nodl.bin')
+
+    loaded = nodl._snapshot.load(tmp_path / 'test.nodl.bin')
+    assert loaded == nodes
+    assert [node.executable for node in loaded] == ['first', 'second']
+
+    nodl._snapshot.dump([], tmp_path / 'empty.nodl.bin')
+    assert nodl._snapshot.load(tmp_path / 'empty.nodl.bin') == []
+
+
+@pytest.mark.parametrize(
+    'contents',
+    [
+        b'',
+        b'not a snapshot, really',
+        struct.pack('<8sIIII', b'NODLBIN\0', 99, 0, 0, 0),
+        struct.pack('<8sIIII', b'NODLBIN\0', 1, 1, 1, 0),
+    ],
+)
+def test_load_invalid(tmp_path, contents):
+    (tmp_path / 'test.nodl.bin').write_bytes(contents)
+    with pytest.raises(nodl.errors.InvalidSnapshotError):
+        nodl._snapshot.load(tmp_path / 'test.nodl.bin')
+
+
+def test_parse_prefers_fresh_snapshot(mocker, nodl_file):
+    nodes = nodl.parse(nodl_file)
+    snapshot = nodl._snapshot.snapshot_path(nodl_file)
+    nodl._snapshot.dump(nodes[:1], snapshot)
+    os.utime(nodl_file, ns=(0, 0))
+
+    # Test that an up to date snapshot is loaded without parsing any xml
+    etree_parse = mocker.patch('nodl._parsing._parsing.etree.parse')
+    assert nodl.parse(nodl_file) == nodes[:1]
+    assert nodl.parse(str(nodl_file)) == nodes[:1]
+    etree_parse.assert_not_called()
+    mocker.stopall()
+
+    assert nodl.parse(nodl_file, use_snapshot=False) == nodes
+
+    # Test that stale or broken snapshots are ignored
+    os.utime(snapshot, ns=(0, 0))
+    os.utime(nodl_file)
+    assert nodl.parse(nodl_file) == nodes
+
+    snapshot.write_bytes(b'garbage')
+    os.utime(nodl_file, ns=(0, 0))
+    assert nodl.parse(nodl_file) == nodes
@@ -0,0 +1,98 @@
+# Copyright 2020 Canonical, Ltd.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from pathlib import Path
+
+import nodl
+from nodl._table import InterfaceTable, NodeTable
+import pytest
+
+
+@pytest.fixture
+def test_nodl_path() -> Path:
+    return Path(__file__).parent / '_parsing' / 'test.nodl.xml'
+
+
+@pytest.fixture
+def table(test_nodl_path) -> NodeTable:
+    return NodeTable.from_nodes(nodl.iterparse(test_nodl_path), package_name='foo')
+
+
+def test_rows_match_nodes(table, test_nodl_path):
+    nodes = nodl.parse(test_nodl_path)
+    for kind, attribute in (
+        ('action', 'actions'),
+        ('parameter', 'parameters'),
+        ('service', 'services'),
+        ('topic', 'topics'),
+    ):
+        expected = [
+            (
+                node.name,
+                node.executable,
+                'foo',
+                interface.name,
+                interface.type,
+                interface.role.value if hasattr(interface, 'role') else '',
+            )
+            for node in nodes
+            for interface in getattr(node, attribute).values()
+        ]
+        assert list(table.tables[kind].rows()) == expected
+        assert len(table.tables[kind]) == len(expected)
+
+
+def test_columns_are_shared_codes(table):
+    assert table.topics.strings is table.services.strings is table.strings
+    assert all(column.typecode == 'I' for column in table.topics.columns.values())
+
+    # Same strings have the same code in every table
+    package_code = table.strings.code('foo')
+    assert set(table.topics.columns['package']) == {package_code}
+    assert set(table.parameters.columns['package']) == {package_code}
+    assert table.strings.values[package_code] == 'foo'
+
+
+def test_select_and_count(table):
+    rows = table.topics.select(role='publisher')
+    assert [table.topics.decode('name')[row] for row in rows] == ['chatter']
+    assert table.topics.select(role='publisher', node='missing') == []
+    assert table.topics.select() == list(range(len(table.topics)))
+
+    assert table.services.count_by('type') == {'std_srvs/srv/Empty': 2}
+
+
+def test_from_packages():
+    node = nodl.types.Node(
+        name='node',
+        executable='exe',
+        parameters=[nodl.types.Parameter(name='rate', parameter_type='int')],
+    )
+    table = NodeTable.from_packages({'a': [node], 'b': [node]})
+    assert table.parameters.decode('package') == ['a', 'b']
+    assert table.parameters.decode('role') == ['', '']
+    assert len(table.topics) == 0
+
+
+def test_to_numpy(table):
+    numpy = pytest.importorskip('numpy')
+
+    columns = table.topics.to_numpy()
+    assert list(columns) == list(InterfaceTable.COLUMNS)
+    publisher_code = table.strings.code('publisher')
+    assert numpy.count_nonzero(columns['role'] == publisher_code) == 1
+
+
+def test_exported():
+    assert nodl.NodeTable is NodeTable
@@ -13,6 +13,9 @@
 # limitations under the License.
 
 
+import copy
+import pickle
+
 import nodl.types
 import pytest
 
@@ -105,3 +108,122 @@ def test_node(topic_publisher):
     assert node.executable == 'toast'
     assert node.topics[topic_publisher.name] == topic_publisher
     assert node.services[service.name] == service
+
+
+def test_slots(topic_publisher):
+    node = nodl.types.Node(name='test', executable='toast', topics=[topic_publisher])
+    for data in [node, topic_publisher]:
+        assert not hasattr(data, '__dict__')
+        with pytest.raises(AttributeError):
+            data.foo = 'bar'
+
+    # Test that representations list all fields in declaration order
+    assert repr(topic_publisher) == str(
+        {'name': 'foo', 'type': 'bar', 'role': nodl.types.PubSubRole.PUBLISHER}
+    )
+    assert list(node._fields()) == [
+        'name', 'executable', 'actions', 'parameters', 'services', 'topics'
+    ]
+
+
+def test_immutable(topic_publisher):
+    node = nodl.types.Node(name='test', executable='toast', topics=[topic_publisher])
+    with pytest.raises(AttributeError):
+        topic_publisher.name = 'bar'
+    with pytest.raises(AttributeError):
+        del node.name
+    with pytest.raises(TypeError):
+        node.topics['bar'] = topic_publisher
+
+
+def test_hash(topic_publisher):
+    also_topic_publisher = nodl.types.Topic(
+        name='foo', message_type='bar', role=nodl.types.PubSubRole.PUBLISHER
+    )
+    topic_subscription = nodl.types.Topic(
+        name='foo', message_type='bar', role=nodl.types.PubSubRole.SUBSCRIPTION
+    )
+    assert hash(also_topic_publisher) == hash(topic_publisher)
+    assert len({topic_publisher, also_topic_publisher, topic_subscription}) == 2
+
+    # Test that interfaces of different kinds never collide
+    parameter = nodl.types.Parameter(name='foo', parameter_type='bar')
+    action = nodl.types.Action(
+        name='foo', action_type='bar', role=nodl.types.ServerClientRole.SERVER
+    )
+    service = nodl.types.Service(
+        name='foo', service_type='bar', role=nodl.types.ServerClientRole.SERVER
+    )
+    assert len({parameter, action, service}) == 3
+
+
+def test_node_equality(topic_publisher):
+    node = nodl.types.Node(name='test', executable='toast', topics=[topic_publisher])
+    also_node = nodl.types.Node(
+        name='test',
+        executable='toast',
+        topics=[
+            nodl.types.Topic(name='foo', message_type='bar', role=nodl.types.PubSubRole.PUBLISHER)
+        ],
+    )
+    assert node == also_node and hash(node) == hash(also_node)
+    assert len({node, also_node}) == 1
+    assert node != nodl.types.Node(name='test', executable='toast')
+    assert node != nodl.types.Node(name='test', executable='roast', topics=[topic_publisher])
+
+
+def test_interned_strings():
+    # Build the strings at runtime so they are not shared constants
+    message_type = ''.join(['std_msgs/', 'msg/String'])
+    topic = nodl.types.Topic(
+        name='foo', message_type=message_type, role=nodl.types.PubSubRole.PUBLISHER
+    )
+    other_topic = nodl.types.Topic(
+        name='bar', message_type=''.join(['std_msgs/msg/', 'String']),
+        role=nodl.types.PubSubRole.SUBSCRIPTION,
+    )
+    assert topic.type is other_topic.type
+
+
+def test_pickle_and_copy(topic_publisher):
+    node = nodl.types.Node(name='test', executable='toast', topics=[topic_publisher])
+    hash(node)
+    for restored in [pickle.loads(pickle.dumps(node)), copy.deepcopy(node), copy.copy(node)]:
+        assert restored == node and hash(restored) == hash(node)
+        assert restored.topics['foo'].type is topic_publisher.type
+        with pytest.raises(TypeError):
+            restored.topics['bar'] = topic_publisher
+
+
+def test_to_dict_from_dict(topic_publisher):
+    action = nodl.types.Action(
+        name='foo', action_type='bar', role=nodl.types.ServerClientRole.BOTH
+    )
+    parameter = nodl.types.Parameter(name='rate', parameter_type='double')
+    assert action.to_dict() == {'name': 'foo', 'type': 'bar', 'role': 'both'}
+    assert parameter.to_dict() == {'name': 'rate', 'type': 'double'}
+    assert nodl.types.Action.from_dict(action.to_dict()) == action
+    assert nodl.types.Parameter.from_dict(parameter.to_dict()) == parameter
+
+    node = nodl.types.Node(
+        name='test',
+        executable='toast',
+        actions=[action],
+        parameters=[parameter],
+        topics=[topic_publisher],
+    )
+    data = node.to_dict()
+    assert list(data) == ['name', 'executable', 'actions', 'parameters', 'services', 'topics']
+    assert data['services'] == []
+    restored = nodl.types.Node.from_dict(data)
+    assert restored == node and hash(restored) == hash(node)
+    assert isinstance(restored.topics['foo'].role, nodl.types.PubSubRole)
+
+    # Test missing kinds are empty
+    assert nodl.types.Node.from_dict({'name': 'test', 'executable': 'toast'}) == (
+        nodl.types.Node(name='test', executable='toast')
+    )
+    with pytest.raises(KeyError):
+        nodl.types.Node.from_dict({'name': 'test'})
+    with pytest.raises(ValueError):
+        nodl.types.Topic.from_dict({'name': 'foo', 'type': 'bar', 'role': 'server'})
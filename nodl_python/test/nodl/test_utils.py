@@ -14,6 +14,7 @@
 
 from lxml import etree
 from nodl._util import get_bool_attribute
+import pytest
 
 
 def test_get_bool_attribute_except(mocker):
@@ -21,3 +22,17 @@ def test_get_bool_attribute_except(mocker):
     assert get_bool_attribute(foo, 'bar')
     foo.set('bar', 'false')
     assert not get_bool_attribute(foo, 'bar')
+
+
+def test_get_bool_attribute_spellings():
+    foo = etree.Element('foo')
+    assert not get_bool_attribute(foo, 'bar')
+    for true in ('1', 'yes', 'On', 'TRUE'):
+        foo.set('bar', true)
+        assert get_bool_attribute(foo, 'bar')
+    for false in ('0', 'no', 'Off', 'False'):
+        foo.set('bar', false)
+        assert not get_bool_attribute(foo, 'bar')
+    foo.set('bar', 'maybe')
+    with pytest.raises(ValueError):
+        get_bool_attribute(foo, 'bar')
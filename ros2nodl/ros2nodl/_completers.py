@@ -0,0 +1,78 @@
+# Copyright 2020 Canonical, Ltd.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Completers are only needed when argcomplete asks for completions, their modules are imported
+# from within the calls below so that merely building the verb parsers stays cheap.
+
+from typing import Any, Iterable
+
+
+def package_name_completer(**kwargs: Any) -> Iterable[str]:
+    from ros2pkg.api import package_name_completer
+
+    return package_name_completer(**kwargs)
+
+
+class NoDLExecutableNameCompleter:
+    """Complete the executables of the package named by another argument that have a NoDL node.
+
+    Nodes are looked up through the package cache of nodl, whose entries are backed by the
+    on-disk parse cache, so unchanged NoDL files are not parsed again on every completion.
+    """
+
+    def __init__(self, *, package_name_key: str) -> None:
+        self.package_name_key = package_name_key
+
+    def __call__(self, *, prefix: str, parsed_args: Any, **kwargs: Any) -> Iterable[str]:
+        from ament_index_python import PackageNotFoundError
+        from nodl._index import package_cache
+        from nodl.errors import NoDLError
+
+        package_name = getattr(parsed_args, self.package_name_key, None)
+        if not package_name:
+            return []
+        try:
+            nodes = package_cache.get(package_name)
+        except (PackageNotFoundError, NoDLError):
+            return []
+        already_given = set(getattr(parsed_args, 'executables', None) or [])
+        return [
+            executable
+            for executable in nodes
+            if executable.startswith(prefix) and executable not in already_given
+        ]
+
+
+class FilesCompleter:
+    """Complete file names with one of the given extensions."""
+
+    def __init__(self, *, allowednames: Iterable[str], directories: bool = True) -> None:
+        self.allowednames = list(allowednames)
+        self.directories = directories
+
+    def __call__(self, **kwargs: Any) -> Iterable[str]:
+        from argcomplete.completers import FilesCompleter
+
+        return FilesCompleter(allowednames=self.allowednames, directories=self.directories)(
+            **kwargs
+        )
+
+
+class DirectoriesCompleter:
+    """Complete directory names."""
+
+    def __call__(self, **kwargs: Any) -> Iterable[str]:
+        from argcomplete.completers import DirectoriesCompleter
+
+        return DirectoriesCompleter()(**kwargs)
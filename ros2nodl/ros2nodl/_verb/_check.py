@@ -0,0 +1,127 @@
+# Copyright 2020 Canonical, Ltd.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+import json
+import os
+from pathlib import Path
+import sys
+from typing import List
+
+import nodl
+from nodl._constants import _FILE_EXTENSION
+from ros2cli.verb import VerbExtension
+from ros2nodl._completers import FilesCompleter
+
+
+class _CheckVerb(VerbExtension):
+    """Check NoDL declarations against a snapshot of a running ROS graph."""
+
+    def add_arguments(self, parser: argparse.ArgumentParser, cli_name: None = None):
+        # Ignoring type because of https://github.com/python/typeshed/issues/1878
+        parser.add_argument(  # type: ignore
+            '-s',
+            '--snapshot',
+            type=Path,
+            required=True,
+            help='JSON snapshot of the nodes of a running system and their endpoints.',
+        ).completer = FilesCompleter(allowednames=['.json'])
+        # Ignoring type because of https://github.com/python/typeshed/issues/1878
+        parser.add_argument(  # type: ignore
+            'sources',
+            nargs='*',
+            default=[],
+            metavar='source',
+            help='NoDL files, directories or packages declaring the nodes, '
+            'defaults to all packages of the workspace.',
+        ).completer = FilesCompleter(allowednames=[_FILE_EXTENSION])
+        parser.add_argument(
+            '-i',
+            '--ignore',
+            action='append',
+            default=[],
+            metavar='PATTERN',
+            help='Glob pattern of endpoint names to ignore, besides the ones every node has.',
+        )
+        parser.add_argument(
+            '--ignore-node',
+            action='append',
+            default=[],
+            metavar='PATTERN',
+            help='Glob pattern of fully qualified node names to ignore, '
+            'besides the ones tools start.',
+        )
+        parser.add_argument(
+            '-f', '--format', choices=['text', 'json'], default='text', help='Output format.'
+        )
+        parser.add_argument(
+            '-j',
+            '--jobs',
+            type=int,
+            default=os.cpu_count() or 1,
+            help='Number of packages, or of files of a source, to load in parallel.',
+        )
+
+    def main(self, args: argparse.Namespace) -> int:
+        from ament_index_python import PackageNotFoundError
+
+        nodes: List[nodl.types.Node] = []
+        if args.sources:
+            for source in args.sources:
+                try:
+                    nodes.extend(nodl.load_nodes(source, jobs=args.jobs))
+                except (PackageNotFoundError, nodl.errors.NoDLError) as e:
+                    print(f'{source}: {e}', file=sys.stderr)
+                    return 2
+        else:
+            workspace = nodl.WorkspaceIndex(jobs=args.jobs)
+            for package_name, error in sorted(workspace.errors.items()):
+                print(f'{package_name}: {error}', file=sys.stderr)
+            for package_nodes in workspace.packages.values():
+                nodes.extend(package_nodes)
+
+        try:
+            result = nodl.check_snapshot(
+                nodes,
+                nodl.load_graph_snapshot(args.snapshot),
+                ignored=[*nodl._check.DEFAULT_IGNORED, *args.ignore],
+                ignored_nodes=[*nodl._check.DEFAULT_IGNORED_NODES, *args.ignore_node],
+            )
+        except (OSError, nodl.errors.NoDLError) as e:
+            print(f'{args.snapshot}: {e}', file=sys.stderr)
+            return 2
+
+        if args.format == 'json':
+            print(
+                json.dumps(
+                    {
+                        'undeclared': [item._asdict() for item in result.undeclared],
+                        'unused': [item._asdict() for item in result.unused],
+                        'unknown_nodes': result.unknown_nodes,
+                        'ambiguous_nodes': result.ambiguous_nodes,
+                    },
+                    indent=2,
+                )
+            )
+        else:
+            for label, items in (('undeclared', result.undeclared), ('unused', result.unused)):
+                for item in items:
+                    print(
+                        f'{item.node}: {label} {item.kind} {item.role} {item.name} [{item.type}]'
+                    )
+            for node_name in result.unknown_nodes:
+                print(f'{node_name}: no NoDL declaration')
+            for node_name in result.ambiguous_nodes:
+                print(f'{node_name}: several differing NoDL declarations, not checked')
+        return 1 if result.has_discrepancies else 0
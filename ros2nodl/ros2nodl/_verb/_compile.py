@@ -0,0 +1,78 @@
+# Copyright 2020 Canonical, Ltd.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+from pathlib import Path
+import sys
+
+import nodl
+from nodl._constants import _FILE_EXTENSION
+from ros2cli.verb import VerbExtension
+from ros2nodl._completers import DirectoriesCompleter, FilesCompleter
+
+
+class _CompileVerb(VerbExtension):
+    """Compile NoDL XML documents into binary snapshots."""
+
+    def add_arguments(self, parser: argparse.ArgumentParser, cli_name: None = None):
+        # Ignoring type because of https://github.com/python/typeshed/issues/1878
+        parser.add_argument(  # type: ignore
+            'files',
+            nargs='*',
+            default=[],
+            metavar='file',
+            help=f'Specific {_FILE_EXTENSION} file(s) to compile.',
+        ).completer = FilesCompleter(allowednames=[_FILE_EXTENSION], directories=False)
+
+        # Ignoring type because of https://github.com/python/typeshed/issues/1878
+        parser.add_argument(  # type: ignore
+            '-o',
+            '--output-directory',
+            type=Path,
+            help='Directory to write snapshots to, defaults to next to each file.',
+        ).completer = DirectoriesCompleter()
+
+    def main(self, args: argparse.Namespace) -> int:
+        if args.files:
+            paths = [Path(filename) for filename in args.files]
+        else:
+            paths = list(Path.cwd().glob('*' + _FILE_EXTENSION))
+        if not paths:
+            print('No files to compile', file=sys.stderr)
+            return 1
+
+        for path in paths:
+            if not path.is_file():
+                print(f'{path.name} is not a file')
+                return 1
+
+            snapshot = nodl._snapshot.snapshot_path(path)
+            if args.output_directory:
+                snapshot = args.output_directory / snapshot.name
+
+            print(f'Compiling {path} to {snapshot}...')
+            try:
+                nodes = nodl.parse(path=path, use_snapshot=False)
+                nodl._snapshot.dump(nodes, snapshot)
+            except nodl.errors.NoDLError as e:
+                print(f'Failed to parse {path}', file=sys.stderr)
+                print(e, file=sys.stderr)
+                return 1
+            except OSError as e:
+                print(f'Failed to write {snapshot}', file=sys.stderr)
+                print(e, file=sys.stderr)
+                return 1
+
+        print('All files compiled')
+        return 0
@@ -0,0 +1,125 @@
+# Copyright 2020 Canonical, Ltd.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+import json
+import sys
+from typing import Any, Dict, List, Optional
+
+import nodl
+from nodl._constants import _FILE_EXTENSION
+from ros2cli.verb import VerbExtension
+from ros2nodl._completers import FilesCompleter
+
+_CHANGE_SYMBOLS = {'added': '+', 'removed': '-', 'changed': '~'}
+
+
+def _interface_record(interface: Optional['nodl.types.NoDLInterface']) -> Optional[Dict[str, Any]]:
+    return interface.to_dict() if interface is not None else None
+
+
+def _change_record(change: 'nodl.NodeChange') -> Dict[str, Any]:
+    return {
+        'executable': change.executable,
+        'change': change.change,
+        'name': {
+            'old': change.old.name if change.old is not None else None,
+            'new': change.new.name if change.new is not None else None,
+        },
+        'fields': list(change.fields),
+        'interfaces': [
+            {
+                'kind': interface.kind,
+                'name': interface.name,
+                'change': interface.change,
+                'fields': list(interface.fields),
+                'old': _interface_record(interface.old),
+                'new': _interface_record(interface.new),
+            }
+            for interface in change.interfaces
+        ],
+    }
+
+
+def _describe(interface: 'nodl.types.NoDLInterface') -> str:
+    role = getattr(interface, 'role', None)
+    return f'{interface.type} {role.value}' if role is not None else interface.type
+
+
+def _field_value(interface: 'nodl.types.NoDLInterface', field: str) -> str:
+    value = getattr(interface, field)
+    # Roles are enums
+    return getattr(value, 'value', value)
+
+
+def _print_change(change: 'nodl.NodeChange') -> None:
+    node = change.new if change.new is not None else change.old
+    assert node is not None
+    print(f'{_CHANGE_SYMBOLS[change.change]} {change.executable} ({node.name})')
+    if change.change != 'changed':
+        return
+    if change.fields:
+        assert change.old is not None
+        print(f'    ~ name: {change.old.name} -> {node.name}')
+    for interface in change.interfaces:
+        symbol = _CHANGE_SYMBOLS[interface.change]
+        if interface.old is not None and interface.new is not None:
+            details = ', '.join(
+                f'{field} {_field_value(interface.old, field)} -> '
+                f'{_field_value(interface.new, field)}'
+                for field in interface.fields
+            )
+            print(f'    {symbol} {interface.kind} {interface.name}: {details}')
+        else:
+            declared = interface.new if interface.new is not None else interface.old
+            assert declared is not None
+            print(f'    {symbol} {interface.kind} {interface.name} {_describe(declared)}')
+
+
+class _DiffVerb(VerbExtension):
+    """Compare the NoDL of two files, directories or packages."""
+
+    def add_arguments(self, parser: argparse.ArgumentParser, cli_name: None = None):
+        for name in ('old', 'new'):
+            # Ignoring type because of https://github.com/python/typeshed/issues/1878
+            parser.add_argument(  # type: ignore
+                name,
+                help=f'{name.capitalize()} NoDL, a file, a directory of files or a package name.',
+            ).completer = FilesCompleter(allowednames=[_FILE_EXTENSION])
+        parser.add_argument(
+            '-f',
+            '--format',
+            choices=['text', 'json'],
+            default='text',
+            help='Output format.',
+        )
+
+    def main(self, args: argparse.Namespace) -> int:
+        from ament_index_python import PackageNotFoundError
+
+        sources: List[List[nodl.types.Node]] = []
+        for source in (args.old, args.new):
+            try:
+                sources.append(nodl.load_nodes(source))
+            except (PackageNotFoundError, nodl.errors.NoDLError) as e:
+                print(f'{source}: {e}', file=sys.stderr)
+                return 2
+
+        changes = nodl.diff_nodes(*sources)
+        if args.format == 'json':
+            print(json.dumps([_change_record(change) for change in changes], indent=2))
+        else:
+            for change in changes:
+                _print_change(change)
+        return 1 if changes else 0
@@ -0,0 +1,79 @@
+# Copyright 2020 Canonical, Ltd.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+import os
+from pathlib import Path
+import sys
+
+import nodl
+from ros2cli.verb import VerbExtension
+from ros2nodl._completers import package_name_completer
+
+_FORMATS = ['dot', 'graphml', 'json']
+
+
+class _GraphVerb(VerbExtension):
+    """Build the graph of the connections between nodes from their declared interfaces."""
+
+    def add_arguments(self, parser: argparse.ArgumentParser, cli_name: None = None):
+        parser.add_argument(
+            '-f', '--format', choices=_FORMATS, default='dot', help='Output format.'
+        )
+        parser.add_argument(
+            '-o', '--output', type=Path, help='File to write the graph to, defaults to stdout.'
+        )
+        # Ignoring type because of https://github.com/python/typeshed/issues/1878
+        parser.add_argument(  # type: ignore
+            '--packages',
+            nargs='+',
+            default=[],
+            metavar='package',
+            help='Only include the nodes of these packages, defaults to the whole workspace.',
+        ).completer = package_name_completer
+        parser.add_argument(
+            '-j',
+            '--jobs',
+            type=int,
+            default=os.cpu_count() or 1,
+            help='Number of packages to load in parallel.',
+        )
+
+    def main(self, args: argparse.Namespace) -> int:
+        workspace = nodl.WorkspaceIndex(jobs=args.jobs)
+        packages = workspace.packages
+        errors = dict(workspace.errors)
+        if args.packages:
+            packages = {name: packages[name] for name in args.packages if name in packages}
+            errors = {
+                name: errors.get(name, nodl.errors.NoNoDLFilesError(name))
+                for name in args.packages
+                if name not in packages
+            }
+        for package_name, error in sorted(errors.items()):
+            print(f'{package_name}: {error}', file=sys.stderr)
+
+        graph = nodl.ComputationGraph(packages)
+        output = {
+            'dot': graph.to_dot,
+            'graphml': graph.to_graphml,
+            'json': graph.to_json,
+        }[args.format]()
+        if not output.endswith('\n'):
+            output += '\n'
+        if args.output:
+            args.output.write_text(output)
+        else:
+            print(output, end='')
+        return 1 if errors else 0
@@ -0,0 +1,91 @@
+# Copyright 2020 Canonical, Ltd.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+import os
+import sys
+
+import nodl
+from nodl._constants import _KINDS
+from ros2cli.verb import VerbExtension
+from ros2nodl._completers import package_name_completer
+
+
+_ROLES = ['publisher', 'subscription', 'server', 'client', 'both']
+
+
+def _format_match(match: 'nodl.InterfaceMatch') -> str:
+    role = getattr(match.interface, 'role', None)
+    return ' '.join(
+        [
+            f'{match.package_name}/{match.node.executable}',
+            match.node.name,
+            match.kind,
+            match.interface.name,
+            match.interface.type,
+            *([role.value] if role is not None else []),
+        ]
+    )
+
+
+class _QueryVerb(VerbExtension):
+    """Find the nodes declaring interfaces."""
+
+    def add_arguments(self, parser: argparse.ArgumentParser, cli_name: None = None):
+        parser.add_argument(
+            '-k', '--kind', choices=list(_KINDS), help='Kind of interface to find.'
+        )
+        parser.add_argument('-n', '--name', help='Name of the interface, may be a glob pattern.')
+        parser.add_argument(
+            '-t',
+            '--type',
+            dest='interface_type',
+            help='Type of the interface, may be a glob pattern.',
+        )
+        parser.add_argument(
+            '-r',
+            '--role',
+            choices=_ROLES,
+            help='Role of the interface, interfaces declared with role both match any role.',
+        )
+        # Ignoring type because of https://github.com/python/typeshed/issues/1878
+        parser.add_argument(  # type: ignore
+            '-p',
+            '--package',
+            dest='package_name',
+            help='Package declaring the interface, may be a glob pattern.',
+        ).completer = package_name_completer
+        parser.add_argument(
+            '-j',
+            '--jobs',
+            type=int,
+            default=os.cpu_count() or 1,
+            help='Number of packages to load in parallel.',
+        )
+
+    def main(self, args: argparse.Namespace) -> int:
+        workspace = nodl.WorkspaceIndex(jobs=args.jobs)
+        for package_name, error in sorted(workspace.errors.items()):
+            print(f'{package_name}: {error}', file=sys.stderr)
+
+        matches = nodl.InterfaceIndex(workspace.packages).find(
+            kind=args.kind,
+            name=args.name,
+            interface_type=args.interface_type,
+            role=args.role,
+            package_name=args.package_name,
+        )
+        for match in matches:
+            print(_format_match(match))
+        return 0 if matches else 1
@@ -13,14 +13,110 @@
 # limitations under the License.
 
 import argparse
+import json
+import os
 import pprint
 import shutil
 import sys
+from typing import Any, Dict, Iterator, List, Tuple, Type, Union
 
 import nodl
 from ros2cli.verb import VerbExtension
-from ros2pkg.api import package_name_completer, PackageNotFoundError
-from ros2run.api import ExecutableNameCompleter
+from ros2nodl._completers import NoDLExecutableNameCompleter, package_name_completer
+
+
+def _node_record(node: nodl.types.Node, package_name: str) -> Dict[str, Any]:
+    """Convert a node to plain data with a stable field order, for machine readable output."""
+    return {'package': package_name, **node.to_dict()}
+
+
+class _Writer:
+    """Write nodes to stdout as they are produced."""
+
+    def begin_package(self, package_name: str) -> None:
+        """Start the group of nodes of a package, when showing more than one package."""
+
+    def write(self, node: nodl.types.Node, package_name: str) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Terminate the output once all nodes are written."""
+
+
+class _PrettyWriter(_Writer):
+    def begin_package(self, package_name: str) -> None:
+        print(f'=== {package_name} ===')
+
+    def write(self, node: nodl.types.Node, package_name: str) -> None:
+        pprint.pprint(node, width=shutil.get_terminal_size()[0])
+
+
+class _JsonWriter(_Writer):
+    """Write nodes as the elements of a JSON array, one element at a time."""
+
+    def __init__(self) -> None:
+        self._separator = '[\n'
+
+    def write(self, node: nodl.types.Node, package_name: str) -> None:
+        print(self._separator + json.dumps(_node_record(node, package_name)), end='', flush=True)
+        self._separator = ',\n'
+
+    def close(self) -> None:
+        print('[]' if self._separator == '[\n' else '\n]', flush=True)
+
+
+class _NdjsonWriter(_Writer):
+    def write(self, node: nodl.types.Node, package_name: str) -> None:
+        print(json.dumps(_node_record(node, package_name)), flush=True)
+
+
+class _YamlWriter(_Writer):
+    """Write nodes as a stream of YAML documents."""
+
+    def write(self, node: nodl.types.Node, package_name: str) -> None:
+        import yaml
+
+        print(
+            yaml.safe_dump(
+                _node_record(node, package_name), explicit_start=True, sort_keys=False
+            ),
+            end='',
+            flush=True,
+        )
+
+
+_WRITERS: Dict[str, Type[_Writer]] = {
+    'pretty': _PrettyWriter,
+    'json': _JsonWriter,
+    'ndjson': _NdjsonWriter,
+    'yaml': _YamlWriter,
+}
+
+_PackageResult = Union[List[nodl.types.Node], Exception]
+
+
+def _load_package(package_name: str, jobs: int = 1) -> _PackageResult:
+    from ament_index_python import PackageNotFoundError
+
+    try:
+        return nodl._index._get_nodes_from_package(package_name=package_name, jobs=jobs)
+    except (PackageNotFoundError, nodl.errors.NoDLError) as e:
+        return e
+
+
+def _load_packages(
+    package_names: List[str], jobs: int
+) -> Iterator[Tuple[str, _PackageResult]]:
+    """Load packages concurrently, yielding them in the order they were given."""
+    if jobs <= 1 or len(package_names) <= 1:
+        # A single package gets the jobs for its files
+        for package_name in package_names:
+            yield package_name, _load_package(package_name, jobs)
+        return
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        yield from zip(package_names, executor.map(_load_package, package_names))
 
 
 class _ShowVerb(VerbExtension):
@@ -29,7 +125,7 @@ class _ShowVerb(VerbExtension):
     def add_arguments(self, parser: argparse.ArgumentParser, cli_name: None = None):
         # Ignoring type because of https://github.com/python/typeshed/issues/1878
         parser.add_argument(  # type: ignore
-            'package_name', help='Name of the package to show.'
+            'package_name', nargs='?', help='Name of the package to show.'
         ).completer = package_name_completer
 
         # Ignoring type because of https://github.com/python/typeshed/issues/1878
@@ -39,9 +135,49 @@ class _ShowVerb(VerbExtension):
             default=[],
             metavar='executable',
             help='Specific Executable to display.',
-        ).completer = ExecutableNameCompleter(package_name_key='package_name')
+        ).completer = NoDLExecutableNameCompleter(package_name_key='package_name')
+
+        parser.add_argument(
+            '-f',
+            '--format',
+            choices=list(_WRITERS),
+            default='pretty',
+            help='Output format, machine readable formats write one record per node.',
+        )
+
+        # Ignoring type because of https://github.com/python/typeshed/issues/1878
+        parser.add_argument(  # type: ignore
+            '--packages',
+            nargs='+',
+            default=[],
+            metavar='package',
+            help='Show several packages instead of a single one.',
+        ).completer = package_name_completer
+        parser.add_argument(
+            '-a',
+            '--all',
+            action='store_true',
+            help='Show every package of the workspace that exports NoDL.',
+        )
+        parser.add_argument(
+            '-j',
+            '--jobs',
+            type=int,
+            default=os.cpu_count() or 1,
+            help='Number of packages, or of files of a single package, to load in parallel.',
+        )
 
     def main(self, args: argparse.Namespace) -> int:
+        if sum((args.package_name is not None, bool(args.packages), args.all)) != 1:
+            print('Give exactly one of a package name, --packages or --all', file=sys.stderr)
+            return 1
+        if args.packages:
+            return self._show_packages(args)
+        if args.all:
+            return self._show_all(args)
+
+        from ament_index_python import PackageNotFoundError
+
         package = args.package_name
 
         nodes_to_show = []
@@ -59,11 +195,42 @@ class _ShowVerb(VerbExtension):
                 )
         else:
             try:
-                nodes_to_show = nodl._index._get_nodes_from_package(package_name=package)
+                nodes_to_show = nodl._index._get_nodes_from_package(
+                    package_name=package, jobs=args.jobs
+                )
             except (PackageNotFoundError, nodl.errors.NoDLError) as e:
                 print(e, file=sys.stderr)
                 return 1
 
+        writer = _WRITERS[args.format]()
         for node in nodes_to_show:
-            pprint.pprint(node, width=shutil.get_terminal_size()[0])
+            writer.write(node, package)
+        writer.close()
         return 0
+
+    def _show_packages(self, args: argparse.Namespace) -> int:
+        failed = False
+        writer = _WRITERS[args.format]()
+        for package_name, result in _load_packages(args.packages, args.jobs):
+            if isinstance(result, Exception):
+                print(result, file=sys.stderr)
+                failed = True
+                continue
+            writer.begin_package(package_name)
+            for node in result:
+                writer.write(node, package_name)
+        writer.close()
+        return 1 if failed else 0
+
+    def _show_all(self, args: argparse.Namespace) -> int:
+        index = nodl.WorkspaceIndex(jobs=args.jobs)
+        for package_name, error in sorted(index.errors.items()):
+            print(f'{package_name}: {error}', file=sys.stderr)
+
+        writer = _WRITERS[args.format]()
+        for package_name, nodes in sorted(index.packages.items()):
+            writer.begin_package(package_name)
+            for node in nodes:
+                writer.write(node, package_name)
+        writer.close()
+        return 1 if index.errors else 0
@@ -13,15 +13,112 @@
 # limitations under the License.
 
 import argparse
+import json
 from pathlib import Path
 import pprint
 import shutil
 import sys
+import time
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
 
-from argcomplete.completers import FilesCompleter
 import nodl
-from nodl._index import _FILE_EXTENSION
+from nodl._constants import _FILE_EXTENSION
 from ros2cli.verb import VerbExtension
+from ros2nodl._completers import FilesCompleter
+
+
+class _ValidationResult(NamedTuple):
+    path: Path
+    nodes: List[nodl.types.Node]
+    error: Optional[str]
+    duration: float
+
+
+def _validate_file(path: Path) -> _ValidationResult:
+    start = time.perf_counter()
+    nodes: List[nodl.types.Node] = []
+    error = None
+    try:
+        nodes = nodl.parse(path=path, use_snapshot=False)
+    except nodl.errors.NoDLError as e:
+        error = str(e)
+    return _ValidationResult(
+        path=path, nodes=nodes, error=error, duration=time.perf_counter() - start
+    )
+
+
+def _validate_concurrently(paths: List[Path], jobs: int) -> Iterator[_ValidationResult]:
+    """Validate files in a thread pool, yielding results in input order."""
+    from concurrent.futures import Future, ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        futures: List[Future] = [executor.submit(_validate_file, path) for path in paths]
+        try:
+            for future in futures:
+                yield future.result()
+        finally:
+            # Stop validating files nobody is waiting for anymore
+            for future in futures:
+                future.cancel()
+
+
+def _write_json_report(results: List[_ValidationResult], path: Path) -> None:
+    report = {
+        'files': [
+            {
+                'path': str(result.path),
+                'success': result.error is None,
+                'error': result.error,
+                'duration': result.duration,
+            }
+            for result in results
+        ],
+        'failures': sum(result.error is not None for result in results),
+        'duration': sum(result.duration for result in results),
+    }
+    path.write_text(json.dumps(report, indent=2) + '\n')
+
+
+def _write_junit_report(results: List[_ValidationResult], path: Path) -> None:
+    from xml.etree import ElementTree
+
+    suite = ElementTree.Element(
+        'testsuite',
+        name='ros2 nodl validate',
+        tests=str(len(results)),
+        failures=str(sum(result.error is not None for result in results)),
+        time=f'{sum(result.duration for result in results):.6f}',
+    )
+    for result in results:
+        case = ElementTree.SubElement(
+            suite,
+            'testcase',
+            classname='nodl.validate',
+            name=str(result.path),
+            time=f'{result.duration:.6f}',
+        )
+        if result.error is not None:
+            failure = ElementTree.SubElement(case, 'failure', message='Failed to parse')
+            failure.text = result.error
+    ElementTree.ElementTree(suite).write(str(path), encoding='utf-8', xml_declaration=True)
+
+
+def _validate_all(paths: List[Path], jobs: int) -> Iterable[_ValidationResult]:
+    if jobs > 1 and len(paths) > 1:
+        return _validate_concurrently(paths, jobs)
+    return map(_validate_file, paths)
+
+
+def _stamp(path: Path) -> Optional[Tuple[int, int]]:
+    """Return what identifies a version of a file, None if it is gone."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+_REPORT_WRITERS = {'json': _write_json_report, 'junit': _write_junit_report}
 
 
 class _ValidateVerb(VerbExtension):
@@ -38,12 +135,39 @@ class _ValidateVerb(VerbExtension):
         ).completer = FilesCompleter(allowednames=[_FILE_EXTENSION], directories=False)
 
         parser.add_argument('-p', '--print', action='store_true', help='Print parsed output.')
+        parser.add_argument(
+            '-j', '--jobs', type=int, default=1, help='Number of files to validate in parallel.'
+        )
+        parser.add_argument(
+            '-k',
+            '--keep-going',
+            action='store_true',
+            help='Validate all files instead of stopping at the first failure.',
+        )
+        parser.add_argument(
+            '--report', type=Path, help='Write a summary with per-file timings to this file.'
+        )
+        parser.add_argument(
+            '--report-format',
+            choices=sorted(_REPORT_WRITERS),
+            default='json',
+            help='Format of the summary written with --report.',
+        )
+        parser.add_argument(
+            '-w',
+            '--watch',
+            action='store_true',
+            help='Keep running and revalidate files whenever they change.',
+        )
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=0.2,
+            help='Seconds between checks for changed files in watch mode.',
+        )
 
     def main(self, args: argparse.Namespace) -> int:
-        if args.files:
-            paths = [Path(filename) for filename in args.files]
-        else:
-            paths = list(Path.cwd().glob('*' + _FILE_EXTENSION))
+        paths = self._find_paths(args)
         if not paths:
             print('No files to validate', file=sys.stderr)
             return 1
@@ -53,17 +177,81 @@ class _ValidateVerb(VerbExtension):
                 print(f'{path.name} is not a file')
                 return 1
 
-            print(f'Validating {path}...')
-            try:
-                nodes = nodl.parse(path=path)
-            except nodl.errors.NoDLError as e:
-                print(f'Failed to parse {path}', file=sys.stderr)
-                print(e, file=sys.stderr)
-                return 1
-            print('  Success')
-            if args.print:
-                for node in nodes:
-                    pprint.pprint(node, width=shutil.get_terminal_size()[0])
+        results = []
+        for result in _validate_all(paths, args.jobs):
+            results.append(result)
+            self._print_result(result, args)
+            if result.error is not None and not (args.keep_going or args.watch):
+                break
+
+        if args.report:
+            _REPORT_WRITERS[args.report_format](results, args.report)
 
+        if args.watch:
+            return self._watch(paths, results, args)
+
+        failures = sum(result.error is not None for result in results)
+        if failures:
+            print(f'{failures} of {len(paths)} files failed validation', file=sys.stderr)
+            return 1
         print('All files validated')
         return 0
+
+    def _find_paths(self, args: argparse.Namespace) -> List[Path]:
+        if args.files:
+            return [Path(filename) for filename in args.files]
+        return sorted(Path.cwd().glob('*' + _FILE_EXTENSION))
+
+    def _print_result(self, result: _ValidationResult, args: argparse.Namespace) -> None:
+        print(f'Validating {result.path}...')
+        if result.error is not None:
+            print(f'Failed to parse {result.path}', file=sys.stderr)
+            print(result.error, file=sys.stderr)
+            return
+        print('  Success')
+        if args.print:
+            for node in result.nodes:
+                pprint.pprint(node, width=shutil.get_terminal_size()[0])
+
+    def _watch(
+        self, paths: List[Path], results: List[_ValidationResult], args: argparse.Namespace
+    ) -> int:
+        """Poll the files for changes and revalidate the ones that changed until interrupted.
+
+        When no files were given on the command line, new files showing up in the current
+        directory are picked up as well.
+        """
+        stamps: Dict[Path, Optional[Tuple[int, int]]] = {path: _stamp(path) for path in paths}
+        failed = {result.path for result in results if result.error is not None}
+        print(f'Watching {len(stamps)} file(s) for changes, press Ctrl+C to stop')
+        try:
+            while True:
+                time.sleep(args.interval)
+                if not args.files:
+                    for path in self._find_paths(args):
+                        stamps.setdefault(path, None)
+
+                changed = []
+                for path, stamp in list(stamps.items()):
+                    new_stamp = _stamp(path)
+                    if new_stamp == stamp:
+                        continue
+                    if new_stamp is None:
+                        print(f'{path} was removed')
+                        failed.discard(path)
+                        if not args.files:
+                            del stamps[path]
+                            continue
+                    else:
+                        changed.append(path)
+                    stamps[path] = new_stamp
+
+                for result in _validate_all(changed, args.jobs):
+                    self._print_result(result, args)
+                    if result.error is None:
+                        failed.discard(result.path)
+                    else:
+                        failed.add(result.path)
+        except KeyboardInterrupt:
+            pass
+        return 1 if failed else 0
@@ -34,6 +34,11 @@ setup(
             'nodl = ros2nodl._command._nodl:_NoDLCommand',
         ],
         'ros2nodl.verb': [
+            'check = ros2nodl._verb._check:_CheckVerb',
+            'compile = ros2nodl._verb._compile:_CompileVerb',
+            'diff = ros2nodl._verb._diff:_DiffVerb',
+            'graph = ros2nodl._verb._graph:_GraphVerb',
+            'query = ros2nodl._verb._query:_QueryVerb',
             'show = ros2nodl._verb._show:_ShowVerb',
             'validate = ros2nodl._verb._validate:_ValidateVerb'
         ]
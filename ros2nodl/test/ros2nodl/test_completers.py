@@ -0,0 +1,58 @@
+# Copyright 2020 Canonical, Ltd.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+from pathlib import Path
+
+from ament_index_python import PackageNotFoundError
+import nodl
+import pytest
+from ros2nodl._completers import NoDLExecutableNameCompleter
+
+
+@pytest.fixture
+def package_cache_get(mocker):
+    nodes = {
+        node.executable: node for node in nodl.parse(Path(__file__).parent / 'test.nodl.xml')
+    }
+    return mocker.patch('nodl._index.package_cache.get', return_value=nodes)
+
+
+@pytest.fixture
+def completer():
+    return NoDLExecutableNameCompleter(package_name_key='package_name')
+
+
+def test_completes_nodl_executables(completer, package_cache_get):
+    parsed_args = argparse.Namespace(package_name='foo', executables=[])
+
+    assert completer(prefix='', parsed_args=parsed_args) == ['first', 'second']
+    assert completer(prefix='s', parsed_args=parsed_args) == ['second']
+    package_cache_get.assert_called_with('foo')
+
+
+def test_skips_given_executables(completer, package_cache_get):
+    parsed_args = argparse.Namespace(package_name='foo', executables=['first'])
+
+    assert completer(prefix='', parsed_args=parsed_args) == ['second']
+
+
+def test_no_package(completer, package_cache_get):
+    assert completer(prefix='', parsed_args=argparse.Namespace(package_name=None)) == []
+
+    package_cache_get.side_effect = PackageNotFoundError()
+    assert completer(prefix='', parsed_args=argparse.Namespace(package_name='foo')) == []
+
+    package_cache_get.side_effect = nodl.errors.NoNoDLFilesError('foo')
+    assert completer(prefix='', parsed_args=argparse.Namespace(package_name='foo')) == []
@@ -0,0 +1,81 @@
+# Copyright 2020 Canonical, Ltd.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+import subprocess
+import sys
+
+# Modules only needed once a verb actually runs, loading them when building the command line
+# parser would slow down every invocation, including --help and tab completion
+_DEFERRED_MODULES = [
+    'ament_index_python',
+    'argcomplete',
+    'concurrent.futures',
+    'distutils',
+    'lxml',
+    'ros2pkg',
+    'ros2run',
+    'yaml',
+]
+
+# Generous upper bound for importing all verbs on top of ros2cli itself
+_IMPORT_TIME_BUDGET = 0.15
+
+_MEASURE = '''
+import json
+import sys
+import time
+
+import ros2cli.verb
+
+before = set(sys.modules)
+start = time.perf_counter()
+import ros2nodl._command._nodl
+import ros2nodl._verb._check
+import ros2nodl._verb._compile
+import ros2nodl._verb._diff
+import ros2nodl._verb._graph
+import ros2nodl._verb._query
+import ros2nodl._verb._show
+import ros2nodl._verb._validate
+duration = time.perf_counter() - start
+print(json.dumps({'duration': duration, 'modules': sorted(set(sys.modules) - before)}))
+'''
+
+
+def _measure_import():
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    output = subprocess.run(
+        [sys.executable, '-c', _MEASURE], env=env, check=True, stdout=subprocess.PIPE
+    ).stdout
+    return json.loads(output)
+
+
+def test_verbs_defer_heavy_imports():
+    modules = _measure_import()['modules']
+
+    imported = [
+        module
+        for module in modules
+        for deferred in _DEFERRED_MODULES
+        if module == deferred or module.startswith(deferred + '.')
+    ]
+    assert not imported
+
+
+def test_verbs_import_time_budget():
+    # Keep the best of a few runs to be robust against a busy machine
+    duration = min(_measure_import()['duration'] for _ in range(3))
+    assert duration < _IMPORT_TIME_BUDGET
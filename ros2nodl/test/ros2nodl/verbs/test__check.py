@@ -0,0 +1,124 @@
+# Copyright 2020 Canonical, Ltd.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+import json
+
+import pytest
+from ros2nodl._verb import _check
+
+
+@pytest.fixture
+def verb() -> _check._CheckVerb:
+    return _check._CheckVerb()
+
+
+@pytest.fixture
+def parser(verb) -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser()
+
+    verb.add_arguments(parser, None)
+    return parser
+
+
+@pytest.fixture(autouse=True)
+def ros_home(monkeypatch, tmp_path):
+    # Keep the parse cache out of the home directory
+    monkeypatch.setenv('ROS_HOME', str(tmp_path / 'ros_home'))
+
+
+def write_snapshot(path, **node_1_endpoints):
+    path.write_text(
+        json.dumps(
+            {
+                'nodes': [
+                    {
+                        'name': '/node_1',
+                        'publishers': [{'name': '/chatter', 'type': 'std_msgs/msg/String'}],
+                        **node_1_endpoints,
+                    }
+                ]
+            }
+        )
+    )
+    return path
+
+
+def test_conforming(capsys, parser, test_nodl, tmp_path, verb):
+    snapshot = write_snapshot(tmp_path / 'graph.json')
+    args = parser.parse_args(['--snapshot', str(snapshot), str(test_nodl)])
+
+    assert not verb.main(args=args)
+    assert not capsys.readouterr().out
+
+
+def test_discrepancies(capsys, parser, test_nodl, tmp_path, verb):
+    snapshot = write_snapshot(
+        tmp_path / 'graph.json',
+        publishers=[{'name': '/other', 'type': 'std_msgs/msg/String'}],
+        subscriptions=[{'name': '/ignored', 'type': 'std_msgs/msg/String'}],
+    )
+    args = parser.parse_args(
+        ['--snapshot', str(snapshot), str(test_nodl), '--ignore', '/ignore*']
+    )
+
+    assert verb.main(args=args) == 1
+    assert capsys.readouterr().out.splitlines() == [
+        '/node_1: undeclared topic publisher /other [std_msgs/msg/String]',
+        '/node_1: unused topic publisher /chatter [std_msgs/msg/String]',
+    ]
+
+
+def test_json(capsys, parser, test_nodl, tmp_path, verb):
+    snapshot = tmp_path / 'graph.json'
+    running_nodes = [{'name': '/unknown'}, {'name': '/stranger'}, {'name': '/launch_ros_1'}]
+    snapshot.write_text(json.dumps({'nodes': running_nodes}))
+    args = parser.parse_args(
+        [
+            '--snapshot',
+            str(snapshot),
+            str(test_nodl),
+            '--format',
+            'json',
+            '--ignore-node',
+            '/stranger',
+        ]
+    )
+
+    # Unknown nodes are reported without failing the check
+    assert not verb.main(args=args)
+    assert json.loads(capsys.readouterr().out) == {
+        'undeclared': [],
+        'unused': [],
+        'unknown_nodes': ['/unknown'],
+        'ambiguous_nodes': [],
+    }
+
+
+def test_workspace(mocker, parser, test_nodl, tmp_path, verb):
+    workspace = mocker.patch('ros2nodl._verb._check.nodl.WorkspaceIndex').return_value
+    workspace.packages = {'foo': _check.nodl.parse(test_nodl)}
+    workspace.errors = {}
+    snapshot = write_snapshot(tmp_path / 'graph.json')
+
+    assert not verb.main(args=parser.parse_args(['--snapshot', str(snapshot)]))
+
+
+def test_invalid_snapshot(parser, test_nodl, tmp_path, verb):
+    snapshot = tmp_path / 'graph.json'
+    args = parser.parse_args(['--snapshot', str(snapshot), str(test_nodl)])
+    assert verb.main(args=args) == 2
+
+    snapshot.write_text('not json')
+    assert verb.main(args=args) == 2
@@ -0,0 +1,83 @@
+# Copyright 2020 Canonical, Ltd.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+import shutil
+
+import nodl
+import nodl._snapshot
+import pytest
+
+from ros2nodl._verb import _compile
+
+
+@pytest.fixture
+def verb() -> _compile._CompileVerb:
+    return _compile._CompileVerb()
+
+
+@pytest.fixture
+def parser(verb):
+    parser = argparse.ArgumentParser()
+
+    verb.add_arguments(parser)
+    return parser
+
+
+def test_compiles_next_to_file(parser, test_nodl, tmp_path, verb):
+    nodl_file = tmp_path / 'test.nodl.xml'
+    shutil.copy(test_nodl, nodl_file)
+
+    args = parser.parse_args([str(nodl_file)])
+    assert not verb.main(args=args)
+    assert nodl._snapshot.load(tmp_path / 'test.nodl.bin') == nodl.parse(test_nodl)
+
+
+def test_compiles_to_output_directory(parser, test_nodl, tmp_path, verb):
+    args = parser.parse_args([str(test_nodl), '-o', str(tmp_path)])
+    assert not verb.main(args=args)
+    assert (tmp_path / 'test.nodl.bin').is_file()
+
+
+def test_finds_all(mocker, parser, sample_package, verb):
+    mocker.patch('ros2nodl._verb._compile.Path.cwd', return_value=sample_package)
+    mock = mocker.patch('ros2nodl._verb._compile.nodl.parse', return_value=[])
+
+    args = parser.parse_args([])
+    assert not verb.main(args=args)
+    assert len(mock.mock_calls) == 2
+
+
+def test_fails_no_file(mocker, parser, tmp_path, verb):
+    mocker.patch('ros2nodl._verb._compile.Path.cwd', return_value=tmp_path)
+
+    args = parser.parse_args([])
+    assert verb.main(args=args)
+
+
+def test_fails_invalid_nodl(mocker, parser, test_nodl, tmp_path, verb):
+    mocker.patch(
+        'ros2nodl._verb._compile.nodl.parse',
+        side_effect=nodl.errors.InvalidNoDLDocumentError(mocker.MagicMock()),
+    )
+    args = parser.parse_args([str(test_nodl), '-o', str(tmp_path)])
+
+    assert verb.main(args=args)
+    assert not list(tmp_path.iterdir())
+
+
+def test_fails_unwritable_output(parser, test_nodl, tmp_path, verb):
+    args = parser.parse_args([str(test_nodl), '-o', str(tmp_path / 'missing')])
+
+    assert verb.main(args=args)
@@ -0,0 +1,93 @@
+# Copyright 2020 Canonical, Ltd.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+import json
+
+import pytest
+from ros2nodl._verb import _diff
+
+
+@pytest.fixture
+def verb() -> _diff._DiffVerb:
+    return _diff._DiffVerb()
+
+
+@pytest.fixture
+def parser(verb) -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser()
+
+    verb.add_arguments(parser, None)
+    return parser
+
+
+@pytest.fixture(autouse=True)
+def ros_home(monkeypatch, tmp_path):
+    # Keep the parse cache out of the home directory
+    monkeypatch.setenv('ROS_HOME', str(tmp_path / 'ros_home'))
+
+
+@pytest.fixture
+def changed_nodl(test_nodl, tmp_path):
+    changed = tmp_path / 'changed.nodl.xml'
+    changed.write_text(
+        test_nodl.read_text()
+        .replace('name="verbose" type="bool"', 'name="verbose" type="int"')
+        .replace('role="subscription"', 'role="both"')
+        .replace('<parameter name="rate" type="int" />', '')
+    )
+    return changed
+
+
+def test_identical(capsys, parser, test_nodl, verb):
+    args = parser.parse_args([str(test_nodl), str(test_nodl)])
+    assert not verb.main(args=args)
+    assert not capsys.readouterr().out
+
+
+def test_text(capsys, changed_nodl, parser, test_nodl, verb):
+    args = parser.parse_args([str(test_nodl), str(changed_nodl)])
+    assert verb.main(args=args) == 1
+
+    assert capsys.readouterr().out.splitlines() == [
+        '~ first (node_1)',
+        '    ~ parameter verbose: type bool -> int',
+        '~ second (node_2)',
+        '    - parameter rate int',
+        '    ~ topic /foo/bar: role subscription -> both',
+    ]
+
+
+def test_json(capsys, changed_nodl, parser, test_nodl, verb):
+    args = parser.parse_args([str(test_nodl), str(changed_nodl), '--format', 'json'])
+    assert verb.main(args=args) == 1
+
+    changes = json.loads(capsys.readouterr().out)
+    assert [change['executable'] for change in changes] == ['first', 'second']
+    assert changes[1]['interfaces'][1] == {
+        'kind': 'topic',
+        'name': '/foo/bar',
+        'change': 'changed',
+        'fields': ['role'],
+        'old': {'name': '/foo/bar', 'type': 'std_msgs/msg/String', 'role': 'subscription'},
+        'new': {'name': '/foo/bar', 'type': 'std_msgs/msg/String', 'role': 'both'},
+    }
+
+
+def test_fails_on_missing_source(capsys, mocker, parser, test_nodl, verb):
+    from ament_index_python import PackageNotFoundError
+
+    mocker.patch('ros2nodl._verb._diff.nodl.load_nodes', side_effect=PackageNotFoundError())
+    args = parser.parse_args([str(test_nodl), 'missing'])
+    assert verb.main(args=args) == 2
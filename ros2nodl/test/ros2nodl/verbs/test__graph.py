@@ -0,0 +1,90 @@
+# Copyright 2020 Canonical, Ltd.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+import json
+
+import nodl
+import pytest
+from ros2nodl._verb import _graph
+
+
+@pytest.fixture
+def verb() -> _graph._GraphVerb:
+    return _graph._GraphVerb()
+
+
+@pytest.fixture
+def parser(verb) -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser()
+
+    verb.add_arguments(parser, None)
+    return parser
+
+
+@pytest.fixture
+def workspace(mocker, test_nodl):
+    workspace = mocker.patch('ros2nodl._verb._graph.nodl.WorkspaceIndex').return_value
+    nodes = nodl.parse(test_nodl)
+    publisher = nodl.types.Node(
+        name='publisher',
+        executable='publisher',
+        topics=[
+            nodl.types.Topic(
+                name='/foo/bar',
+                message_type='std_msgs/msg/String',
+                role=nodl.types.PubSubRole.PUBLISHER,
+            )
+        ],
+    )
+    workspace.packages = {'foo': nodes, 'bar': [publisher]}
+    workspace.errors = {}
+    return workspace
+
+
+def test_dot_to_stdout(capsys, parser, verb, workspace):
+    args = parser.parse_args([])
+    assert not verb.main(args=args)
+
+    output = capsys.readouterr().out
+    assert output.startswith('digraph nodl {')
+    assert '"bar/publisher" -> "foo/second"' in output
+
+
+def test_json_to_file(parser, tmp_path, verb, workspace):
+    output = tmp_path / 'graph.json'
+    args = parser.parse_args(['--format', 'json', '--output', str(output)])
+    assert not verb.main(args=args)
+
+    graph = json.loads(output.read_text())
+    assert [(edge['source'], edge['target']) for edge in graph['edges']] == [
+        ('bar/publisher', 'foo/second')
+    ]
+
+
+def test_graphml(capsys, parser, verb, workspace):
+    args = parser.parse_args(['--format', 'graphml'])
+    assert not verb.main(args=args)
+    assert '<graphml' in capsys.readouterr().out
+
+
+def test_packages(capsys, parser, verb, workspace):
+    args = parser.parse_args(['--format', 'json', '--packages', 'foo', 'missing'])
+    assert verb.main(args=args)
+
+    captured = capsys.readouterr()
+    graph = json.loads(captured.out)
+    assert {node['package'] for node in graph['nodes']} == {'foo'}
+    assert graph['edges'] == []
+    assert 'missing' in captured.err
@@ -0,0 +1,87 @@
+# Copyright 2020 Canonical, Ltd.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+
+import nodl
+import pytest
+from ros2nodl._verb import _query
+
+
+@pytest.fixture
+def verb() -> _query._QueryVerb:
+    return _query._QueryVerb()
+
+
+@pytest.fixture
+def parser(verb) -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser()
+
+    verb.add_arguments(parser, None)
+    return parser
+
+
+@pytest.fixture
+def workspace(mocker, test_nodl):
+    workspace = mocker.patch('ros2nodl._verb._query.nodl.WorkspaceIndex').return_value
+    workspace.packages = {'foo': nodl.parse(test_nodl)}
+    workspace.errors = {}
+    return workspace
+
+
+def test_query_by_name(capsys, parser, verb, workspace):
+    args = parser.parse_args(['--name', 'chatter'])
+    assert not verb.main(args=args)
+
+    assert capsys.readouterr().out.splitlines() == [
+        'foo/first node_1 topic chatter std_msgs/msg/String publisher'
+    ]
+
+
+def test_query_by_type_and_role(capsys, parser, verb, workspace):
+    args = parser.parse_args(['--type', 'std_srvs/srv/*', '--role', 'server'])
+    assert not verb.main(args=args)
+
+    assert capsys.readouterr().out.splitlines() == [
+        'foo/second node_2 service /example_service_2 std_srvs/srv/Empty server'
+    ]
+
+
+def test_query_both_role_matches(capsys, parser, verb, workspace):
+    args = parser.parse_args(['--kind', 'action', '--role', 'client'])
+    assert not verb.main(args=args)
+
+    assert capsys.readouterr().out.splitlines() == [
+        'foo/second node_2 action /example_action example_interfaces/action/Fibonacci both'
+    ]
+
+
+def test_query_parameters(capsys, parser, verb, workspace):
+    args = parser.parse_args(['--kind', 'parameter', '--package', 'f*'])
+    assert not verb.main(args=args)
+
+    assert capsys.readouterr().out.splitlines() == [
+        'foo/first node_1 parameter verbose bool',
+        'foo/second node_2 parameter rate int',
+    ]
+
+
+def test_query_no_match(capsys, parser, verb, workspace):
+    workspace.errors = {'broken': nodl.errors.NoNoDLFilesError('broken')}
+    args = parser.parse_args(['--name', 'missing'])
+    assert verb.main(args=args)
+
+    captured = capsys.readouterr()
+    assert not captured.out
+    assert 'broken' in captured.err
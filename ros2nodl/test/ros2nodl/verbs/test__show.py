@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import argparse
+import json
 from pathlib import Path
 from typing import List
 
@@ -20,6 +21,7 @@ from ament_index_python import PackageNotFoundError
 import nodl
 import pytest
 from ros2nodl._verb import _show
+import yaml
 
 
 @pytest.fixture
@@ -84,3 +86,103 @@ def test_show_parsed_fail_on_duplicate(mocker, mock_nodl, parser, verb):
     mock_nodl.side_effect = nodl.errors.DuplicateNodeError(mocker.MagicMock())
     args = parser.parse_args(['foo'])
     assert verb.main(args=args)
+
+
+def test_pretty_is_default(capsys, mock_nodl, nodl_fixture, parser, verb):
+    args = parser.parse_args(['foo'])
+    assert not verb.main(args=args)
+    assert capsys.readouterr().out.startswith(str(nodl_fixture[0]))
+
+
+def test_show_ndjson(capsys, mock_nodl, nodl_fixture, parser, verb):
+    args = parser.parse_args(['foo', '--format', 'ndjson'])
+    assert not verb.main(args=args)
+
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert len(records) == len(nodl_fixture)
+    for record, node in zip(records, nodl_fixture):
+        assert list(record) == [
+            'package',
+            'name',
+            'executable',
+            'actions',
+            'parameters',
+            'services',
+            'topics',
+        ]
+        assert record['package'] == 'foo'
+        assert record['name'] == node.name
+        assert [topic['name'] for topic in record['topics']] == list(node.topics)
+        assert all(set(topic) == {'name', 'type', 'role'} for topic in record['topics'])
+        assert all(set(parameter) == {'name', 'type'} for parameter in record['parameters'])
+
+
+def test_show_json(capsys, mock_nodl, nodl_fixture, parser, verb):
+    args = parser.parse_args(['foo', '--format', 'json'])
+    assert not verb.main(args=args)
+
+    records = json.loads(capsys.readouterr().out)
+    assert [record['name'] for record in records] == [node.name for node in nodl_fixture]
+
+
+def test_show_json_empty(capsys, mock_nodl, parser, verb):
+    mock_nodl.return_value = []
+    args = parser.parse_args(['foo', '--format', 'json'])
+    assert not verb.main(args=args)
+
+    assert json.loads(capsys.readouterr().out) == []
+
+
+def test_show_yaml(capsys, mock_nodl, nodl_fixture, parser, verb):
+    args = parser.parse_args(['foo', '--format', 'yaml'])
+    assert not verb.main(args=args)
+
+    records = list(yaml.safe_load_all(capsys.readouterr().out))
+    assert [record['name'] for record in records] == [node.name for node in nodl_fixture]
+    assert records == [_show._node_record(node, 'foo') for node in nodl_fixture]
+
+
+def test_requires_one_package_selection(mock_nodl, parser, verb):
+    assert verb.main(args=parser.parse_args([]))
+    assert verb.main(args=parser.parse_args(['foo', '--all']))
+    assert verb.main(args=parser.parse_args(['foo', '--packages', 'bar']))
+    assert verb.main(args=parser.parse_args(['--all', '--packages', 'bar']))
+
+
+def test_show_packages_grouped_in_order(capsys, mock_nodl, nodl_fixture, parser, verb):
+    args = parser.parse_args(['--packages', 'foo', 'bar', 'baz', '--format', 'ndjson', '-j', '3'])
+    assert not verb.main(args=args)
+
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [record['package'] for record in records] == [
+        package for package in ('foo', 'bar', 'baz') for _ in nodl_fixture
+    ]
+
+
+def test_show_packages_continues_on_error(capsys, mocker, mock_nodl, nodl_fixture, parser, verb):
+    def get_nodes(*, package_name, jobs):
+        if package_name == 'missing':
+            raise PackageNotFoundError(package_name)
+        return nodl_fixture
+
+    mock_nodl.side_effect = get_nodes
+    args = parser.parse_args(['--packages', 'foo', 'missing', 'bar'])
+    assert verb.main(args=args)
+
+    captured = capsys.readouterr()
+    assert 'missing' in captured.err
+    assert '=== foo ===' in captured.out
+    assert '=== bar ===' in captured.out
+
+
+def test_show_all(capsys, mocker, nodl_fixture, parser, verb):
+    index = mocker.patch('ros2nodl._verb._show.nodl.WorkspaceIndex').return_value
+    index.packages = {'foo': nodl_fixture, 'bar': nodl_fixture[:1]}
+    index.errors = {'broken': nodl.errors.NoNoDLFilesError('broken')}
+    args = parser.parse_args(['--all', '--format', 'ndjson'])
+
+    assert verb.main(args=args)
+    captured = capsys.readouterr()
+    records = [json.loads(line) for line in captured.out.splitlines()]
+    assert [record['package'] for record in records] == ['bar'] + ['foo'] * len(nodl_fixture)
+    assert 'broken' in captured.err
@@ -13,6 +13,8 @@
 # limitations under the License.
 
 import argparse
+import json
+from xml.etree import ElementTree
 
 import nodl
 import pytest
@@ -87,3 +89,117 @@ def test_pprints_to_console(mocker, parser, test_nodl, verb):
 
     verb.main(args=args)
     assert len(print_mock.mock_calls) == 2
+
+
+@pytest.fixture
+def invalid_nodl(tmp_path):
+    invalid = tmp_path / 'invalid.nodl.xml'
+    invalid.write_text('<interface version="1"><node/></interface>')
+    return invalid
+
+
+def test_stops_at_first_failure(mocker, parser, invalid_nodl, test_nodl, verb):
+    parse_mock = mocker.patch('ros2nodl._verb._validate.nodl.parse', wraps=nodl.parse)
+    args = parser.parse_args([str(invalid_nodl), str(test_nodl)])
+
+    assert verb.main(args=args)
+    assert len(parse_mock.mock_calls) == 1
+
+
+def test_keep_going_validates_all(mocker, parser, invalid_nodl, test_nodl, verb):
+    parse_mock = mocker.patch('ros2nodl._verb._validate.nodl.parse', wraps=nodl.parse)
+    args = parser.parse_args([str(invalid_nodl), str(test_nodl), '--keep-going'])
+
+    assert verb.main(args=args)
+    assert len(parse_mock.mock_calls) == 2
+
+
+def test_jobs_prints_in_input_order(capsys, parser, invalid_nodl, test_nodl, verb):
+    paths = [str(test_nodl), str(invalid_nodl)] * 4
+    args = parser.parse_args([*paths, '--jobs', '4', '--keep-going'])
+
+    assert verb.main(args=args)
+    lines = [line for line in capsys.readouterr().out.splitlines() if 'Validating' in line]
+    assert lines == [f'Validating {path}...' for path in paths]
+
+
+def test_writes_json_report(parser, invalid_nodl, test_nodl, tmp_path, verb):
+    report = tmp_path / 'report.json'
+    args = parser.parse_args(
+        [str(test_nodl), str(invalid_nodl), '-k', '--report', str(report)]
+    )
+
+    assert verb.main(args=args)
+    content = json.loads(report.read_text())
+    assert content['failures'] == 1
+    assert [entry['path'] for entry in content['files']] == [str(test_nodl), str(invalid_nodl)]
+    assert [entry['success'] for entry in content['files']] == [True, False]
+    assert content['files'][1]['error']
+    assert all(entry['duration'] >= 0 for entry in content['files'])
+
+
+def test_writes_junit_report(parser, invalid_nodl, test_nodl, tmp_path, verb):
+    report = tmp_path / 'report.xml'
+    args = parser.parse_args(
+        [
+            str(test_nodl),
+            str(invalid_nodl),
+            '-k',
+            '--report',
+            str(report),
+            '--report-format',
+            'junit',
+        ]
+    )
+
+    assert verb.main(args=args)
+    suite = ElementTree.parse(str(report)).getroot()
+    assert suite.tag == 'testsuite'
+    assert suite.get('tests') == '2'
+    assert suite.get('failures') == '1'
+    cases = suite.findall('testcase')
+    assert [case.get('name') for case in cases] == [str(test_nodl), str(invalid_nodl)]
+    assert cases[0].find('failure') is None
+    assert cases[1].find('failure') is not None
+
+
+def test_watch_revalidates_changed_files(mocker, parser, invalid_nodl, test_nodl, tmp_path, verb):
+    watched = tmp_path / 'watched.nodl.xml'
+    watched.write_text(test_nodl.read_text())
+    parse_mock = mocker.patch('ros2nodl._verb._validate.nodl.parse', wraps=nodl.parse)
+
+    def edit(_):
+        if len(sleep_mock.mock_calls) == 2:
+            watched.write_text(invalid_nodl.read_text())
+        elif len(sleep_mock.mock_calls) == 4:
+            raise KeyboardInterrupt
+
+    sleep_mock = mocker.patch('ros2nodl._verb._validate.time.sleep', side_effect=edit)
+    args = parser.parse_args([str(watched), str(test_nodl), '--watch'])
+
+    assert verb.main(args=args)
+    assert [call.kwargs['path'] for call in parse_mock.mock_calls] == [
+        watched,
+        test_nodl,
+        watched,
+    ]
+
+
+def test_watch_picks_up_new_files(mocker, parser, test_nodl, tmp_path, verb):
+    mocker.patch('ros2nodl._verb._validate.Path.cwd', return_value=tmp_path)
+    first = tmp_path / 'first.nodl.xml'
+    first.write_text(test_nodl.read_text())
+    second = tmp_path / 'second.nodl.xml'
+    parse_mock = mocker.patch('ros2nodl._verb._validate.nodl.parse', wraps=nodl.parse)
+
+    def add_file(_):
+        if len(sleep_mock.mock_calls) == 1:
+            second.write_text(test_nodl.read_text())
+        else:
+            raise KeyboardInterrupt
+
+    sleep_mock = mocker.patch('ros2nodl._verb._validate.time.sleep', side_effect=add_file)
+    args = parser.parse_args(['--watch'])
+
+    assert not verb.main(args=args)
+    assert [call.kwargs['path'] for call in parse_mock.mock_calls] == [first, second]